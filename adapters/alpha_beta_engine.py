@@ -0,0 +1,413 @@
+"""Iterative-deepening alpha-beta search engine.
+
+Plays on the domain model directly: moves come from MovementService and are
+tried with Game.make_move/unmake_move, so the searched game is left exactly
+as it was found.
+"""
+
+import time
+from collections import namedtuple
+
+from domain.piece import Color, PieceType
+from domain.services import MovementService
+from ports.chess_engine import ChessEnginePort
+
+PIECE_VALUES = {
+    PieceType.PAWN: 100,
+    PieceType.KNIGHT: 320,
+    PieceType.BISHOP: 330,
+    PieceType.ROOK: 500,
+    PieceType.QUEEN: 900,
+    PieceType.KING: 0,
+}
+
+# Piece-square tables from White's point of view, a8..h8 first, so a white
+# piece on (row, col) uses index row * 8 + col and a black one the mirrored
+# row. Values from the Chess Programming Wiki "simplified evaluation function".
+PIECE_SQUARE_TABLES = {
+    PieceType.PAWN: (
+        0, 0, 0, 0, 0, 0, 0, 0,
+        50, 50, 50, 50, 50, 50, 50, 50,
+        10, 10, 20, 30, 30, 20, 10, 10,
+        5, 5, 10, 25, 25, 10, 5, 5,
+        0, 0, 0, 20, 20, 0, 0, 0,
+        5, -5, -10, 0, 0, -10, -5, 5,
+        5, 10, 10, -20, -20, 10, 10, 5,
+        0, 0, 0, 0, 0, 0, 0, 0,
+    ),
+    PieceType.KNIGHT: (
+        -50, -40, -30, -30, -30, -30, -40, -50,
+        -40, -20, 0, 0, 0, 0, -20, -40,
+        -30, 0, 10, 15, 15, 10, 0, -30,
+        -30, 5, 15, 20, 20, 15, 5, -30,
+        -30, 0, 15, 20, 20, 15, 0, -30,
+        -30, 5, 10, 15, 15, 10, 5, -30,
+        -40, -20, 0, 5, 5, 0, -20, -40,
+        -50, -40, -30, -30, -30, -30, -40, -50,
+    ),
+    PieceType.BISHOP: (
+        -20, -10, -10, -10, -10, -10, -10, -20,
+        -10, 0, 0, 0, 0, 0, 0, -10,
+        -10, 0, 5, 10, 10, 5, 0, -10,
+        -10, 5, 5, 10, 10, 5, 5, -10,
+        -10, 0, 10, 10, 10, 10, 0, -10,
+        -10, 10, 10, 10, 10, 10, 10, -10,
+        -10, 5, 0, 0, 0, 0, 5, -10,
+        -20, -10, -10, -10, -10, -10, -10, -20,
+    ),
+    PieceType.ROOK: (
+        0, 0, 0, 0, 0, 0, 0, 0,
+        5, 10, 10, 10, 10, 10, 10, 5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        0, 0, 0, 5, 5, 0, 0, 0,
+    ),
+    PieceType.QUEEN: (
+        -20, -10, -10, -5, -5, -10, -10, -20,
+        -10, 0, 0, 0, 0, 0, 0, -10,
+        -10, 0, 5, 5, 5, 5, 0, -10,
+        -5, 0, 5, 5, 5, 5, 0, -5,
+        0, 0, 5, 5, 5, 5, 0, -5,
+        -10, 5, 5, 5, 5, 5, 0, -10,
+        -10, 0, 5, 0, 0, 0, 0, -10,
+        -20, -10, -10, -5, -5, -10, -10, -20,
+    ),
+    PieceType.KING: (
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -20, -30, -30, -40, -40, -30, -30, -20,
+        -10, -20, -20, -20, -20, -20, -20, -10,
+        20, 20, 0, 0, 0, 0, 20, 20,
+        20, 30, 10, 0, 0, 10, 30, 20,
+    ),
+}
+
+MATE_SCORE = 100000
+# Scores beyond this are mates; they are stored relative to the node in the
+# transposition table so they stay correct at any ply.
+MATE_THRESHOLD = MATE_SCORE - 1000
+INFINITY = MATE_SCORE + 1
+
+# Positional slack allowed on top of a capture's material gain before the
+# capture is pruned from the quiescence search.
+DELTA_MARGIN = 200
+
+EXACT, LOWER_BOUND, UPPER_BOUND = 0, 1, 2
+# How often (in nodes) the clock is looked at.
+TIME_CHECK_INTERVAL = 256
+
+# What a search produced: the move to play, its score in centipawns for the
+# side to move, the last fully completed depth, and the nodes visited.
+SearchResult = namedtuple('SearchResult', ['move', 'score', 'depth', 'nodes'])
+
+
+class _SearchAborted(Exception):
+    """Raised inside the search when the time or node budget runs out."""
+
+
+class AlphaBetaEngine(ChessEnginePort):
+    """
+    Negamax alpha-beta with iterative deepening, a transposition table,
+    quiescence search on captures and promotions, and MVV-LVA, killer-move
+    and history-heuristic move ordering.
+
+    The search stops at 'max_depth', after 'time_limit' seconds or after
+    'node_limit' nodes, whichever comes first, and plays the best move of
+    the last completed iteration.
+    """
+    def __init__(self, movement_service=None, max_depth=64, time_limit=1.0,
+                 node_limit=None, tt_size=200000):
+        self.movement_service = movement_service or MovementService()
+        self.max_depth = max_depth
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+        self.tt_size = tt_size
+        # position key -> (depth, score, bound, best move)
+        self.transposition_table = {}
+        self.history = {}
+        self.killers = []
+        self.nodes = 0
+        self._deadline = None
+        self._node_budget = None
+
+    def find_best_move(self, game):
+        return self.search(game).move
+
+    def search(self, game):
+        """
+        Run the iterative-deepening search and return a SearchResult. The
+        move is None when the side to move has no legal move.
+        """
+        self._begin_search(self.time_limit, self.node_limit)
+        root_moves = self.movement_service.generate_legal_moves(game)
+        if not root_moves:
+            return SearchResult(None, self._terminal_score(game, 0), 0, 0)
+
+        best = SearchResult(root_moves[0], 0, 0, 0)
+        for depth in range(1, self.max_depth + 1):
+            try:
+                move, score = self._search_root(game, root_moves, depth)
+            except _SearchAborted:
+                break
+            best = SearchResult(move, score, depth, self.nodes)
+            # Search the best move first in the next iteration.
+            root_moves.remove(move)
+            root_moves.insert(0, move)
+            if abs(score) >= MATE_THRESHOLD or len(root_moves) == 1:
+                break
+        return best._replace(nodes=self.nodes)
+
+    def search_root_moves(self, game, moves, depth, time_limit=None, node_limit=None):
+        """
+        Search only 'moves' (legal moves of the side to move) to 'depth' and
+        return (best move, score, nodes), or None if the time or node budget
+        ran out first. Used to split one root position across processes.
+        """
+        self._begin_search(time_limit, node_limit)
+        try:
+            move, score = self._search_root(game, moves, depth)
+        except _SearchAborted:
+            return None
+        return move, score, self.nodes
+
+    # -------------------------------------------------------------------------
+    #                          INTERNAL / HELPER METHODS
+    # -------------------------------------------------------------------------
+    def _begin_search(self, time_limit, node_limit):
+        self.nodes = 0
+        self.history = {}
+        self.killers = [[None, None] for _ in range(self.max_depth + 1)]
+        if len(self.transposition_table) > self.tt_size:
+            self.transposition_table.clear()
+        self._deadline = time.perf_counter() + time_limit if time_limit else None
+        self._node_budget = node_limit
+
+    def _search_root(self, game, moves, depth):
+        alpha, beta = -INFINITY, INFINITY
+        best_move = moves[0]
+        for move in moves:
+            undo = game.make_move(move)
+            try:
+                score = -self._alpha_beta(game, depth - 1, 1, -beta, -alpha)
+            finally:
+                game.unmake_move(undo)
+            if score > alpha:
+                alpha = score
+                best_move = move
+        self._store(game, depth, alpha, EXACT, best_move, 0)
+        return best_move, alpha
+
+    def _alpha_beta(self, game, depth, ply, alpha, beta):
+        self._count_node()
+        if depth <= 0:
+            return self._quiescence(game, ply, alpha, beta)
+
+        key = game.position_key()
+        entry = self.transposition_table.get(key)
+        tt_move = None
+        if entry is not None:
+            entry_depth, entry_score, bound, tt_move = entry
+            if entry_depth >= depth:
+                score = self._score_from_tt(entry_score, ply)
+                if bound == EXACT:
+                    return score
+                if bound == LOWER_BOUND and score >= beta:
+                    return score
+                if bound == UPPER_BOUND and score <= alpha:
+                    return score
+
+        moves = self.movement_service.generate_legal_moves(game)
+        if not moves:
+            return self._terminal_score(game, ply)
+
+        original_alpha = alpha
+        best_score = -INFINITY
+        best_move = None
+        for move in self._ordered_moves(game, moves, ply, tt_move):
+            undo = game.make_move(move)
+            try:
+                score = -self._alpha_beta(game, depth - 1, ply + 1, -beta, -alpha)
+            finally:
+                game.unmake_move(undo)
+            if score > best_score:
+                best_score = score
+                best_move = move
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                if not self._is_capture(game, move):
+                    self._remember_cutoff(move, depth, ply)
+                break
+
+        if best_score <= original_alpha:
+            bound = UPPER_BOUND
+        elif best_score >= beta:
+            bound = LOWER_BOUND
+        else:
+            bound = EXACT
+        self._store(game, depth, best_score, bound, best_move, ply, key)
+        return best_score
+
+    def _quiescence(self, game, ply, alpha, beta):
+        """
+        Resolve captures and promotions before evaluating, so the score is
+        not taken in the middle of an exchange. In check, every evasion is
+        searched instead.
+        """
+        in_check = self.movement_service.is_in_check(game)
+        if in_check:
+            moves = self.movement_service.generate_legal_moves(game)
+            if not moves:
+                return self._terminal_score(game, ply)
+        else:
+            stand_pat = self._evaluate(game)
+            if stand_pat >= beta:
+                return stand_pat
+            if stand_pat > alpha:
+                alpha = stand_pat
+            # Only pseudo-legal here; illegal ones are skipped after making them.
+            moves = self._noisy_moves(game, stand_pat, alpha)
+
+        mover = game.current_player
+        for move in self._ordered_moves(game, moves, ply, None):
+            undo = game.make_move(move)
+            try:
+                if not in_check and self._king_attacked(game.board, mover):
+                    continue
+                self._count_node()
+                score = -self._quiescence(game, ply + 1, -beta, -alpha)
+            finally:
+                game.unmake_move(undo)
+            if score >= beta:
+                return score
+            if score > alpha:
+                alpha = score
+        return alpha
+
+    def _noisy_moves(self, game, stand_pat, alpha):
+        """
+        Pseudo-legal captures and promotions of the side to move, without
+        captures that cannot raise the score to alpha even if the piece is
+        won (delta pruning) or that give up a more valuable piece on a
+        defended square.
+        """
+        board = game.board
+        mover = game.current_player
+        enemy = Color.BLACK if mover == Color.WHITE else Color.WHITE
+        moves = []
+        for square in board.piece_squares(mover):
+            attacker = board.get_piece(*square)
+            for move in self.movement_service.generate_pseudo_legal_moves(game, square):
+                if move.promotion:
+                    moves.append(move)
+                    continue
+                if not self._is_capture(game, move):
+                    continue
+                victim = board.get_piece(*move.to_square)
+                gain = PIECE_VALUES[victim.piece_type] if victim else PIECE_VALUES[PieceType.PAWN]
+                if stand_pat + gain + DELTA_MARGIN <= alpha:
+                    continue
+                if gain < PIECE_VALUES[attacker.piece_type] and board.is_square_attacked(move.to_square, enemy):
+                    continue
+                moves.append(move)
+        return moves
+
+    def _king_attacked(self, board, color):
+        king = board.find_king(color)
+        enemy = Color.BLACK if color == Color.WHITE else Color.WHITE
+        return king is not None and board.is_square_attacked(king, enemy)
+
+    def _ordered_moves(self, game, moves, ply, tt_move):
+        board = game.board
+        killers = self.killers[ply] if ply < len(self.killers) else (None, None)
+
+        def order(move):
+            if move == tt_move:
+                return 10000000
+            (fr, fc) = move.from_square
+            (tr, tc) = move.to_square
+            attacker = board.get_piece(fr, fc)
+            victim = board.get_piece(tr, tc)
+            score = 0
+            if move.promotion:
+                score += 2000000 + PIECE_VALUES[move.promotion]
+            if victim is not None:
+                # Most valuable victim first, then least valuable attacker.
+                return score + 1000000 + 10 * PIECE_VALUES[victim.piece_type] - PIECE_VALUES[attacker.piece_type]
+            if attacker.piece_type == PieceType.PAWN and fc != tc:
+                return score + 1000000 + 10 * PIECE_VALUES[PieceType.PAWN] - PIECE_VALUES[PieceType.PAWN]
+            if move == killers[0]:
+                return score + 900000
+            if move == killers[1]:
+                return score + 800000
+            return score + self.history.get((move.from_square, move.to_square), 0)
+
+        return sorted(moves, key=order, reverse=True)
+
+    def _is_capture(self, game, move):
+        (fr, fc) = move.from_square
+        (tr, tc) = move.to_square
+        if game.board.get_piece(tr, tc) is not None:
+            return True
+        # En passant: a pawn moving diagonally onto an empty square.
+        return fc != tc and game.board.get_piece(fr, fc).piece_type == PieceType.PAWN
+
+    def _remember_cutoff(self, move, depth, ply):
+        if ply < len(self.killers):
+            killers = self.killers[ply]
+            if killers[0] != move:
+                killers[1] = killers[0]
+                killers[0] = move
+        key = (move.from_square, move.to_square)
+        self.history[key] = self.history.get(key, 0) + depth * depth
+
+    def _evaluate(self, game):
+        """Material plus piece-square score, from the side to move's view."""
+        board = game.board
+        score = 0
+        for color in (Color.WHITE, Color.BLACK):
+            sign = 1 if color == Color.WHITE else -1
+            for (row, col) in board.piece_squares(color):
+                piece = board.get_piece(row, col)
+                index = row * 8 + col if color == Color.WHITE else (7 - row) * 8 + col
+                score += sign * (PIECE_VALUES[piece.piece_type] + PIECE_SQUARE_TABLES[piece.piece_type][index])
+        return score if game.current_player == Color.WHITE else -score
+
+    def _terminal_score(self, game, ply):
+        """Score of a position with no legal move: mated, or stalemate."""
+        if self.movement_service.is_in_check(game):
+            # Prefer the quickest mate and the slowest loss.
+            return -MATE_SCORE + ply
+        return 0
+
+    def _store(self, game, depth, score, bound, move, ply, key=None):
+        if key is None:
+            key = game.position_key()
+        self.transposition_table[key] = (depth, self._score_to_tt(score, ply), bound, move)
+
+    def _score_to_tt(self, score, ply):
+        if score >= MATE_THRESHOLD:
+            return score + ply
+        if score <= -MATE_THRESHOLD:
+            return score - ply
+        return score
+
+    def _score_from_tt(self, score, ply):
+        if score >= MATE_THRESHOLD:
+            return score - ply
+        if score <= -MATE_THRESHOLD:
+            return score + ply
+        return score
+
+    def _count_node(self):
+        self.nodes += 1
+        if self._node_budget is not None and self.nodes >= self._node_budget:
+            raise _SearchAborted()
+        if self._deadline is not None and self.nodes % TIME_CHECK_INTERVAL == 0:
+            if time.perf_counter() >= self._deadline:
+                raise _SearchAborted()
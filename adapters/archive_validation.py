@@ -0,0 +1,178 @@
+"""Parallel validation of PGN archives.
+
+The archive is read one game at a time and cut into chunks of
+'chunk_size' games. Chunks are replayed by a pool of worker processes,
+each with its own MovementService, and the report lines are written in
+archive order. At most 'max_in_flight' chunks are read but not yet
+written, so memory use does not depend on the size of the archive.
+
+Every game gets one JSON line in the report:
+
+    {"game": 1, "white": "...", "black": "...", "result": "1-0", "plies": 7,
+     "checks": 1, "status": "CHECKMATE"}
+
+'status' is the final position's CHECKMATE, STALEMATE, DRAW_FIFTY_MOVES,
+DRAW_REPETITION, DRAW_INSUFFICIENT_MATERIAL (the statuses MovePieceUseCase
+sets), CHECK or ONGOING, or ILLEGAL with 'error' naming the move that
+could not be played (or the bad FEN tag, or whatever else went wrong with
+that one record).
+"""
+
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from adapters.pgn import iter_pgn_records, san_tokens
+from domain.notation import STARTING_FEN, game_from_fen, parse_san
+from domain.services import MovementService
+
+# The MovementService living in each worker process, created by _init_worker.
+_worker_service = None
+
+
+def _init_worker():
+    global _worker_service
+    _worker_service = MovementService()
+
+
+def validate_record(number, tags, movetext, movement_service):
+    """
+    Replay one PGN record and return its report as a dict. Any failure,
+    from a bad FEN tag to an unexpected error, makes this one record
+    ILLEGAL rather than stopping the archive.
+    """
+    report = {
+        'game': number,
+        'white': tags.get('White', '?'),
+        'black': tags.get('Black', '?'),
+        'result': tags.get('Result', '*'),
+        'plies': 0,
+        'checks': 0,
+    }
+    replaying = True
+    try:
+        game = game_from_fen(tags.get('FEN', STARTING_FEN))
+        for san in san_tokens(movetext):
+            move = parse_san(game, san, movement_service)
+            game.move_piece(move.from_square, move.to_square, move.promotion)
+            report['plies'] += 1
+            if movement_service.is_in_check(game):
+                report['checks'] += 1
+        replaying = False
+        status = movement_service.end_status(game)
+        if status is None:
+            status = 'CHECK' if movement_service.is_in_check(game) else 'ONGOING'
+    except Exception as ex:
+        message = str(ex) if isinstance(ex, ValueError) else f"{type(ex).__name__}: {ex}"
+        report['status'] = 'ILLEGAL'
+        report['error'] = f"ply {report['plies'] + 1}: {message}" if replaying else message
+        return report
+    report['status'] = status
+    return report
+
+
+def _validate_chunk(first_number, records):
+    """
+    Worker task: validate a chunk of (tags, movetext) records numbered
+    from 'first_number'. Returns (pid, seconds, status counts, report
+    lines).
+    """
+    start = time.perf_counter()
+    statuses = {}
+    lines = []
+    for number, (tags, movetext) in enumerate(records, first_number):
+        report = validate_record(number, tags, movetext, _worker_service)
+        statuses[report['status']] = statuses.get(report['status'], 0) + 1
+        lines.append(json.dumps(report))
+    return os.getpid(), time.perf_counter() - start, statuses, lines
+
+
+def iter_chunks(stream, chunk_size):
+    """Yield lists of up to 'chunk_size' (tags, movetext) records."""
+    chunk = []
+    for record in iter_pgn_records(stream):
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+class WorkerStats:
+    def __init__(self):
+        self.chunks = 0
+        self.games = 0
+        self.busy = 0.0
+
+
+class PipelineStats:
+    """Totals of a pipeline run, updated as chunks are written."""
+    def __init__(self):
+        self.games = 0
+        self.chunks = 0
+        self.statuses = {}
+        self.workers = {}
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+
+    @property
+    def games_per_second(self):
+        return self.games / self.elapsed if self.elapsed else 0.0
+
+    def add(self, pid, seconds, statuses):
+        games = sum(statuses.values())
+        self.chunks += 1
+        self.games += games
+        for status, count in statuses.items():
+            self.statuses[status] = self.statuses.get(status, 0) + count
+        worker = self.workers.setdefault(pid, WorkerStats())
+        worker.chunks += 1
+        worker.games += games
+        worker.busy += seconds
+        self.elapsed = time.perf_counter() - self.started
+
+
+def validate_archive(stream, output, workers=None, chunk_size=200, max_in_flight=None, progress=None):
+    """
+    Validate every game in the PGN text 'stream' on 'workers' processes
+    (default: one per CPU) and write the JSON report lines to 'output' in
+    archive order. 'progress' is called with the PipelineStats after every
+    chunk written. Returns the PipelineStats.
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 2
+    stats = PipelineStats()
+    chunks = iter_chunks(stream, chunk_size)
+    running = {}     # future -> chunk index
+    finished = {}    # chunk index -> result, waiting for earlier chunks
+    next_index = next_to_write = 0
+    next_number = 1
+    exhausted = False
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+        while True:
+            while not exhausted and len(running) + len(finished) < max_in_flight:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    exhausted = True
+                    break
+                running[executor.submit(_validate_chunk, next_number, chunk)] = next_index
+                next_index += 1
+                next_number += len(chunk)
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                finished[running.pop(future)] = future.result()
+            while next_to_write in finished:
+                pid, seconds, statuses, lines = finished.pop(next_to_write)
+                for line in lines:
+                    output.write(line + '\n')
+                stats.add(pid, seconds, statuses)
+                next_to_write += 1
+                if progress is not None:
+                    progress(stats)
+    stats.elapsed = time.perf_counter() - stats.started
+    return stats
@@ -0,0 +1,31 @@
+"""Play from an opening book before falling back to a search engine."""
+
+import random
+
+from adapters.polyglot_book import choose_book_move
+from domain.services import MovementService
+from ports.chess_engine import ChessEnginePort
+
+
+class BookEngine(ChessEnginePort):
+    """
+    Plays a weighted random book move while the position is in 'book' (an
+    OpeningBookPort) and asks 'engine' otherwise. The chosen book move is
+    checked with MovementService, so a corrupt or colliding entry falls
+    through to the engine. 'book_hits' and 'book_misses' count lookups.
+    """
+    def __init__(self, book, engine, movement_service=None, rng=None):
+        self.book = book
+        self.engine = engine
+        self.movement_service = movement_service or MovementService()
+        self.rng = rng or random.Random()
+        self.book_hits = 0
+        self.book_misses = 0
+
+    def find_best_move(self, game):
+        move = choose_book_move(self.book.find_moves(game), self.rng)
+        if move is not None and self.movement_service.is_valid_move(game, move.from_square, move.to_square):
+            self.book_hits += 1
+            return move
+        self.book_misses += 1
+        return self.engine.find_best_move(game)
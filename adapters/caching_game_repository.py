@@ -0,0 +1,109 @@
+import time
+from collections import OrderedDict
+
+from ports.game_repository import GameRepository
+
+
+class CachingGameRepository(GameRepository):
+    """
+    Keeps recently used games in memory in front of another GameRepository.
+
+    find_by_id returns the cached Game object while it is fresh, so the game
+    being played is loaded from the backing store once. save() only marks
+    the game dirty; dirty games are written to the backing store together
+    once 'flush_interval' seconds have passed since the last write (checked
+    on every call), when they are evicted, and on flush()/close().
+
+    At most 'max_size' games are kept, and a game not used for 'max_age'
+    seconds is dropped. hits and misses count find_by_id calls answered
+    from and not from the cache.
+    """
+    def __init__(self, backing, max_size=128, max_age=600.0, flush_interval=5.0, clock=time.monotonic):
+        self.backing = backing
+        self.max_size = max_size
+        self.max_age = max_age
+        self.flush_interval = flush_interval
+        self.clock = clock
+        self.hits = 0
+        self.misses = 0
+        # game_id -> [game, time of last use], least recently used first.
+        self._entries = OrderedDict()
+        self._dirty = set()
+        self._last_flush = clock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def save(self, game):
+        if not getattr(game, 'id', None):
+            # New games go straight through so the backing store assigns the id.
+            game_id = self.backing.save(game)
+        else:
+            game_id = game.id
+            self._dirty.add(game_id)
+        self._store(game_id, game)
+        self._maybe_flush()
+        return game_id
+
+    def find_by_id(self, game_id):
+        self._evict_expired()
+        entry = self._entries.get(game_id)
+        if entry is not None:
+            self.hits += 1
+            entry[1] = self.clock()
+            self._entries.move_to_end(game_id)
+            game = entry[0]
+        else:
+            self.misses += 1
+            game = self.backing.find_by_id(game_id)
+            if game is not None:
+                self._store(game_id, game)
+        self._maybe_flush()
+        return game
+
+    def list_game_ids(self):
+        game_ids = self.backing.list_game_ids()
+        known = set(game_ids)
+        return game_ids + [game_id for game_id in self._entries if game_id not in known]
+
+    def flush(self):
+        """Write every dirty game to the backing store."""
+        for game_id in list(self._dirty):
+            self.backing.save(self._entries[game_id][0])
+        self._dirty.clear()
+        self._last_flush = self.clock()
+
+    def close(self):
+        self.flush()
+
+    # -------------------------------------------------------------------------
+    #                          INTERNAL / HELPER METHODS
+    # -------------------------------------------------------------------------
+    def _store(self, game_id, game):
+        self._entries[game_id] = [game, self.clock()]
+        self._entries.move_to_end(game_id)
+        while len(self._entries) > self.max_size:
+            self._evict(next(iter(self._entries)))
+
+    def _evict_expired(self):
+        if not self.max_age:
+            return
+        cutoff = self.clock() - self.max_age
+        while self._entries:
+            game_id, (_, last_used) = next(iter(self._entries.items()))
+            if last_used > cutoff:
+                break
+            self._evict(game_id)
+
+    def _evict(self, game_id):
+        game, _ = self._entries.pop(game_id)
+        if game_id in self._dirty:
+            self._dirty.discard(game_id)
+            self.backing.save(game)
+
+    def _maybe_flush(self):
+        if self._dirty and self.clock() - self._last_flush >= self.flush_interval:
+            self.flush()
@@ -0,0 +1,36 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from ports.async_game_repository import AsyncGameRepository
+
+
+class ExecutorGameRepository(AsyncGameRepository):
+    """
+    Async adapter over any blocking GameRepository (e.g. FileGameRepository).
+    Each call runs on a thread pool, so a slow disk read or write waits off
+    the event loop while other games carry on.
+
+    The wrapped repository must tolerate calls for different games from
+    several threads at once; calls for the same game are serialized by the
+    async use cases' per-game locks.
+    """
+    def __init__(self, repository, max_workers=4, executor=None):
+        self.repository = repository
+        self._own_executor = executor is None
+        self.executor = executor or ThreadPoolExecutor(max_workers, thread_name_prefix='game-repository')
+
+    async def save(self, game):
+        return await self._run(self.repository.save, game)
+
+    async def find_by_id(self, game_id):
+        return await self._run(self.repository.find_by_id, game_id)
+
+    async def list_game_ids(self):
+        return await self._run(self.repository.list_game_ids)
+
+    def close(self):
+        if self._own_executor:
+            self.executor.shutdown(wait=True)
+
+    async def _run(self, function, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, function, *args)
@@ -1,31 +1,56 @@
 import uuid
 import pickle
 from pathlib import Path
+from adapters.game_codec import decode_game, encode_game
 from ports.game_repository import GameRepository
 
 class FileGameRepository(GameRepository):
-    """Persist games to disk using pickle serialization."""
-    def __init__(self, directory="saved_games"):
+    """
+    Persist games to disk, one file per game: pickled as `<id>.pkl`, or
+    with compact=True in the binary game codec as `<id>.game`. Files in
+    either format are read; saving replaces a file in the other format.
+    """
+    def __init__(self, directory="saved_games", compact=False, board_factory=None):
         self.directory = Path(directory)
         self.directory.mkdir(exist_ok=True)
+        self.compact = compact
+        self.board_factory = board_factory
+        self._suffixes = ('.game', '.pkl') if compact else ('.pkl', '.game')
 
     def save(self, game):
         game_id = getattr(game, 'id', None)
         if not game_id:
             game_id = str(uuid.uuid4())
             setattr(game, 'id', game_id)
-        file_path = self.directory / f"{game_id}.pkl"
+        file_path = self._snapshot_path(game_id)
         with open(file_path, 'wb') as f:
-            pickle.dump(game, f)
+            f.write(self._dumps(game))
+        self._remove_other_format(game_id)
         return game_id
 
     def find_by_id(self, game_id):
-        file_path = self.directory / f"{game_id}.pkl"
-        if not file_path.exists():
-            return None
-        with open(file_path, 'rb') as f:
-            game = pickle.load(f)
-        return game
+        for suffix in self._suffixes:
+            file_path = self.directory / f"{game_id}{suffix}"
+            if file_path.exists():
+                with open(file_path, 'rb') as f:
+                    data = f.read()
+                if suffix == '.pkl':
+                    return pickle.loads(data)
+                game = decode_game(data, self.board_factory)
+                game.id = game_id
+                return game
+        return None
 
     def list_game_ids(self):
-        return [p.stem for p in self.directory.glob('*.pkl')]
+        game_ids = [p.stem for p in self.directory.glob('*.pkl')]
+        known = set(game_ids)
+        return game_ids + [p.stem for p in self.directory.glob('*.game') if p.stem not in known]
+
+    def _snapshot_path(self, game_id):
+        return self.directory / f"{game_id}{self._suffixes[0]}"
+
+    def _dumps(self, game):
+        return encode_game(game) if self.compact else pickle.dumps(game)
+
+    def _remove_other_format(self, game_id):
+        (self.directory / f"{game_id}{self._suffixes[1]}").unlink(missing_ok=True)
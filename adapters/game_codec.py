@@ -0,0 +1,244 @@
+"""Compact, versioned serialization of games.
+
+Binary layout (version 3), all multi-byte integers as unsigned LEB128
+varints unless noted:
+
+    b'CG', version byte
+    flags byte     - bit 0: black to move, bits 1-4: castling rights in
+                     zobrist.CASTLING_RIGHTS order, bit 5: en passant file
+                     follows, bit 6: start FEN follows, bit 7: draw
+                     state follows
+    [file byte]    - file of a pawn that just advanced two squares
+    status         - index into STATUS_CODES, or len(STATUS_CODES) followed
+                     by the length and ASCII text of any other status
+    [start FEN]    - length and ASCII text of Game.start_fen
+    [draw state]   - halfmove clock, then the number of position_counts
+                     entries and for each its key (8 bytes big-endian) and
+                     count
+    occupancy      - 8 bytes big-endian, bit n set if square n (row * 8 + col)
+                     holds a piece
+    pieces         - one 4-bit code per occupied square in square order,
+                     two per byte, high nibble first
+    moves          - count, then (from * 64 + to) * 5 + promotion per move of
+                     the game's move_history
+
+Version 2 is the same without bit 7, version 1 also without bit 6. The
+start position with no moves takes 30 bytes. The text form holds the same
+fields as 'FEN | status | UCI moves' plus ' | start FEN' when there is
+one, except the position counts.
+"""
+
+from domain.board import Board
+from domain.game import Game
+from domain.move import Move
+from domain.notation import game_from_fen, game_to_fen, move_to_uci, parse_uci
+from domain.piece import Color, Piece, PieceType
+from domain.zobrist import CASTLING_RIGHTS, castling_rights
+
+MAGIC = b'CG'
+VERSION = 3
+# Versions decode_game can read.
+READABLE_VERSIONS = (1, 2, 3)
+STATUS_CODES = ('ONGOING', 'CHECK', 'CHECKMATE', 'STALEMATE')
+PIECE_TYPES = (PieceType.PAWN, PieceType.KNIGHT, PieceType.BISHOP,
+               PieceType.ROOK, PieceType.QUEEN, PieceType.KING)
+PROMOTIONS = (None, PieceType.QUEEN, PieceType.ROOK, PieceType.BISHOP, PieceType.KNIGHT)
+BLACK_TO_MOVE = 0x01
+EN_PASSANT = 0x20
+START_FEN = 0x40
+DRAW_STATE = 0x80
+SQUARES = [divmod(square, 8) for square in range(64)]
+# Decoded moves by their encoded value, filled on first use. Moves are
+# immutable, so games can share them.
+_MOVE_CACHE = {}
+
+
+def _write_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _write_text(out, text):
+    data = text.encode('ascii')
+    _write_varint(out, len(data))
+    out += data
+
+
+def _read_text(data, offset):
+    length, offset = _read_varint(data, offset)
+    return data[offset:offset + length].decode('ascii'), offset + length
+
+
+def _read_varint(data, offset):
+    value = shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def encode_game(game):
+    """Return the compact binary encoding of 'game' (without its id)."""
+    board = game.board
+    out = bytearray(MAGIC)
+    out.append(VERSION)
+
+    flags = BLACK_TO_MOVE if game.current_player == Color.BLACK else 0
+    for index in castling_rights(board):
+        flags |= 2 << index
+    en_passant_file = None
+    last = game.last_move
+    if last:
+        last_piece, last_from, last_to = last
+        if last_piece.piece_type == PieceType.PAWN and abs(last_to[0] - last_from[0]) == 2:
+            flags |= EN_PASSANT
+            en_passant_file = last_to[1]
+    if game.start_fen:
+        flags |= START_FEN
+    if game.halfmove_clock or game.position_counts:
+        flags |= DRAW_STATE
+    out.append(flags)
+    if en_passant_file is not None:
+        out.append(en_passant_file)
+
+    if game.status in STATUS_CODES:
+        _write_varint(out, STATUS_CODES.index(game.status))
+    else:
+        _write_varint(out, len(STATUS_CODES))
+        _write_text(out, game.status)
+    if game.start_fen:
+        _write_text(out, game.start_fen)
+    if flags & DRAW_STATE:
+        _write_varint(out, game.halfmove_clock)
+        _write_varint(out, len(game.position_counts))
+        for key, count in game.position_counts.items():
+            out += key.to_bytes(8, 'big')
+            _write_varint(out, count)
+
+    occupancy = 0
+    nibbles = []
+    for square, (row, col) in enumerate(SQUARES):
+        piece = board.get_piece(row, col)
+        if piece is not None:
+            occupancy |= 1 << square
+            code = PIECE_TYPES.index(piece.piece_type)
+            nibbles.append(code if piece.color == Color.WHITE else code + 6)
+    out += occupancy.to_bytes(8, 'big')
+    if len(nibbles) % 2:
+        nibbles.append(0)
+    out += bytes((high << 4) | low for high, low in zip(nibbles[::2], nibbles[1::2]))
+
+    history = game.move_history
+    _write_varint(out, len(history))
+    for move in history:
+        (fr, fc), (tr, tc) = move.from_square, move.to_square
+        _write_varint(out, ((fr * 8 + fc) * 64 + tr * 8 + tc) * 5 + PROMOTIONS.index(move.promotion))
+    return bytes(out)
+
+
+def decode_game(data, board_factory=None):
+    """
+    Rebuild a Game from encode_game output. Unmoved-piece flags are
+    derived from the castling rights, as game_from_fen does.
+    """
+    if data[:2] != MAGIC:
+        raise ValueError("Not an encoded game")
+    if data[2] not in READABLE_VERSIONS:
+        raise ValueError(f"Unsupported game encoding version: {data[2]}")
+    flags = data[3]
+    offset = 4
+    en_passant_file = None
+    if flags & EN_PASSANT:
+        en_passant_file = data[offset]
+        offset += 1
+
+    code, offset = _read_varint(data, offset)
+    if code < len(STATUS_CODES):
+        status = STATUS_CODES[code]
+    else:
+        status, offset = _read_text(data, offset)
+    start_fen = None
+    if flags & START_FEN:
+        start_fen, offset = _read_text(data, offset)
+    halfmove_clock = 0
+    position_counts = {}
+    if flags & DRAW_STATE:
+        halfmove_clock, offset = _read_varint(data, offset)
+        entries, offset = _read_varint(data, offset)
+        for _ in range(entries):
+            key = int.from_bytes(data[offset:offset + 8], 'big')
+            position_counts[key], offset = _read_varint(data, offset + 8)
+
+    occupancy = int.from_bytes(data[offset:offset + 8], 'big')
+    offset += 8
+    board = (board_factory or Board)()
+    count = 0
+    while occupancy:
+        low_bit = occupancy & -occupancy
+        occupancy ^= low_bit
+        byte = data[offset + count // 2]
+        code = byte >> 4 if count % 2 == 0 else byte & 0x0F
+        count += 1
+        piece_type = PIECE_TYPES[code % 6]
+        piece = Piece(Color.WHITE if code < 6 else Color.BLACK, piece_type)
+        piece.has_moved = piece_type in (PieceType.KING, PieceType.ROOK)
+        (row, col) = SQUARES[low_bit.bit_length() - 1]
+        board.place_piece(row, col, piece)
+    offset += (count + 1) // 2
+
+    for index, (color, row, rook_col, _) in enumerate(CASTLING_RIGHTS):
+        if flags & (2 << index):
+            board.get_piece(row, 4).has_moved = False
+            board.get_piece(row, rook_col).has_moved = False
+
+    game = Game(board, Color.BLACK if flags & BLACK_TO_MOVE else Color.WHITE)
+    game.status = status
+    game.start_fen = start_fen
+    game.halfmove_clock = halfmove_clock
+    game.position_counts = position_counts
+    if en_passant_file is not None:
+        # The pawn that just moved belongs to the side not to move.
+        (from_row, to_row) = (6, 4) if game.current_player == Color.BLACK else (1, 3)
+        pawn = board.get_piece(to_row, en_passant_file)
+        game.last_move = (pawn, (from_row, en_passant_file), (to_row, en_passant_file))
+
+    moves, offset = _read_varint(data, offset)
+    history = []
+    for _ in range(moves):
+        value, offset = _read_varint(data, offset)
+        move = _MOVE_CACHE.get(value)
+        if move is None:
+            squares, promotion = divmod(value, 5)
+            frm, to = divmod(squares, 64)
+            move = _MOVE_CACHE[value] = Move(SQUARES[frm], SQUARES[to], PROMOTIONS[promotion])
+        history.append(move)
+    game.move_history = history
+    return game
+
+
+def game_to_text(game):
+    """
+    The same fields as encode_game, as 'FEN | status | UCI moves', with
+    ' | start FEN' appended when the game has one.
+    """
+    moves = ' '.join(move_to_uci(move) for move in game.move_history)
+    text = f"{game_to_fen(game)} | {game.status} | {moves}"
+    if game.start_fen:
+        text += f" | {game.start_fen}"
+    return text
+
+
+def game_from_text(text, board_factory=None):
+    fields = [field.strip() for field in text.split('|')]
+    if len(fields) not in (3, 4):
+        raise ValueError(f"Invalid game text: {text!r}")
+    game = game_from_fen(fields[0], board_factory)
+    game.status = fields[1]
+    game.move_history = [parse_uci(uci) for uci in fields[2].split()]
+    game.start_fen = fields[3] if len(fields) == 4 else None
+    return game
@@ -0,0 +1,163 @@
+"""Opt-in call counting, latency histograms and per-game profiles.
+
+Nothing here runs unless asked for: Instrumentation.wrap() replaces the
+named methods on one object with timing wrappers (instance attributes, so
+the class and every other instance are untouched), and unwrap() puts the
+originals back. An unwrapped object pays nothing.
+
+    instrumentation = Instrumentation()
+    instrumentation.wrap(movement_service, SERVICE_METHODS, 'movement_service')
+    instrumentation.wrap(repository, REPOSITORY_METHODS, 'repository')
+    ...
+    instrumentation.write('metrics.prom')   # or metrics.json
+
+Wrapping a method costs two perf_counter() calls and a histogram update
+per call, roughly half a microsecond; on _simulate_move, which the legal
+move search calls for every candidate move, that is noticeable, so only
+enable it to find out where time goes.
+"""
+
+import cProfile
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+from adapters.metrics import LatencyHistogram
+
+# Upper bounds of the call latency buckets in seconds: 1 us doubling to ~17 s.
+# Finer than LATENCY_BUCKETS (adapters/metrics.py) since most calls here
+# are far below a millisecond.
+CALL_BUCKETS = tuple(1e-6 * 2 ** i for i in range(25))
+
+# The hot paths worth watching on each kind of object.
+# MovePieceUseCase.apply validates with is_valid_move and ends games with
+# end_status, which calls has_legal_move and is_insufficient_material; the
+# engine generates moves and tests for check; _simulate_move is the inner
+# legality probe under all of them.
+SERVICE_METHODS = ('is_valid_move', 'end_status', 'has_legal_move', 'is_in_check',
+                   'is_insufficient_material', 'generate_legal_moves', '_simulate_move')
+REPOSITORY_METHODS = ('save', 'find_by_id')
+USE_CASE_METHODS = ('execute',)
+
+METRIC_NAME = 'chess_call_duration_seconds'
+
+_UNSET = object()
+
+
+class Instrumentation:
+    """
+    Times wrapped methods. 'histograms' maps '<prefix>.<method>' to a
+    LatencyHistogram; a call that raises is timed too.
+    """
+    def __init__(self, buckets=CALL_BUCKETS):
+        self.buckets = buckets
+        self.histograms = {}
+        self._wrapped = []
+
+    def wrap(self, target, method_names, prefix):
+        """Time each of 'method_names' on 'target' under '<prefix>.<name>'."""
+        for method_name in method_names:
+            name = f"{prefix}.{method_name}"
+            histogram = self.histograms.setdefault(name, LatencyHistogram(self.buckets))
+            method = getattr(target, method_name)
+            self._wrapped.append((target, method_name, vars(target).get(method_name, _UNSET)))
+            setattr(target, method_name, _timed(method, histogram))
+        return target
+
+    def unwrap(self):
+        """Restore every wrapped method; the histograms are kept."""
+        for target, method_name, previous in reversed(self._wrapped):
+            if previous is _UNSET:
+                # The wrapper only shadowed the class's method.
+                delattr(target, method_name)
+            else:
+                setattr(target, method_name, previous)
+        self._wrapped = []
+
+    def snapshot(self):
+        """The histograms as a JSON-ready dict, busiest first."""
+        ordered = sorted(self.histograms.items(), key=lambda item: -item[1].count)
+        return {name: {**histogram.to_dict(), 'total': histogram.total}
+                for name, histogram in ordered}
+
+    def to_prometheus(self):
+        """The histograms in the Prometheus text exposition format."""
+        lines = [f"# HELP {METRIC_NAME} Time spent in instrumented calls.",
+                 f"# TYPE {METRIC_NAME} histogram"]
+        for name, histogram in sorted(self.histograms.items()):
+            label = f'method="{name}"'
+            cumulative = 0
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                cumulative += count
+                lines.append(f'{METRIC_NAME}_bucket{{{label},le="{bound:.6g}"}} {cumulative}')
+            lines.append(f'{METRIC_NAME}_bucket{{{label},le="+Inf"}} {histogram.count}')
+            lines.append(f'{METRIC_NAME}_sum{{{label}}} {histogram.total:.9f}')
+            lines.append(f'{METRIC_NAME}_count{{{label}}} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path):
+        """
+        Write the metrics to 'path': a JSON snapshot if it ends in .json,
+        Prometheus text otherwise. The file is replaced atomically so a
+        scraper never reads half of it.
+        """
+        path = Path(path)
+        if path.suffix == '.json':
+            text = json.dumps(self.snapshot(), indent=2) + '\n'
+        else:
+            text = self.to_prometheus()
+        temp_path = path.with_name(path.name + '.tmp')
+        temp_path.write_text(text)
+        os.replace(temp_path, path)
+
+
+def _timed(method, histogram):
+    perf_counter = time.perf_counter
+    record = histogram.record
+
+    def timed(*args, **kwargs):
+        began = perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            record(perf_counter() - began)
+
+    timed.__wrapped__ = method
+    timed.__name__ = getattr(method, '__name__', 'timed')
+    return timed
+
+
+class GameProfiler:
+    """
+    Keeps one cProfile.Profile per game. Work done inside profile(game_id)
+    is added to that game's profile, so a game played over many calls
+    ends up in one profile; dump(game_id) writes it to
+    '<directory>/<game_id>.prof' for pstats or snakeviz.
+    """
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self._profiles = {}
+
+    @contextmanager
+    def profile(self, game_id):
+        profile = self._profiles.setdefault(game_id, cProfile.Profile())
+        profile.enable()
+        try:
+            yield profile
+        finally:
+            profile.disable()
+
+    def dump(self, game_id):
+        """Write the game's profile and forget it. Returns the path, or None if nothing was profiled."""
+        profile = self._profiles.pop(game_id, None)
+        if profile is None:
+            return None
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{game_id}.prof"
+        profile.dump_stats(path)
+        return path
+
+    def dump_all(self):
+        return [self.dump(game_id) for game_id in list(self._profiles)]
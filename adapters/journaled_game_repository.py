@@ -0,0 +1,180 @@
+"""File repository that appends one small record per move.
+
+Each game is stored as a snapshot, `<id>.pkl` or `<id>.game` (the same
+files FileGameRepository writes), plus a log, `<id>.log`, holding the moves
+made since.
+
+Log layout:
+    header  - b'CHJ1' and the ply (len(move_history)) the log starts at
+    records - 5 bytes per move: from square, to square, promotion,
+              status, check byte
+
+Recovery rules:
+    - Snapshots and log resets are written to a temporary file and renamed
+      into place, so each file is always either the old or the new version.
+    - Records are replayed from the snapshot's ply onwards; records the
+      snapshot already contains are skipped, which covers a crash between
+      writing the snapshot and resetting the log.
+    - Replay stops at the first torn or corrupt record; the next save
+      overwrites it.
+"""
+
+import os
+import struct
+import uuid
+
+from adapters.file_game_repository import FileGameRepository
+from domain.move import Move
+from domain.piece import PieceType
+
+LOG_MAGIC = b'CHJ1'
+HEADER = struct.Struct('<4sI')
+RECORD = struct.Struct('<5B')
+PROMOTIONS = (None, PieceType.QUEEN, PieceType.ROOK, PieceType.BISHOP, PieceType.KNIGHT)
+STATUSES = ('ONGOING', 'CHECK', 'CHECKMATE', 'STALEMATE',
+            'DRAW_REPETITION', 'DRAW_FIFTY_MOVES', 'DRAW_INSUFFICIENT_MATERIAL')
+# XORed into the check byte so an all-zero record never passes as valid.
+CHECK_SEED = 0xA5
+
+
+def encode_record(move, status):
+    (fr, fc), (tr, tc) = move.from_square, move.to_square
+    fields = (fr * 8 + fc, tr * 8 + tc, PROMOTIONS.index(move.promotion), STATUSES.index(status))
+    check = CHECK_SEED
+    for value in fields:
+        check ^= value
+    return RECORD.pack(*fields, check)
+
+
+def decode_record(data):
+    """Return (move, status), or None if the record fails its check byte."""
+    frm, to, promotion, status, check = RECORD.unpack(data)
+    if CHECK_SEED ^ frm ^ to ^ promotion ^ status != check:
+        return None
+    if frm > 63 or to > 63 or promotion >= len(PROMOTIONS) or status >= len(STATUSES):
+        return None
+    move = Move(divmod(frm, 8), divmod(to, 8), PROMOTIONS[promotion])
+    return move, STATUSES[status]
+
+
+class JournaledFileGameRepository(FileGameRepository):
+    """
+    FileGameRepository whose save() appends the moves made since the last
+    save to the game's log instead of rewriting the whole game. Every
+    'snapshot_interval' logged moves the game is re-snapshotted and the log
+    reset. With sync=True every write is fsynced before save() returns.
+
+    A save that cannot be expressed as appended moves (a new game, a game
+    whose history got shorter, a status the log cannot encode) writes a
+    snapshot instead.
+    """
+    def __init__(self, directory="saved_games", snapshot_interval=64, sync=False,
+                 compact=False, board_factory=None):
+        super().__init__(directory, compact, board_factory)
+        self.snapshot_interval = snapshot_interval
+        self.sync = sync
+        # game_id -> [persisted ply, records since snapshot, status, log length]
+        self._state = {}
+
+    def save(self, game):
+        game_id = getattr(game, 'id', None)
+        if not game_id:
+            game_id = str(uuid.uuid4())
+            setattr(game, 'id', game_id)
+
+        state = self._state.get(game_id)
+        history = game.move_history
+        if state is None or len(history) < state[0] or game.status not in STATUSES:
+            self._write_snapshot(game_id, game)
+            return game_id
+
+        persisted_ply, since_snapshot, status, log_length = state
+        new_moves = history[persisted_ply:]
+        if not new_moves:
+            if game.status != status:
+                self._write_snapshot(game_id, game)
+            return game_id
+        if since_snapshot + len(new_moves) >= self.snapshot_interval:
+            self._write_snapshot(game_id, game)
+            return game_id
+
+        data = b''.join(encode_record(move, game.status) for move in new_moves)
+        with open(self._log_path(game_id), 'r+b') as f:
+            f.seek(log_length)
+            f.write(data)
+            f.truncate()
+            self._sync(f)
+        self._state[game_id] = [len(history), since_snapshot + len(new_moves),
+                                game.status, log_length + len(data)]
+        return game_id
+
+    def find_by_id(self, game_id):
+        game = super().find_by_id(game_id)
+        if game is None:
+            return None
+        snapshot_ply = len(game.move_history)
+        log_length = self._replay_log(game_id, game)
+        if log_length is None:
+            # Missing or unreadable log: start a fresh one from the snapshot.
+            self._write_log(game_id, snapshot_ply)
+            log_length = HEADER.size
+        self._state[game_id] = [len(game.move_history), len(game.move_history) - snapshot_ply,
+                                game.status, log_length]
+        return game
+
+    # -------------------------------------------------------------------------
+    #                          INTERNAL / HELPER METHODS
+    # -------------------------------------------------------------------------
+    def _log_path(self, game_id):
+        return self.directory / f"{game_id}.log"
+
+    def _replay_log(self, game_id, game):
+        """
+        Apply the log records past the snapshot to 'game'. Returns the
+        length of the valid part of the log, or None if there is no log.
+        """
+        try:
+            with open(self._log_path(game_id), 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        if len(data) < HEADER.size:
+            return None
+        magic, base_ply = HEADER.unpack_from(data)
+        if magic != LOG_MAGIC or base_ply > len(game.move_history):
+            return None
+
+        offset = HEADER.size
+        ply = base_ply
+        while offset + RECORD.size <= len(data):
+            record = decode_record(data[offset:offset + RECORD.size])
+            if record is None:
+                break
+            move, status = record
+            if ply >= len(game.move_history):
+                game.move_piece(move.from_square, move.to_square, move.promotion)
+                game.status = status
+            ply += 1
+            offset += RECORD.size
+        return offset
+
+    def _write_snapshot(self, game_id, game):
+        self._atomic_write(self._snapshot_path(game_id), self._dumps(game))
+        self._remove_other_format(game_id)
+        self._write_log(game_id, len(game.move_history))
+        self._state[game_id] = [len(game.move_history), 0, game.status, HEADER.size]
+
+    def _write_log(self, game_id, base_ply):
+        self._atomic_write(self._log_path(game_id), HEADER.pack(LOG_MAGIC, base_ply))
+
+    def _atomic_write(self, path, data):
+        temp_path = path.with_name(path.name + '.tmp')
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+            self._sync(f)
+        os.replace(temp_path, path)
+
+    def _sync(self, f):
+        if self.sync:
+            f.flush()
+            os.fsync(f.fileno())
@@ -0,0 +1,179 @@
+"""Line-delimited JSON game server on asyncio.
+
+Each request is one JSON object per line and gets one JSON line back:
+
+    {"id": 1, "op": "start"}
+        -> {"id": 1, "ok": true, "game_id": "..."}
+    {"id": 2, "op": "move", "game_id": "...", "move": "e2e4"}
+        -> {"id": 2, "ok": true, "status": "ONGOING", "current_player": "BLACK", "fen": "..."}
+    {"id": 3, "op": "legal_moves", "game_id": "..."}
+        -> {"id": 3, "ok": true, "moves": ["e7e5", ...]}   (empty once the game is over)
+    {"id": 4, "op": "state", "game_id": "..."}
+        -> {"id": 4, "ok": true, "status": ..., "current_player": ..., "fen": ..., "moves": [...]}
+    {"id": 5, "op": "stats"}
+        -> {"id": 5, "ok": true, "latency": {"move": {...}, ...}}
+
+Failures answer {"id": ..., "ok": false, "error": "..."}. Requests on one
+connection may be pipelined; responses carry the request's id and can
+arrive out of order.
+"""
+
+import asyncio
+import json
+import time
+
+from adapters.metrics import LatencyHistogram
+from application.async_use_cases import AsyncMovePieceUseCase, AsyncStartGameUseCase, GameLocks
+from domain.notation import game_to_fen, move_to_uci, parse_uci
+from domain.services import MovementService
+
+
+class ChessJsonServer:
+    """
+    Hosts any number of games over the JSON protocol above, on top of the
+    async use cases and an AsyncGameRepository.
+
+    Backpressure: a connection has at most 'max_in_flight' requests being
+    handled; the server stops reading from it until one finishes, so a
+    client that sends faster than it is served is slowed down by TCP flow
+    control. Responses wait for the socket to drain.
+    """
+    def __init__(self, game_repository, movement_service=None, host='127.0.0.1', port=8765,
+                 max_in_flight=32, max_line=64 * 1024):
+        self.game_repository = game_repository
+        self.movement_service = movement_service or MovementService()
+        self.host = host
+        self.port = port
+        self.max_in_flight = max_in_flight
+        self.max_line = max_line
+        self.locks = GameLocks()
+        self.start_game = AsyncStartGameUseCase(game_repository)
+        self.move_piece = AsyncMovePieceUseCase(game_repository, self.movement_service, self.locks)
+        self.latency = {}
+        self._server = None
+        self._handlers = {
+            'start': self._start,
+            'move': self._move,
+            'legal_moves': self._legal_moves,
+            'state': self._state,
+            'stats': self._stats,
+        }
+
+    async def start(self):
+        self._server = await asyncio.start_server(
+            self._serve_connection, self.host, self.port, limit=self.max_line
+        )
+        # Report the real port when started with port=0.
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def handle(self, request):
+        """Answer one decoded request; usable without a socket."""
+        began = time.perf_counter()
+        op = request.get('op') if isinstance(request, dict) else None
+        response = {'id': request.get('id') if isinstance(request, dict) else None}
+        handler = self._handlers.get(op) if isinstance(op, str) else None
+        try:
+            if handler is None:
+                raise Exception(f"Unknown op: {op!r}")
+            response.update(await handler(request))
+            response['ok'] = True
+        except Exception as ex:
+            response['ok'] = False
+            response['error'] = str(ex)
+        name = op if handler else 'invalid'
+        if name not in self.latency:
+            self.latency[name] = LatencyHistogram()
+        self.latency[name].record(time.perf_counter() - began)
+        return response
+
+    # -------------------------------------------------------------------------
+    #                          INTERNAL / HELPER METHODS
+    # -------------------------------------------------------------------------
+    async def _serve_connection(self, reader, writer):
+        slots = asyncio.Semaphore(self.max_in_flight)
+        write_lock = asyncio.Lock()
+        tasks = set()
+
+        async def answer(line):
+            try:
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    response = {'id': None, 'ok': False, 'error': "Malformed JSON"}
+                else:
+                    response = await self.handle(request)
+                async with write_lock:
+                    writer.write(json.dumps(response).encode() + b'\n')
+                    await writer.drain()
+            except ConnectionError:
+                pass
+            finally:
+                slots.release()
+
+        try:
+            while True:
+                await slots.acquire()
+                try:
+                    line = await reader.readline()
+                except (ValueError, ConnectionError):
+                    # Over-long line or dropped connection.
+                    slots.release()
+                    break
+                if not line:
+                    slots.release()
+                    break
+                task = asyncio.ensure_future(answer(line))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            writer.close()
+
+    async def _load(self, request):
+        game = await self.game_repository.find_by_id(request.get('game_id'))
+        if game is None:
+            raise Exception(f"Game with id={request.get('game_id')} not found.")
+        return game
+
+    async def _start(self, request):
+        return {'game_id': await self.start_game.execute()}
+
+    async def _move(self, request):
+        move = parse_uci(request.get('move') or '')
+        game = await self.move_piece.execute(request.get('game_id'), move.from_square,
+                                             move.to_square, move.promotion)
+        return {'status': game.status, 'current_player': game.current_player, 'fen': game_to_fen(game)}
+
+    async def _legal_moves(self, request):
+        async with self.locks.hold(request.get('game_id')):
+            game = await self._load(request)
+            # A drawn game can still have legal moves, but none may be played.
+            moves = [] if game.is_finished() else self.movement_service.generate_legal_moves(game)
+        return {'moves': [move_to_uci(move) for move in moves]}
+
+    async def _state(self, request):
+        async with self.locks.hold(request.get('game_id')):
+            game = await self._load(request)
+            return {
+                'status': game.status,
+                'current_player': game.current_player,
+                'fen': game_to_fen(game),
+                'moves': [move_to_uci(move) for move in game.move_history],
+            }
+
+    async def _stats(self, request):
+        return {'latency': {op: histogram.to_dict() for op, histogram in self.latency.items()}}
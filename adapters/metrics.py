@@ -0,0 +1,42 @@
+"""Latency histograms shared by the game server, the load test and instrumentation."""
+
+import bisect
+
+# Upper bounds of the latency buckets in seconds: 50 us doubling to ~13 s.
+LATENCY_BUCKETS = tuple(50e-6 * 2 ** i for i in range(19))
+
+
+class LatencyHistogram:
+    """Counts durations in exponentially sized buckets."""
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        # One extra bucket for durations above the last bound.
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def record(self, seconds):
+        self.counts[bisect.bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def percentile(self, fraction):
+        """Upper bound of the bucket holding the given fraction of samples."""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                return self.buckets[min(index, len(self.buckets) - 1)]
+        return self.buckets[-1]
+
+    def to_dict(self):
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else 0.0,
+            'p50': self.percentile(0.50),
+            'p99': self.percentile(0.99),
+            'buckets': {f"{bound:.6f}": count for bound, count in zip(self.buckets, self.counts) if count},
+        }
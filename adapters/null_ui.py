@@ -0,0 +1,24 @@
+from ports.ui_service import ChessUIService
+
+class NullChessUI(ChessUIService):
+    """
+    A UI that shows nothing, for headless runs: engine-vs-engine games,
+    soak tests and benchmarks. Player input comes from 'squares', an
+    iterable of (row, col) picks, e.g. a scripted game.
+    """
+    def __init__(self, squares=()):
+        self.squares = iter(squares)
+        self.frames = 0
+        self.messages = []
+
+    def draw_board(self, game):
+        self.frames += 1
+
+    def get_player_input(self, current_player):
+        try:
+            return next(self.squares)
+        except StopIteration:
+            raise EOFError("No scripted input left") from None
+
+    def show_message(self, message, duration=2000):
+        self.messages.append(message)
@@ -0,0 +1,126 @@
+"""Multi-process root-splitting search.
+
+Each iteration of the iterative deepening splits the root moves over a
+multiprocessing pool. Positions go to the workers as FEN text and moves as
+UCI strings rather than pickled Game objects, and every worker keeps its own
+AlphaBetaEngine so its transposition table survives between iterations.
+"""
+
+import multiprocessing
+import time
+
+from adapters.alpha_beta_engine import MATE_SCORE, MATE_THRESHOLD, AlphaBetaEngine, SearchResult
+from domain.notation import game_from_fen, game_to_fen, move_to_uci, parse_uci
+from domain.services import MovementService
+from ports.chess_engine import ChessEnginePort
+
+# The engine living in each worker process, created by _init_worker.
+_worker_engine = None
+
+
+def _init_worker(tt_size):
+    global _worker_engine
+    _worker_engine = AlphaBetaEngine(tt_size=tt_size)
+
+
+def _search_chunk(fen, ucis, depth, deadline, node_limit):
+    """
+    Worker task: search the root moves 'ucis' of position 'fen' to 'depth'.
+    Returns (best uci, score, nodes), or None if the budget ran out.
+    """
+    game = game_from_fen(fen)
+    moves = [parse_uci(uci) for uci in ucis]
+    time_limit = None
+    if deadline is not None:
+        time_limit = deadline - time.time()
+        if time_limit <= 0:
+            return None
+    result = _worker_engine.search_root_moves(game, moves, depth, time_limit, node_limit)
+    if result is None:
+        return None
+    move, score, nodes = result
+    return move_to_uci(move), score, nodes
+
+
+class ParallelSearchEngine(ChessEnginePort):
+    """
+    Same best-move API as AlphaBetaEngine, with the root moves of every
+    iteration split over 'workers' processes (default: one per CPU).
+    The time budget is shared; what is left of the node budget is split
+    between the workers at the start of every iteration.
+
+    The pool is started on first use; call close() (or use the engine as a
+    context manager) to shut it down.
+    """
+    def __init__(self, workers=None, max_depth=64, time_limit=1.0, node_limit=None,
+                 tt_size=200000, movement_service=None):
+        self.workers = workers or multiprocessing.cpu_count()
+        self.max_depth = max_depth
+        self.time_limit = time_limit
+        self.node_limit = node_limit
+        self.tt_size = tt_size
+        self.movement_service = movement_service or MovementService()
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def find_best_move(self, game):
+        return self.search(game).move
+
+    def search(self, game):
+        """
+        Run the parallel iterative-deepening search and return a
+        SearchResult whose node count is summed over all workers.
+        """
+        deadline = time.time() + self.time_limit if self.time_limit else None
+
+        root_moves = self.movement_service.generate_legal_moves(game)
+        if not root_moves:
+            score = -MATE_SCORE if self.movement_service.is_in_check(game) else 0
+            return SearchResult(None, score, 0, 0)
+
+        fen = game_to_fen(game)
+        ucis = [move_to_uci(move) for move in root_moves]
+        pool = self._get_pool()
+        best = SearchResult(root_moves[0], 0, 0, 0)
+        total_nodes = 0
+        for depth in range(1, self.max_depth + 1):
+            node_limit = None
+            if self.node_limit:
+                node_limit = (self.node_limit - total_nodes) // self.workers
+                if node_limit <= 0:
+                    break
+            # Deal the moves round-robin so the previous iteration's best
+            # moves, which come first, are spread over all workers.
+            chunks = [ucis[i::self.workers] for i in range(self.workers)]
+            tasks = [(fen, chunk, depth, deadline, node_limit) for chunk in chunks if chunk]
+            results = pool.starmap(_search_chunk, tasks)
+            total_nodes += sum(result[2] for result in results if result is not None)
+            if any(result is None for result in results):
+                break
+
+            results.sort(key=lambda result: result[1], reverse=True)
+            best_uci, score, _ = results[0]
+            best = SearchResult(parse_uci(best_uci), score, depth, total_nodes)
+            ucis.remove(best_uci)
+            ucis.insert(0, best_uci)
+            if abs(score) >= MATE_THRESHOLD or len(ucis) == 1:
+                break
+        return best._replace(nodes=total_nodes)
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = multiprocessing.Pool(
+                self.workers, initializer=_init_worker, initargs=(self.tt_size,)
+            )
+        return self._pool
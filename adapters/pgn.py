@@ -0,0 +1,219 @@
+"""Streaming PGN import and export.
+
+read_pgn() reads one game at a time from any text stream, so files of any
+size are processed in constant memory. Every SAN move is resolved against
+the legal moves MovementService generates, so an imported game is a legal
+game. Comments, variations, NAGs and move numbers are skipped.
+"""
+
+import re
+from collections import namedtuple
+
+from domain.game import DRAW_STATUSES
+from domain.notation import STARTING_FEN, game_from_fen, game_to_fen, move_to_san, parse_san
+from domain.piece import Color
+from domain.services import MovementService
+
+# One imported game: its tag pairs (a dict) and the Game after its last move.
+PgnGame = namedtuple('PgnGame', ['tags', 'game'])
+
+RESULTS = ('1-0', '0-1', '1/2-1/2', '*')
+SEVEN_TAG_ROSTER = ('Event', 'Site', 'Date', 'Round', 'White', 'Black', 'Result')
+TAG_DEFAULTS = {'Date': '????.??.??'}
+TAG_RE = re.compile(r'\[\s*(\w+)\s+"((?:[^"\\]|\\.)*)"\s*\]')
+# Comments, NAGs, move numbers and results: everything in movetext but moves.
+NOISE_RE = re.compile(r'\{[^}]*\}|;[^\n]*|\$\d+|\d+\.(\.\.)?|1-0|0-1|1/2-1/2|\*')
+LINE_LENGTH = 80
+
+
+def iter_pgn_records(stream):
+    """
+    Yield (tags, movetext) for each game in 'stream' without reading
+    ahead more than one game. Lines inside a { } comment spanning several
+    lines are movetext, whatever they start or end with.
+    """
+    tags = {}
+    movetext = []
+    in_comment = False
+    for line in stream:
+        stripped = line.strip()
+        if in_comment:
+            movetext.append(stripped)
+            in_comment = _ends_in_comment(stripped, True)
+            if not in_comment and stripped.split() and stripped.split()[-1] in RESULTS:
+                yield tags, '\n'.join(movetext)
+                tags, movetext = {}, []
+            continue
+        if stripped.startswith('%'):
+            continue  # escape mechanism: the line is ignored
+        if stripped.startswith('['):
+            if movetext:
+                yield tags, '\n'.join(movetext)
+                tags, movetext = {}, []
+            match = TAG_RE.match(stripped)
+            if match:
+                tags[match.group(1)] = match.group(2).replace('\\"', '"').replace('\\\\', '\\')
+        elif stripped:
+            movetext.append(stripped)
+            in_comment = _ends_in_comment(stripped, False)
+            if not in_comment and stripped.split()[-1] in RESULTS:
+                yield tags, '\n'.join(movetext)
+                tags, movetext = {}, []
+    if tags or movetext:
+        yield tags, '\n'.join(movetext)
+
+
+def _ends_in_comment(line, in_comment):
+    """Whether a { } comment is still open after 'line'."""
+    for char in line:
+        if in_comment:
+            in_comment = char != '}'
+        elif char == '{':
+            in_comment = True
+        elif char == ';':
+            break  # the rest of the line is a comment, braces included
+    return in_comment
+
+
+def san_tokens(movetext):
+    """The SAN moves of the main line of 'movetext'."""
+    # Comments first: they may contain anything, including parentheses.
+    text = NOISE_RE.sub(' ', movetext)
+    tokens = []
+    depth = 0
+    for token in text.replace('(', ' ( ').replace(')', ' ) ').split():
+        if token == '(':
+            depth += 1
+        elif token == ')':
+            depth -= 1
+        elif depth == 0:
+            tokens.append(token)
+    return tokens
+
+
+def read_pgn(stream, movement_service=None, board_factory=None):
+    """
+    Yield a PgnGame for every game in 'stream'. The game starts from the
+    FEN tag if there is one. Raises ValueError naming the game and move if
+    a move is illegal or ambiguous.
+    """
+    movement_service = movement_service or MovementService()
+    for number, (tags, movetext) in enumerate(iter_pgn_records(stream), 1):
+        game = game_from_fen(tags.get('FEN', STARTING_FEN), board_factory)
+        for san in san_tokens(movetext):
+            try:
+                move = parse_san(game, san, movement_service)
+            except ValueError as ex:
+                raise ValueError(f"Game {number} ({len(game.move_history) + 1}. ply): {ex}") from None
+            game.move_piece(move.from_square, move.to_square, move.promotion)
+        status = movement_service.end_status(game)
+        if status:
+            game.status = status
+        yield PgnGame(tags, game)
+
+
+def game_to_pgn(game, tags=None, movement_service=None):
+    """
+    Return the PGN text of 'game': the seven tag roster (from 'tags' where
+    given), SetUp/FEN for games not starting from the initial position,
+    and the SAN movetext replayed from the start position.
+
+    A game whose move history does not lead to its position (one saved
+    before games kept their history) is written as a FEN of the current
+    position with no moves, rather than losing the position.
+    """
+    movement_service = movement_service or MovementService()
+    tags = dict(tags or {})
+    result = tags.setdefault('Result', _result(game))
+    start_fen = game.start_fen or STARTING_FEN
+
+    replay = game_from_fen(start_fen)
+    fields = start_fen.split()
+    move_number = int(fields[5]) if len(fields) > 5 else 1
+    words = []
+    for move in game.move_history:
+        if replay.current_player == Color.WHITE:
+            words.append(f"{move_number}.")
+        elif not words:
+            words.append(f"{move_number}...")
+        words.append(move_to_san(replay, move, movement_service))
+        replay.make_move(move)
+        if replay.current_player == Color.WHITE:
+            move_number += 1
+    if replay.position_key() != game.position_key():
+        tags['SetUp'] = '1'
+        tags['FEN'] = game_to_fen(game)
+        words = []
+    elif game.start_fen:
+        tags.setdefault('SetUp', '1')
+        tags.setdefault('FEN', game.start_fen)
+    words.append(str(result))
+
+    lines = []
+    for name in SEVEN_TAG_ROSTER:
+        lines.append(_tag(name, tags.pop(name, TAG_DEFAULTS.get(name, '?'))))
+    lines.extend(_tag(name, value) for name, value in tags.items())
+    lines.append('')
+
+    line = ''
+    for word in words:
+        if line and len(line) + 1 + len(word) > LINE_LENGTH:
+            lines.append(line)
+            line = word
+        else:
+            line = f"{line} {word}" if line else word
+    lines.append(line)
+    return '\n'.join(lines) + '\n'
+
+
+def write_pgn(games, stream, movement_service=None):
+    """Write every Game in 'games' to 'stream', one after another."""
+    movement_service = movement_service or MovementService()
+    count = 0
+    for game in games:
+        if count:
+            stream.write('\n')
+        stream.write(game_to_pgn(game, movement_service=movement_service))
+        count += 1
+    return count
+
+
+def export_repository(repository, stream, movement_service=None):
+    """Write every game of a GameRepository to 'stream' as PGN."""
+    games = (repository.find_by_id(game_id) for game_id in repository.list_game_ids())
+    return write_pgn((game for game in games if game is not None), stream, movement_service)
+
+
+def import_pgn(stream, repository, movement_service=None, board_factory=None, batch_size=500):
+    """
+    Save every game in 'stream' to 'repository', 'batch_size' games per
+    save_many call when the repository has one. Returns the number saved.
+    """
+    save_many = getattr(repository, 'save_many', None)
+    batch = []
+    count = 0
+    for record in read_pgn(stream, movement_service, board_factory):
+        if save_many is None:
+            repository.save(record.game)
+        else:
+            batch.append(record.game)
+            if len(batch) >= batch_size:
+                save_many(batch)
+                batch = []
+        count += 1
+    if batch:
+        save_many(batch)
+    return count
+
+
+def _result(game):
+    if game.status == 'CHECKMATE':
+        return '0-1' if game.current_player == Color.WHITE else '1-0'
+    if game.status in DRAW_STATUSES:
+        return '1/2-1/2'
+    return '*'
+
+
+def _tag(name, value):
+    escaped = str(value).replace('\\', '\\\\').replace('"', '\\"')
+    return f'[{name} "{escaped}"]'
@@ -0,0 +1,193 @@
+"""Opening books in the Polyglot .bin layout, read through mmap.
+
+A book is a sorted array of 16-byte big-endian entries:
+
+    key     8 bytes - hash of the position
+    move    2 bytes - bits 0-5 to square, 6-11 from square, 12-14
+                      promotion (0 none, 1 knight, 2 bishop, 3 rook,
+                      4 queen); squares count from a1 = 0 to h8 = 63 and
+                      castling is written as the king taking its own rook
+    weight  2 bytes - relative frequency of the move
+    learn   4 bytes - unused, written as 0
+
+Entries are sorted by key, so a lookup is a binary search over the mapped
+file and only the pages it touches are read from disk.
+
+The key is the standard Polyglot hash (adapters/polyglot_keys.py), so
+third-party .bin books can be read and books from build_book() work in
+other programs.
+"""
+
+import mmap
+import random
+import struct
+
+from adapters.pgn import iter_pgn_records, san_tokens
+from adapters.polyglot_keys import polyglot_key
+from domain.move import Move
+from domain.notation import STARTING_FEN, game_from_fen, parse_san
+from domain.piece import Color, PieceType
+from domain.services import MovementService
+from ports.opening_book import OpeningBookPort
+
+ENTRY = struct.Struct('>QHHI')
+KEY = struct.Struct('>Q')
+PROMOTIONS = (None, PieceType.KNIGHT, PieceType.BISHOP, PieceType.ROOK, PieceType.QUEEN)
+MAX_WEIGHT = 0xFFFF
+# Book weight of a move by the game's result, seen from the side that played it.
+RESULT_WEIGHTS = {'win': 2, 'draw': 1, 'loss': 0, 'unknown': 1}
+
+
+def _square_index(square):
+    (row, col) = square
+    return (7 - row) * 8 + col
+
+
+def _index_square(index):
+    return (7 - index // 8, index % 8)
+
+
+def encode_move(move, board):
+    """The 16-bit Polyglot code of 'move' on 'board'."""
+    (fr, fc) = move.from_square
+    (tr, tc) = move.to_square
+    piece = board.get_piece(fr, fc)
+    if piece is not None and piece.piece_type == PieceType.KING and abs(tc - fc) == 2:
+        tc = 7 if tc > fc else 0
+    promotion = PROMOTIONS.index(move.promotion)
+    return (promotion << 12) | (_square_index(move.from_square) << 6) | _square_index((tr, tc))
+
+
+def decode_move(code, board):
+    """The Move for Polyglot move code 'code' on 'board'."""
+    (fr, fc) = from_square = _index_square((code >> 6) & 0x3F)
+    (tr, tc) = _index_square(code & 0x3F)
+    piece = board.get_piece(fr, fc)
+    if piece is not None and piece.piece_type == PieceType.KING and fc == 4 and tr == fr and tc in (0, 7):
+        rook = board.get_piece(tr, tc)
+        if rook is not None and rook.color == piece.color and rook.piece_type == PieceType.ROOK:
+            tc = 6 if tc == 7 else 2
+    return Move(from_square, (tr, tc), PROMOTIONS[(code >> 12) & 0x7])
+
+
+class PolyglotBook(OpeningBookPort):
+    """
+    Read-only book mapped from 'path'. Lookups do not generate moves:
+    entries whose from square does not hold a piece of the side to move
+    (a hash collision) are dropped, and BookEngine checks the move it
+    picks with MovementService.
+    """
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        self._map = None
+        self.entries = 0
+        size = self._file.seek(0, 2)
+        if size:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.entries = size // ENTRY.size
+
+    def __len__(self):
+        return self.entries
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def lookup(self, key):
+        """The (move code, weight) pairs stored for 'key', in file order."""
+        data = self._map
+        low, high = 0, self.entries
+        while low < high:
+            middle = (low + high) // 2
+            if KEY.unpack_from(data, middle * ENTRY.size)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        found = []
+        while low < self.entries:
+            entry_key, code, weight, _ = ENTRY.unpack_from(data, low * ENTRY.size)
+            if entry_key != key:
+                break
+            found.append((code, weight))
+            low += 1
+        return found
+
+    def find_moves(self, game):
+        moves = []
+        board = game.board
+        for code, weight in self.lookup(polyglot_key(game)):
+            move = decode_move(code, board)
+            piece = board.get_piece(*move.from_square)
+            if piece is not None and piece.color == game.current_player:
+                moves.append((move, weight))
+        moves.sort(key=lambda pair: pair[1], reverse=True)
+        return moves
+
+
+def choose_book_move(moves, rng=random):
+    """Pick one of 'moves' ((Move, weight) pairs) with probability by weight."""
+    total = sum(weight for _, weight in moves)
+    if not total:
+        return None
+    pick = rng.randrange(total)
+    for move, weight in moves:
+        pick -= weight
+        if pick < 0:
+            return move
+    return None
+
+
+def build_book(stream, path, max_plies=20, movement_service=None):
+    """
+    Build a book at 'path' from the PGN games in 'stream', counting the
+    first 'max_plies' moves of every game weighted by RESULT_WEIGHTS.
+    A game with an illegal move contributes the moves before it. Returns
+    (games read, entries written).
+    """
+    movement_service = movement_service or MovementService()
+    counts = {}
+    games = 0
+    for tags, movetext in iter_pgn_records(stream):
+        games += 1
+        result = tags.get('Result', '*')
+        try:
+            game = game_from_fen(tags.get('FEN', STARTING_FEN))
+            for san in san_tokens(movetext)[:max_plies]:
+                move = parse_san(game, san, movement_service)
+                white = game.current_player == Color.WHITE
+                if result == '1/2-1/2':
+                    outcome = 'draw'
+                elif result in ('1-0', '0-1'):
+                    outcome = 'win' if (result == '1-0') == white else 'loss'
+                else:
+                    outcome = 'unknown'
+                weight = RESULT_WEIGHTS[outcome]
+                if weight:
+                    entry = (polyglot_key(game), encode_move(move, game.board))
+                    counts[entry] = counts.get(entry, 0) + weight
+                game.make_move(move)
+        except ValueError:
+            continue
+
+    by_key = {}
+    for (key, code), weight in counts.items():
+        by_key.setdefault(key, []).append((code, weight))
+    written = 0
+    with open(path, 'wb') as out:
+        for key in sorted(by_key):
+            moves = by_key[key]
+            heaviest = max(weight for _, weight in moves)
+            scale = min(1.0, MAX_WEIGHT / heaviest)
+            moves.sort(key=lambda pair: (-pair[1], pair[0]))
+            for code, weight in moves:
+                out.write(ENTRY.pack(key, code, max(1, int(weight * scale)), 0))
+                written += 1
+    return games, written
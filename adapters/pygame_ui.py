@@ -9,6 +9,7 @@ os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
 warnings.filterwarnings("ignore", category=UserWarning, module="pygame.pkgdata")
 
 import pygame
+from domain.piece import BLACK_PIECES, WHITE_PIECES
 from ports.ui_service import ChessUIService
 
 TILE_SIZE = 80
@@ -16,66 +17,151 @@ BOARD_SIZE = 8
 
 WHITE_COLOR = (240, 217, 181)
 BLACK_COLOR = (181, 136, 99)
+# Marks a square whose tile must be repainted whatever it holds.
+STALE = object()
 
 class PygameChessUI(ChessUIService):
-    def __init__(self):
+    """
+    Event driven: get_player_input sleeps in pygame.event.wait until a
+    click, a window event or the end of a message arrives, and the display
+    is updated at most 'max_fps' times a second, only when something
+    changed.
+    """
+    def __init__(self, max_fps=30):
         pygame.init()
         self.screen = pygame.display.set_mode((TILE_SIZE*BOARD_SIZE, TILE_SIZE*BOARD_SIZE))
         pygame.display.set_caption("Chess - Hexagonal Architecture Demo")
+        # Mouse motion and key presses would only wake the input loop.
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.MOUSEBUTTONDOWN, pygame.WINDOWEXPOSED,
+                                  pygame.VIDEOEXPOSE])
+        self.max_fps = max_fps
+        self.clock = pygame.time.Clock()
+        self.game = None
         self.font = pygame.font.Font("dejavu-sans.book.ttf", 48)
         # Storage for temporary on-screen messages
         self.message = None
         self.message_time = 0
         self.message_duration = 0
 
-    def draw_board(self, game):
-        board = game.board
+        # Rendered once: the empty board and every piece glyph. Rendering
+        # text is by far the most expensive part of a frame.
+        self.background = pygame.Surface(self.screen.get_size())
         for row in range(BOARD_SIZE):
             for col in range(BOARD_SIZE):
-                rect = (col*TILE_SIZE, row*TILE_SIZE, TILE_SIZE, TILE_SIZE)
                 color = WHITE_COLOR if (row+col) % 2 == 0 else BLACK_COLOR
-                pygame.draw.rect(self.screen, color, rect)
+                pygame.draw.rect(self.background, color, self._tile_rect(row, col))
+        self.glyphs = {}
+        for symbol in list(WHITE_PIECES.values()) + list(BLACK_PIECES.values()):
+            self.glyphs[symbol] = self.font.render(symbol, True, (0, 0, 0))
+        # What each square showed in the last frame (a symbol, None, or STALE),
+        # and the message surface and rect currently on screen.
+        self._shown = [STALE] * (BOARD_SIZE * BOARD_SIZE)
+        self._message_surface = None
+        self._overlay_rect = None
+        self._message_on_screen = False
+
+    def draw_board(self, game):
+        """
+        Repaint only the squares whose content changed since the last
+        frame, plus the message overlay, and push just those rects to the
+        display.
+        """
+        self.game = game
+        board = game.board
+        dirty = []
+
+        # Take the overlay down when its time is up; the squares under it
+        # are repainted below.
+        overlay = self._current_overlay()
+        if overlay != self._overlay_rect:
+            if self._overlay_rect is not None:
+                self._invalidate(self._overlay_rect)
+            self._overlay_rect = overlay
 
+        for row in range(BOARD_SIZE):
+            for col in range(BOARD_SIZE):
                 piece = board.get_piece(row, col)
-                if piece:
-                    text_surf = self.font.render(piece.unicode_symbol, True, (0, 0, 0))
-                    text_rect = text_surf.get_rect(center=(col*TILE_SIZE + TILE_SIZE//2,
-                                                           row*TILE_SIZE + TILE_SIZE//2))
-                    self.screen.blit(text_surf, text_rect)
-
-        # If there's a message, draw it centered on the board for a short time
-        if self.message:
-            elapsed = pygame.time.get_ticks() - self.message_time
-            if elapsed < self.message_duration:
-                msg_surf = self.font.render(self.message, True, (255, 0, 0))
-                msg_rect = msg_surf.get_rect(center=(TILE_SIZE*BOARD_SIZE//2,
-                                                     TILE_SIZE*BOARD_SIZE//2))
-                bg_rect = msg_rect.inflate(20, 20)
-                pygame.draw.rect(self.screen, (255, 255, 255), bg_rect)
-                pygame.draw.rect(self.screen, (0, 0, 0), bg_rect, 2)
-                self.screen.blit(msg_surf, msg_rect)
-            else:
-                self.message = None
-        pygame.display.flip()
+                symbol = piece.unicode_symbol if piece else None
+                index = row * BOARD_SIZE + col
+                if self._shown[index] == symbol:
+                    continue
+                self._shown[index] = symbol
+                rect = self._tile_rect(row, col)
+                self.screen.blit(self.background, rect, rect)
+                if symbol is not None:
+                    glyph = self.glyphs[symbol]
+                    self.screen.blit(glyph, glyph.get_rect(center=rect.center))
+                dirty.append(rect)
+
+        if overlay is not None and (overlay.collidelist(dirty) != -1 or not self._message_on_screen):
+            self._draw_overlay(overlay)
+            dirty.append(overlay)
+        self._message_on_screen = overlay is not None
+
+        if dirty:
+            self.clock.tick(self.max_fps)
+            pygame.display.update(dirty)
 
     def get_player_input(self, current_player):
-        # For simplicity, let's just do a basic event loop that waits for a click or keyboard
-        # You could refine to handle board clicks
+        """
+        Block until a board square is clicked and return it as (row, col).
+        While a message is showing, the wait times out when it expires so
+        the board can be redrawn without it.
+        """
         while True:
-            for event in pygame.event.get():
-                if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
-                if event.type == pygame.MOUSEBUTTONDOWN:
-                    # Convert mouse click to board coordinates
-                    x, y = pygame.mouse.get_pos()
-                    col = x // TILE_SIZE
-                    row = y // TILE_SIZE
-                    # For demonstration, let's just return a single square
-                    return (row, col)
+            timeout = 0  # wait indefinitely
+            if self.message:
+                remaining = self.message_duration - (pygame.time.get_ticks() - self.message_time)
+                timeout = max(remaining, 1)
+            event = pygame.event.wait(timeout)
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit()
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                # Convert mouse click to board coordinates
+                x, y = event.pos
+                return (y // TILE_SIZE, x // TILE_SIZE)
+            if event.type in (pygame.WINDOWEXPOSED, pygame.VIDEOEXPOSE):
+                # The window contents were lost: repaint everything.
+                self._invalidate(self.screen.get_rect())
+                self._message_on_screen = False
+            if self.game is not None:
+                self.draw_board(self.game)
 
     def show_message(self, message, duration=2000):
         """Display a transient message on screen for ``duration`` milliseconds."""
         self.message = message
         self.message_time = pygame.time.get_ticks()
         self.message_duration = duration
+        self._message_surface = self.font.render(message, True, (255, 0, 0))
+        self._message_on_screen = False
+
+    # -------------------------------------------------------------------------
+    #                          INTERNAL / HELPER METHODS
+    # -------------------------------------------------------------------------
+    def _tile_rect(self, row, col):
+        return pygame.Rect(col*TILE_SIZE, row*TILE_SIZE, TILE_SIZE, TILE_SIZE)
+
+    def _current_overlay(self):
+        """The rect of the message box while a message is showing, else None."""
+        if self.message and pygame.time.get_ticks() - self.message_time >= self.message_duration:
+            self.message = None
+            self._message_surface = None
+        if not self.message:
+            return None
+        msg_rect = self._message_surface.get_rect(center=(TILE_SIZE*BOARD_SIZE//2,
+                                                          TILE_SIZE*BOARD_SIZE//2))
+        return msg_rect.inflate(20, 20)
+
+    def _draw_overlay(self, bg_rect):
+        pygame.draw.rect(self.screen, (255, 255, 255), bg_rect)
+        pygame.draw.rect(self.screen, (0, 0, 0), bg_rect, 2)
+        self.screen.blit(self._message_surface, self._message_surface.get_rect(center=bg_rect.center))
+
+    def _invalidate(self, rect):
+        """Force the squares under 'rect' to be repainted."""
+        for row in range(BOARD_SIZE):
+            for col in range(BOARD_SIZE):
+                if self._tile_rect(row, col).colliderect(rect):
+                    self._shown[row * BOARD_SIZE + col] = STALE
@@ -0,0 +1,161 @@
+"""SQLite-backed game storage.
+
+One row per game. The game itself is a blob in the compact game codec
+(position and move history, typically a few dozen bytes); status,
+current_player (the side to move; games have no player names) and
+updated_at are columns of their own, indexed for listing.
+"""
+
+import sqlite3
+import threading
+import time
+import uuid
+from collections import namedtuple
+
+from adapters.game_codec import decode_game, encode_game
+from ports.game_repository import GameRepository
+
+# One row of list_games().
+GameSummary = namedtuple('GameSummary', ['id', 'status', 'current_player', 'updated_at'])
+
+SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS games (
+        id TEXT PRIMARY KEY,
+        status TEXT NOT NULL,
+        current_player TEXT NOT NULL,
+        updated_at REAL NOT NULL,
+        data BLOB NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS games_updated ON games (updated_at, id)",
+    "CREATE INDEX IF NOT EXISTS games_status ON games (status, updated_at, id)",
+    "CREATE INDEX IF NOT EXISTS games_player ON games (current_player, updated_at, id)",
+)
+
+UPSERT_SQL = """
+    INSERT INTO games (id, status, current_player, updated_at, data)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT (id) DO UPDATE SET
+        status = excluded.status,
+        current_player = excluded.current_player,
+        updated_at = excluded.updated_at,
+        data = excluded.data
+"""
+SELECT_SQL = "SELECT id, data FROM games WHERE id = ?"
+
+
+class SqliteGameRepository(GameRepository):
+    """
+    Stores games in an SQLite database in WAL mode, so readers do not block
+    the writer. Statements are fixed parameterized SQL, which sqlite3 keeps
+    prepared in its per-connection statement cache.
+
+    Besides the GameRepository port it offers list_games() for filtered,
+    keyset-paginated listing and save_many()/find_many() to move many games
+    in one transaction.
+
+    The one connection may be used from any thread (for instance behind
+    ExecutorGameRepository); a lock lets one call use it at a time.
+    """
+    def __init__(self, path="saved_games.db", board_factory=None):
+        self.board_factory = board_factory
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        with self._connection:
+            for statement in SCHEMA:
+                self._connection.execute(statement)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        with self._lock:
+            self._connection.close()
+
+    def save(self, game):
+        return self.save_many([game])[0]
+
+    def save_many(self, games):
+        """Save all 'games' in one transaction; returns their ids."""
+        rows = [self._to_row(game) for game in games]
+        with self._lock, self._connection:
+            self._connection.executemany(UPSERT_SQL, rows)
+        return [row[0] for row in rows]
+
+    def find_by_id(self, game_id):
+        with self._lock:
+            row = self._connection.execute(SELECT_SQL, (game_id,)).fetchone()
+        return self._from_row(row) if row else None
+
+    def find_many(self, game_ids):
+        """
+        Load the games with the given ids in one query. Returns a dict from
+        id to Game; missing ids are left out.
+        """
+        rows = []
+        game_ids = list(game_ids)
+        with self._lock:
+            # Stay under SQLite's limit on the number of bound parameters.
+            for start in range(0, len(game_ids), 500):
+                chunk = game_ids[start:start + 500]
+                placeholders = ', '.join('?' * len(chunk))
+                rows.extend(self._connection.execute(
+                    f"SELECT id, data FROM games WHERE id IN ({placeholders})", chunk
+                ))
+        return {row[0]: self._from_row(row) for row in rows}
+
+    def list_game_ids(self):
+        with self._lock:
+            rows = self._connection.execute("SELECT id FROM games ORDER BY updated_at, id").fetchall()
+        return [row[0] for row in rows]
+
+    def list_games(self, status=None, current_player=None, limit=100, cursor=None):
+        """
+        Return (summaries, next_cursor): up to 'limit' GameSummary rows,
+        most recently updated first, optionally filtered by status and side
+        to move. Pass next_cursor back to get the following page; it is
+        None on the last page.
+        """
+        conditions = []
+        params = []
+        if status is not None:
+            conditions.append("status = ?")
+            params.append(status)
+        if current_player is not None:
+            conditions.append("current_player = ?")
+            params.append(current_player)
+        if cursor is not None:
+            conditions.append("(updated_at, id) < (?, ?)")
+            params.extend(cursor)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._lock:
+            rows = self._connection.execute(
+                f"SELECT id, status, current_player, updated_at FROM games {where} "
+                "ORDER BY updated_at DESC, id DESC LIMIT ?",
+                params + [limit],
+            ).fetchall()
+        summaries = [GameSummary(*row) for row in rows]
+        next_cursor = None
+        if len(summaries) == limit:
+            next_cursor = (summaries[-1].updated_at, summaries[-1].id)
+        return summaries, next_cursor
+
+    # -------------------------------------------------------------------------
+    #                          INTERNAL / HELPER METHODS
+    # -------------------------------------------------------------------------
+    def _to_row(self, game):
+        game_id = getattr(game, 'id', None)
+        if not game_id:
+            game_id = str(uuid.uuid4())
+            setattr(game, 'id', game_id)
+        return (game_id, game.status, game.current_player, time.time(), encode_game(game))
+
+    def _from_row(self, row):
+        game_id, data = row
+        game = decode_game(data, self.board_factory)
+        game.id = game_id
+        return game
@@ -0,0 +1,458 @@
+"""Endgame tablebases built by retrograde analysis.
+
+Supported material is a lone king against king plus MATERIALS[name]. The
+tables are built with the strong side as White; positions where Black has
+the pieces are probed with the board flipped.
+
+A table is a file '<name>.tb': the magic b'CTB1', the number of entries as
+a little-endian uint32, then one byte per position index. A byte of 0 is a
+draw (or an index that is not a legal position); n > 0 means the position
+is decided and mate follows in n - 1 plies, the side to move winning if it
+is the strong side and losing otherwise.
+
+Position index, most significant first:
+
+    side to move   - 0 strong side, 1 lone king
+    strong king    - without pawns one of the 10 squares of the a1-d1-d4
+                     triangle, with pawns one of the 32 squares of files a-d
+    lone king      - 64 squares
+    each piece     - 64 squares, 48 for a pawn (ranks 2-7)
+
+Positions are brought into that range with the 8 symmetries of the board
+(left-right mirroring only when there are pawns). When the strong king is
+on the a1-h8 diagonal two symmetric indexes exist; the smaller one is used.
+
+Generation works backwards from the mates using the attack tables of
+domain/bitboard.py: a position with the lone king to move is lost once
+every one of its moves reaches a won position, and a position with the
+strong side to move is won once one of its moves reaches a lost one.
+Pawn promotions are looked up in the KQK and KRK tables, which KPK needs.
+"""
+
+import itertools
+import mmap
+import os
+import struct
+from array import array
+from collections import namedtuple
+
+from domain.bitboard import KING_ATTACKS, KNIGHT_ATTACKS, PAWN_ATTACKS, bishop_attacks, rook_attacks
+from domain.piece import Color, PieceType
+from domain.services import MovementService
+from domain.zobrist import castling_rights
+
+MATERIALS = {
+    'KQK': (PieceType.QUEEN,),
+    'KRK': (PieceType.ROOK,),
+    'KPK': (PieceType.PAWN,),
+    'KBNK': (PieceType.BISHOP, PieceType.KNIGHT),
+}
+# Tables a material's pawn promotions lead to, by promotion piece.
+PROMOTION_TABLES = {'KPK': {PieceType.QUEEN: 'KQK', PieceType.ROOK: 'KRK'}}
+MAGIC = b'CTB1'
+HEADER = struct.Struct('<4sI')
+FULL = (1 << 64) - 1
+
+# A probe result: 'WIN', 'LOSS' or 'DRAW' for the side to move, and the
+# number of plies until mate (0 for a draw or when already mated).
+TablebaseEntry = namedtuple('TablebaseEntry', ['result', 'plies'])
+
+
+def _symmetry(square, transpose, flip_rows, flip_cols):
+    row, col = divmod(square, 8)
+    if transpose:
+        row, col = col, row
+    if flip_rows:
+        row = 7 - row
+    if flip_cols:
+        col = 7 - col
+    return row * 8 + col
+
+
+# Square maps of the 8 board symmetries; the first is the identity and the
+# second the left-right mirror.
+SYMMETRIES = [
+    [_symmetry(square, transpose, flip_rows, flip_cols) for square in range(64)]
+    for transpose in (False, True) for flip_rows in (False, True) for flip_cols in (False, True)
+]
+TRIANGLE = [sq for sq in range(64) if sq % 8 <= 3 and 7 - sq // 8 <= sq % 8]
+QUEENSIDE = [sq for sq in range(64) if sq % 8 <= 3]
+PAWN_SQUARES = list(range(8, 56))
+
+
+def _bits(mask):
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _attacks(piece_type, square, occupied):
+    """Squares a white piece on 'square' attacks."""
+    if piece_type == PieceType.KNIGHT:
+        return KNIGHT_ATTACKS[square]
+    if piece_type == PieceType.BISHOP:
+        return bishop_attacks(square, occupied)
+    if piece_type == PieceType.ROOK:
+        return rook_attacks(square, occupied)
+    if piece_type == PieceType.QUEEN:
+        return rook_attacks(square, occupied) | bishop_attacks(square, occupied)
+    if piece_type == PieceType.PAWN:
+        return PAWN_ATTACKS[Color.WHITE][square]
+    return KING_ATTACKS[square]
+
+
+class TableLayout:
+    """The position index of one material."""
+    def __init__(self, pieces):
+        self.pieces = pieces
+        pawns = PieceType.PAWN in pieces
+        king_squares = QUEENSIDE if pawns else TRIANGLE
+        symmetries = SYMMETRIES[:2] if pawns else SYMMETRIES
+        self.king_slot = {square: slot for slot, square in enumerate(king_squares)}
+        self.piece_squares = [PAWN_SQUARES if piece == PieceType.PAWN else range(64) for piece in pieces]
+        self.piece_slots = [{square: slot for slot, square in enumerate(squares)}
+                            for squares in self.piece_squares]
+        self.radices = [len(king_squares), 64] + [len(squares) for squares in self.piece_squares]
+        self.king_squares = king_squares
+        self.size = 2
+        for radix in self.radices:
+            self.size *= radix
+        # For every strong king square, the symmetries that bring it into range.
+        self.symmetries = [[symmetry for symmetry in symmetries if symmetry[square] in self.king_slot]
+                           for square in range(64)]
+
+    def index(self, side, squares):
+        """Index of the position (strong king, lone king, pieces...) with 'side' to move."""
+        best = None
+        for symmetry in self.symmetries[squares[0]]:
+            index = side * self.radices[0] + self.king_slot[symmetry[squares[0]]]
+            index = index * 64 + symmetry[squares[1]]
+            for slots, square in zip(self.piece_slots, squares[2:]):
+                index = index * len(slots) + slots[symmetry[square]]
+            if best is None or index < best:
+                best = index
+        return best
+
+    def position(self, index):
+        """(side, squares) of 'index'; the inverse of index()."""
+        slots = []
+        for radix in reversed(self.radices):
+            index, slot = divmod(index, radix)
+            slots.append(slot)
+        slots.reverse()
+        squares = [self.king_squares[slots[0]], slots[1]]
+        squares.extend(squares_of[slot] for squares_of, slot in zip(self.piece_squares, slots[2:]))
+        return index, tuple(squares)
+
+    def positions(self, side):
+        """Yield (index, squares) of every index with 'side' to move that index() returns."""
+        index = side * (self.size // 2)
+        for squares in itertools.product(self.king_squares, range(64), *self.piece_squares):
+            if len(self.symmetries[squares[0]]) == 1 or self.index(side, squares) == index:
+                yield index, squares
+            index += 1
+
+    def is_legal(self, side, squares):
+        """No two pieces on a square, kings apart, and the side not to move not in check."""
+        if len(set(squares)) != len(squares) or KING_ATTACKS[squares[0]] >> squares[1] & 1:
+            return False
+        if side == 0:
+            occupied = 0
+            for square in squares:
+                occupied |= 1 << square
+            for piece, square in zip(self.pieces, squares[2:]):
+                if _attacks(piece, square, occupied) >> squares[1] & 1:
+                    return False
+        return True
+
+    def lone_king_moves(self, squares):
+        """
+        (in check, can capture, targets) for the lone king to move: whether
+        it is attacked, whether it can take an undefended piece, and the
+        squares it can step to without capturing.
+        """
+        king, lone = squares[0], squares[1]
+        white = 1 << king
+        for square in squares[2:]:
+            white |= 1 << square
+        # The lone king does not block: it cannot step back along a ray.
+        attacked = KING_ATTACKS[king]
+        for piece, square in zip(self.pieces, squares[2:]):
+            attacked |= _attacks(piece, square, white)
+        targets = KING_ATTACKS[lone] & ~attacked
+        return bool(attacked >> lone & 1), bool(targets & white), list(_bits(targets & ~white))
+
+    def strong_unmoves(self, squares):
+        """Yield the positions, strong side to move, that lead to 'squares' in one move."""
+        occupied = 0
+        for square in squares:
+            occupied |= 1 << square
+        empty = ~occupied & FULL
+        for position, square in enumerate(squares):
+            if position == 1:
+                continue
+            piece = PieceType.KING if position == 0 else self.pieces[position - 2]
+            if piece == PieceType.PAWN:
+                origins = 0
+                if square + 8 < 56 and empty >> (square + 8) & 1:
+                    origins |= 1 << (square + 8)
+                    if square // 8 == 4 and empty >> (square + 16) & 1:
+                        origins |= 1 << (square + 16)
+            else:
+                origins = _attacks(piece, square, occupied) & empty
+            for origin in _bits(origins):
+                yield squares[:position] + (origin,) + squares[position + 1:]
+
+    def lone_unmoves(self, squares):
+        """Yield the positions, lone king to move, that lead to 'squares' in one move."""
+        occupied = 0
+        for square in squares:
+            occupied |= 1 << square
+        origins = KING_ATTACKS[squares[1]] & ~occupied & ~KING_ATTACKS[squares[0]] & FULL
+        for origin in _bits(origins):
+            yield (squares[0], origin) + squares[2:]
+
+
+LAYOUTS = {name: TableLayout(pieces) for name, pieces in MATERIALS.items()}
+
+
+def generate_table(name, promotion_tables=None, progress=None):
+    """
+    Build the table of material 'name' and return it as a bytearray.
+    'promotion_tables' maps the PROMOTION_TABLES names to their bytes.
+    'progress' is called with the distance (in plies) being expanded.
+    """
+    layout = LAYOUTS[name]
+    values = bytearray(layout.size)
+    # Indexes to expand by distance in plies; arrays keep millions of them small.
+    buckets = {0: array('I')}
+
+    # Mates, and (for pawns) wins by promoting into a lost position.
+    for index, squares in layout.positions(1):
+        if layout.is_legal(1, squares):
+            in_check, can_capture, targets = layout.lone_king_moves(squares)
+            if in_check and not can_capture and not targets:
+                values[index] = 1
+                buckets[0].append(index)
+    for piece, table_name in PROMOTION_TABLES.get(name, {}).items():
+        table = promotion_tables[table_name]
+        target_layout = LAYOUTS[table_name]
+        pawn = layout.pieces.index(PieceType.PAWN) + 2
+        for index, squares in layout.positions(0):
+            square = squares[pawn]
+            if square // 8 != 1 or square - 8 in squares or not layout.is_legal(0, squares):
+                continue
+            promoted = squares[:pawn] + (square - 8,) + squares[pawn + 1:]
+            value = table[target_layout.index(1, promoted)]
+            if value:
+                buckets.setdefault(value, array('I')).append(index)
+
+    plies = 0
+    while buckets:
+        if progress is not None:
+            progress(plies)
+        for index in buckets.pop(plies, ()):
+            if values[index] == 0:
+                values[index] = plies + 1  # a promotion win
+            elif values[index] != plies + 1:
+                continue
+            side, squares = layout.position(index)
+            if side == 1:
+                for previous in layout.strong_unmoves(squares):
+                    if layout.is_legal(0, previous):
+                        previous_index = layout.index(0, previous)
+                        if values[previous_index] == 0:
+                            values[previous_index] = plies + 2
+                            buckets.setdefault(plies + 1, array('I')).append(previous_index)
+            else:
+                for previous in layout.lone_unmoves(squares):
+                    previous_index = layout.index(1, previous)
+                    if values[previous_index]:
+                        continue
+                    in_check, can_capture, targets = layout.lone_king_moves(previous)
+                    if can_capture:
+                        continue
+                    # Lost once every move reaches a position won in at most 'plies'.
+                    if all(0 < values[layout.index(0, (previous[0], target) + previous[2:])] <= plies + 1
+                           for target in targets):
+                        values[previous_index] = plies + 2
+                        buckets.setdefault(plies + 1, array('I')).append(previous_index)
+        plies += 1
+    # Positions never reached stay 0: draws, and indexes of illegal positions.
+    return values
+
+
+def write_table(path, values):
+    with open(path, 'wb') as out:
+        out.write(HEADER.pack(MAGIC, len(values)))
+        out.write(values)
+
+
+def generate_tables(directory, names=None, progress=None):
+    """
+    Write the tables 'names' (default all of MATERIALS) to 'directory',
+    generating the tables they depend on first. Tables already present
+    are reused. Returns the paths written.
+    """
+    os.makedirs(directory, exist_ok=True)
+    names = list(names or MATERIALS)
+    written = []
+    done = {}
+
+    def build(name):
+        if name in done:
+            return done[name]
+        path = os.path.join(directory, name + '.tb')
+        if os.path.exists(path):
+            with open(path, 'rb') as stream:
+                done[name] = stream.read()[HEADER.size:]
+            return done[name]
+        dependencies = {table: build(table) for table in PROMOTION_TABLES.get(name, {}).values()}
+        values = generate_table(name, dependencies,
+                                (lambda plies: progress(name, plies)) if progress else None)
+        write_table(path, values)
+        written.append(path)
+        done[name] = values
+        return values
+
+    for name in names:
+        if name not in MATERIALS:
+            raise ValueError(f"Unknown tablebase material: {name!r}")
+        build(name)
+    return written
+
+
+class Tablebases:
+    """
+    Probes the tables in 'directory'. Each table is memory mapped the first
+    time a position with its material is probed; missing tables make
+    probe() return None.
+    """
+    def __init__(self, directory, movement_service=None):
+        self.directory = directory
+        self.movement_service = movement_service or MovementService()
+        self._tables = {}
+        self._files = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        for table in self._tables.values():
+            if table is not None:
+                table.close()
+        for stream in self._files:
+            stream.close()
+        self._tables = {}
+        self._files = []
+
+    def probe(self, game):
+        """
+        TablebaseEntry for 'game', or None when its material is not in a
+        table (or castling is still possible).
+        """
+        found = self._lookup(game)
+        if found is None:
+            return None
+        name, side, squares = found
+        table = self._table(name)
+        if table is None:
+            return None
+        value = table[HEADER.size + LAYOUTS[name].index(side, squares)]
+        if value == 0:
+            return TablebaseEntry('DRAW', 0)
+        return TablebaseEntry('WIN' if side == 0 else 'LOSS', value - 1)
+
+    def best_move(self, game):
+        """
+        The legal move with the best tablebase outcome: the quickest mate
+        when winning, a draw if there is one, otherwise the slowest loss.
+        None when the position is not in the tables.
+        """
+        if self.probe(game) is None:
+            return None
+        best = None
+        best_rank = None
+        for move in self.movement_service.generate_legal_moves(game):
+            undo = game.make_move(move)
+            try:
+                entry = self.probe(game)
+                if entry is None and not self.movement_service.has_legal_move(game):
+                    entry = TablebaseEntry('LOSS' if self.movement_service.is_in_check(game) else 'DRAW', 0)
+                if entry is None:
+                    entry = TablebaseEntry('DRAW', 0) if _bare(game.board) else None
+            finally:
+                game.unmake_move(undo)
+            if entry is None:
+                continue
+            # Ranked from the mover's point of view, best first.
+            if entry.result == 'LOSS':
+                rank = (0, entry.plies)
+            elif entry.result == 'DRAW':
+                rank = (1, 0)
+            else:
+                rank = (2, -entry.plies)
+            if best_rank is None or rank < best_rank:
+                best, best_rank = move, rank
+        return best
+
+    # -------------------------------------------------------------------------
+    #                          INTERNAL / HELPER METHODS
+    # -------------------------------------------------------------------------
+    def _table(self, name):
+        if name not in self._tables:
+            path = os.path.join(self.directory, name + '.tb')
+            table = None
+            if os.path.exists(path):
+                stream = open(path, 'rb')
+                self._files.append(stream)
+                table = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+                magic, size = HEADER.unpack_from(table)
+                if magic != MAGIC or size != LAYOUTS[name].size:
+                    raise ValueError(f"Not a {name} tablebase: {path}")
+            self._tables[name] = table
+        return self._tables[name]
+
+    def _lookup(self, game):
+        """(material name, side, squares) for 'game' in table orientation, or None."""
+        board = game.board
+        kings = {}
+        pieces = {Color.WHITE: [], Color.BLACK: []}
+        for row in range(8):
+            for col in range(8):
+                piece = board.get_piece(row, col)
+                if piece is None:
+                    continue
+                if piece.piece_type == PieceType.KING:
+                    kings[piece.color] = row * 8 + col
+                else:
+                    pieces[piece.color].append((piece.piece_type, row * 8 + col))
+                    if len(pieces[piece.color]) > 2:
+                        return None
+        if len(kings) != 2 or castling_rights(board):
+            return None
+        if pieces[Color.WHITE] and pieces[Color.BLACK]:
+            return None
+        strong = Color.WHITE if pieces[Color.WHITE] else Color.BLACK
+        weak = Color.BLACK if strong == Color.WHITE else Color.WHITE
+        for name, material in MATERIALS.items():
+            if sorted(material) != sorted(piece_type for piece_type, _ in pieces[strong]):
+                continue
+            by_type = dict(pieces[strong])
+            squares = (kings[strong], kings[weak]) + tuple(by_type[piece_type] for piece_type in material)
+            if strong == Color.BLACK:
+                squares = tuple(square ^ 56 for square in squares)  # flip the board
+            return name, 0 if game.current_player == strong else 1, squares
+        return None
+
+
+def _bare(board):
+    """True when neither side has mating material left (kings and at most one minor piece)."""
+    others = [piece.piece_type for row in range(8) for col in range(8)
+              for piece in (board.get_piece(row, col),)
+              if piece is not None and piece.piece_type != PieceType.KING]
+    return not others or (len(others) == 1 and others[0] in (PieceType.BISHOP, PieceType.KNIGHT))
@@ -0,0 +1,22 @@
+"""Play perfect endgames from tablebases before falling back to search."""
+
+from ports.chess_engine import ChessEnginePort
+
+
+class TablebaseEngine(ChessEnginePort):
+    """
+    Plays the tablebase move whenever the position's material is in
+    'tablebases' (adapters.tablebase.Tablebases) and asks 'engine'
+    otherwise. 'probes' counts the moves answered from the tables.
+    """
+    def __init__(self, tablebases, engine):
+        self.tablebases = tablebases
+        self.engine = engine
+        self.probes = 0
+
+    def find_best_move(self, game):
+        move = self.tablebases.best_move(game)
+        if move is not None:
+            self.probes += 1
+            return move
+        return self.engine.find_best_move(game)
@@ -0,0 +1,56 @@
+import sys
+
+from domain.notation import FILES, parse_square
+from domain.piece import Color
+from ports.ui_service import ChessUIService
+
+class TextChessUI(ChessUIService):
+    """
+    Terminal UI: prints the board as letters (uppercase white) and reads
+    squares like 'e2', or a whole move like 'e2e4', one per line.
+    """
+    def __init__(self, input_stream=None, output=None):
+        self.input_stream = input_stream or sys.stdin
+        self.output = output or sys.stdout
+        # Second square of a move typed as one word, returned on the next call.
+        self._pending = []
+        self._last_drawn = None
+
+    def draw_board(self, game):
+        lines = []
+        for row in range(8):
+            cells = []
+            for col in range(8):
+                piece = game.board.get_piece(row, col)
+                if piece is None:
+                    cells.append('.')
+                elif piece.color == Color.WHITE:
+                    cells.append(piece.piece_type)
+                else:
+                    cells.append(piece.piece_type.lower())
+            lines.append(f"{8 - row} {' '.join(cells)}")
+        lines.append(f"  {' '.join(FILES)}")
+        text = '\n'.join(lines)
+        # The game loop draws after every pick; print only what changed.
+        if text != self._last_drawn:
+            self._last_drawn = text
+            print(text, file=self.output)
+
+    def get_player_input(self, current_player):
+        while not self._pending:
+            print(f"{current_player} to move: ", end='', file=self.output, flush=True)
+            line = self.input_stream.readline()
+            if not line:
+                raise EOFError("End of input")
+            word = line.strip().lower()
+            try:
+                if len(word) == 4:
+                    self._pending = [parse_square(word[0:2]), parse_square(word[2:4])]
+                else:
+                    self._pending = [parse_square(word)]
+            except ValueError as ex:
+                self.show_message(str(ex))
+        return self._pending.pop(0)
+
+    def show_message(self, message, duration=2000):
+        print(message, file=self.output)
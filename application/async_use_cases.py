@@ -0,0 +1,70 @@
+# async_use_cases.py
+
+import asyncio
+from contextlib import asynccontextmanager
+
+from application.use_cases import MovePieceUseCase, StartGameUseCase
+from domain.game import Game
+from domain.piece import Color
+
+
+class GameLocks:
+    """
+    One asyncio.Lock per game id, created on demand and dropped once no
+    task holds or waits for it. Moves on the same game run one at a time;
+    moves on different games do not wait for each other.
+    """
+    def __init__(self):
+        # game_id -> [lock, number of tasks holding or waiting for it]
+        self._locks = {}
+
+    def __len__(self):
+        return len(self._locks)
+
+    @asynccontextmanager
+    async def hold(self, game_id):
+        entry = self._locks.get(game_id)
+        if entry is None:
+            entry = self._locks[game_id] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._locks[game_id]
+
+
+class AsyncStartGameUseCase:
+    """StartGameUseCase for an AsyncGameRepository."""
+    def __init__(self, game_repository, board_factory=None):
+        self.game_repository = game_repository
+        self._start_game = StartGameUseCase(None, board_factory)
+
+    async def execute(self):
+        game = Game(self._start_game._create_initial_board(), Color.WHITE)
+        return await self.game_repository.save(game)
+
+
+class AsyncMovePieceUseCase:
+    """
+    MovePieceUseCase for an AsyncGameRepository. Load, validate, move and
+    save happen under the game's lock in 'locks', so concurrent requests
+    for one game see each other's moves. Share one GameLocks between every
+    use case that changes games.
+    """
+    def __init__(self, game_repository, movement_service=None, locks=None):
+        self.game_repository = game_repository
+        self.locks = locks or GameLocks()
+        self._move_piece = MovePieceUseCase(None, movement_service)
+        self.movement_service = self._move_piece.movement_service
+
+    async def execute(self, game_id, from_square, to_square, promotion=None):
+        async with self.locks.hold(game_id):
+            game = await self.game_repository.find_by_id(game_id)
+            if not game:
+                raise Exception(f"Game with id={game_id} not found.")
+            self._move_piece.apply(game, from_square, to_square, promotion)
+            await self.game_repository.save(game)
+            return game
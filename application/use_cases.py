@@ -8,9 +8,12 @@ from domain.services import MovementService
 class StartGameUseCase:
     """
     Sets up a new Game with all pieces in standard positions and returns a game_id.
+    The board representation is chosen with 'board_factory' (e.g. BitboardBoard).
     """
-    def __init__(self, game_repository):
+    def __init__(self, game_repository, board_factory=None):
         self.game_repository = game_repository
+        # If no board_factory is passed in, use the default 8x8 grid Board.
+        self.board_factory = board_factory or Board
 
     def execute(self):
         board = self._create_initial_board()
@@ -19,7 +22,7 @@ class StartGameUseCase:
         return game_id
 
     def _create_initial_board(self):
-        board = Board()
+        board = self.board_factory()
 
         # --- Place Black pieces (top side) ---
         # Row 0: R, N, B, Q, K, B, N, R
@@ -65,25 +68,55 @@ class MovePieceUseCase:
         # If no movement_service is passed in, create a default one.
         self.movement_service = movement_service or MovementService()
 
-    def execute(self, game_id, from_square, to_square):
+    def execute(self, game_id, from_square, to_square, promotion=None):
         """
         from_square, to_square are tuples like (row, col).
+        promotion is the PieceType a pawn reaching the last rank becomes
+        (defaults to a queen).
         """
         game = self.game_repository.find_by_id(game_id)
         if not game:
             raise Exception(f"Game with id={game_id} not found.")
 
+        self.apply(game, from_square, to_square, promotion)
+
+        # Save updated game
+        self.game_repository.save(game)
+        return game
+
+    def apply(self, game, from_square, to_square, promotion=None):
+        """
+        Validate and play the move on an already loaded game, updating its
+        status. Raises if the move is invalid or the game is over. Nothing
+        is saved.
+        """
+        if game.is_finished():
+            raise Exception(f"Game is over ({game.status})")
+
         # Validate the move
         if not self.movement_service.is_valid_move(game, from_square, to_square):
             raise Exception("Invalid move")
 
         # Perform the move
-        game.move_piece(from_square, to_square)
+        game.move_piece(from_square, to_square, promotion)
 
-        # Check if it’s checkmate
-        if self.movement_service.is_checkmate(game):
-            game.status = 'CHECKMATE'
+        # Mate, stalemate and the draw rules
+        status = self.movement_service.end_status(game)
+        if status:
+            game.status = status
 
-        # Save updated game
-        self.game_repository.save(game)
-        return game
+
+class FindBestMoveUseCase:
+    """
+    Asks a chess engine (a ChessEnginePort) for the move to play in a saved
+    game. The move is returned, not played; pass it to MovePieceUseCase.
+    """
+    def __init__(self, game_repository, engine):
+        self.game_repository = game_repository
+        self.engine = engine
+
+    def execute(self, game_id):
+        game = self.game_repository.find_by_id(game_id)
+        if not game:
+            raise Exception(f"Game with id={game_id} not found.")
+        return self.engine.find_best_move(game)
@@ -0,0 +1,35 @@
+"""Build an opening book from a PGN collection.
+
+Run from the project root:
+
+    python build_book.py games.pgn book.bin             # first 20 plies of every game
+    python build_book.py games.pgn book.bin --plies 30
+    python main.py --computer black --book book.bin
+
+See adapters/polyglot_book.py for the file layout.
+"""
+
+import argparse
+import sys
+import time
+
+from adapters.polyglot_book import build_book
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Opening book builder.")
+    parser.add_argument('pgn', help="PGN collection to read")
+    parser.add_argument('book', help="book file to write")
+    parser.add_argument('--plies', type=int, default=20, help="moves of each game to include (default 20)")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    with open(args.pgn, encoding='utf-8', errors='replace') as stream:
+        games, entries = build_book(stream, args.book, max_plies=args.plies)
+    print(f"{games} games, {entries} book entries written to {args.book} "
+          f"in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
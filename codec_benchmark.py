@@ -0,0 +1,85 @@
+"""Compare the compact game codec with pickle: size and speed.
+
+Run from the project root:
+
+    python codec_benchmark.py                       # games in saved_games/ plus random games
+    python codec_benchmark.py --games 500 --plies 80
+    python codec_benchmark.py --directory other_saves
+
+Every game is encoded and decoded with pickle, the binary codec and the
+text form; the table shows average bytes per game and games per second.
+"""
+
+import argparse
+import pickle
+import random
+import sys
+import time
+
+from adapters.file_game_repository import FileGameRepository
+from adapters.game_codec import decode_game, encode_game, game_from_text, game_to_text
+from domain.notation import STARTING_FEN, game_from_fen
+from domain.services import MovementService
+
+FORMATS = (
+    ('pickle', pickle.dumps, pickle.loads),
+    ('codec', encode_game, decode_game),
+    ('text', game_to_text, game_from_text),
+)
+
+
+def random_games(count, plies, seed=1):
+    """Games of up to 'plies' random legal moves from the start position."""
+    rng = random.Random(seed)
+    movement_service = MovementService(cache_size=0)
+    games = []
+    for _ in range(count):
+        game = game_from_fen(STARTING_FEN)
+        for _ in range(plies):
+            moves = movement_service.generate_legal_moves(game)
+            if not moves:
+                break
+            game.make_move(rng.choice(moves))
+        games.append(game)
+    return games
+
+
+def measure(games, encode, decode, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        encoded = [encode(game) for game in games]
+    encode_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for data in encoded:
+            decode(data)
+    decode_time = time.perf_counter() - start
+    size = sum(len(data) for data in encoded) / len(games)
+    runs = len(games) * repeat
+    return size, runs / max(encode_time, 1e-9), runs / max(decode_time, 1e-9)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Game codec size and speed benchmark.")
+    parser.add_argument('--directory', default='saved_games', help="saved games to include (default saved_games)")
+    parser.add_argument('--games', type=int, default=200, help="random games to generate (default 200)")
+    parser.add_argument('--plies', type=int, default=60, help="moves per random game (default 60)")
+    parser.add_argument('--repeat', type=int, default=3, help="times each game is encoded and decoded")
+    args = parser.parse_args(argv)
+
+    repository = FileGameRepository(args.directory)
+    saved = [repository.find_by_id(game_id) for game_id in repository.list_game_ids()]
+    games = saved + random_games(args.games, args.plies)
+    if not games:
+        print("No games to measure.")
+        return 1
+    print(f"{len(saved)} saved + {len(games) - len(saved)} random games")
+    print(f"{'format':8} {'bytes/game':>11} {'encode/s':>10} {'decode/s':>10}")
+    for name, encode, decode in FORMATS:
+        size, encode_rate, decode_rate = measure(games, encode, decode, args.repeat)
+        print(f"{name:8} {size:11.1f} {encode_rate:10.0f} {decode_rate:10.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
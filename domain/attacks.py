@@ -0,0 +1,93 @@
+"""Precomputed attack tables and reverse attack detection.
+
+Every table is indexed by square number ``row * 8 + col`` and holds
+(row, col) squares, so lookups never need bounds checks.
+"""
+
+from domain.piece import Color, PieceType
+
+KNIGHT_OFFSETS = ((-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1))
+KING_OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+STRAIGHT_DIRECTIONS = ((-1, 0), (1, 0), (0, -1), (0, 1))
+DIAGONAL_DIRECTIONS = ((-1, -1), (-1, 1), (1, -1), (1, 1))
+
+
+def _on_board(row, col):
+    return 0 <= row < 8 and 0 <= col < 8
+
+
+def _step_table(offsets):
+    return tuple(
+        tuple((row + dr, col + dc) for (dr, dc) in offsets if _on_board(row + dr, col + dc))
+        for row in range(8)
+        for col in range(8)
+    )
+
+
+def _ray(row, col, dr, dc):
+    squares = []
+    row, col = row + dr, col + dc
+    while _on_board(row, col):
+        squares.append((row, col))
+        row, col = row + dr, col + dc
+    return tuple(squares)
+
+
+def _ray_table(directions):
+    return tuple(
+        tuple(ray for ray in (_ray(row, col, dr, dc) for (dr, dc) in directions) if ray)
+        for row in range(8)
+        for col in range(8)
+    )
+
+
+KNIGHT_TARGETS = _step_table(KNIGHT_OFFSETS)
+KING_TARGETS = _step_table(KING_OFFSETS)
+# Rays running outward from each square, nearest square first.
+STRAIGHT_RAYS = _ray_table(STRAIGHT_DIRECTIONS)
+DIAGONAL_RAYS = _ray_table(DIAGONAL_DIRECTIONS)
+# Squares a pawn of the given color must stand on to attack each square.
+# White pawns move up (row decreases) so they attack from the row below.
+PAWN_ATTACKERS = {
+    Color.WHITE: _step_table(((1, -1), (1, 1))),
+    Color.BLACK: _step_table(((-1, -1), (-1, 1))),
+}
+
+_STRAIGHT_SLIDERS = (PieceType.ROOK, PieceType.QUEEN)
+_DIAGONAL_SLIDERS = (PieceType.BISHOP, PieceType.QUEEN)
+
+
+def is_square_attacked(board, square, by_color):
+    """
+    Return True if any piece of 'by_color' attacks 'square' on 'board'.
+
+    Instead of asking every enemy piece whether it can reach the square, look
+    outward from the square: the pawn, knight and king squares that could
+    attack it, and the first piece along each ray.
+    """
+    (row, col) = square
+    sq = row * 8 + col
+    get_piece = board.get_piece
+
+    for (r, c) in PAWN_ATTACKERS[by_color][sq]:
+        piece = get_piece(r, c)
+        if piece and piece.color == by_color and piece.piece_type == PieceType.PAWN:
+            return True
+    for (r, c) in KNIGHT_TARGETS[sq]:
+        piece = get_piece(r, c)
+        if piece and piece.color == by_color and piece.piece_type == PieceType.KNIGHT:
+            return True
+    for (r, c) in KING_TARGETS[sq]:
+        piece = get_piece(r, c)
+        if piece and piece.color == by_color and piece.piece_type == PieceType.KING:
+            return True
+
+    for rays, sliders in ((STRAIGHT_RAYS[sq], _STRAIGHT_SLIDERS), (DIAGONAL_RAYS[sq], _DIAGONAL_SLIDERS)):
+        for ray in rays:
+            for (r, c) in ray:
+                piece = get_piece(r, c)
+                if piece:
+                    if piece.color == by_color and piece.piece_type in sliders:
+                        return True
+                    break
+    return False
@@ -0,0 +1,353 @@
+"""Vectorized move validation for many games at once.
+
+Requires NumPy. Boards are stacked into an (N, 64) array of piece codes and
+the attack maps, pins and check status of all requests are computed with
+array operations. Results match MovementService exactly: the few positions
+the vectorized tests cannot settle (whether a side with its king boxed in
+still has a legal move) are handed to MovementService.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from domain.piece import Color, PieceType
+from domain.services import MovementService
+from domain.zobrist import castling_rights
+
+# Piece codes: 0 empty, 1-6 white, 7-12 black, in this type order.
+CODE_TYPES = (PieceType.PAWN, PieceType.KNIGHT, PieceType.BISHOP,
+              PieceType.ROOK, PieceType.QUEEN, PieceType.KING)
+PIECE_CODES = {
+    (color, piece_type): offset + index + 1
+    for offset, color in ((0, Color.WHITE), (6, Color.BLACK))
+    for index, piece_type in enumerate(CODE_TYPES)
+}
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(1, 7)
+WHITE, BLACK = 0, 1
+
+# How many attack queries are evaluated together; bounds the
+# (chunk, 64, 64) temporary used for blocker tests.
+CHUNK_SIZE = 2048
+
+# Validity of one request and, if valid, the status the game has after the
+# move: 'CHECKMATE', 'STALEMATE', 'CHECK' or 'ONGOING'.
+BatchResult = namedtuple('BatchResult', ['valid', 'status'])
+
+
+def _build_tables():
+    rows, cols = np.divmod(np.arange(64), 8)
+    dr = rows[None, :] - rows[:, None]
+    dc = cols[None, :] - cols[:, None]
+    adr, adc = np.abs(dr), np.abs(dc)
+    not_same = ~np.eye(64, dtype=bool)
+
+    straight = ((dr == 0) | (dc == 0)) & not_same
+    diagonal = (adr == adc) & not_same
+    knight = ((adr == 1) & (adc == 2)) | ((adr == 2) & (adc == 1))
+    king = (np.maximum(adr, adc) == 1)
+
+    between = np.zeros((64, 64, 64), dtype=bool)
+    for s in range(64):
+        for t in range(64):
+            if straight[s, t] or diagonal[s, t]:
+                step_r, step_c = np.sign(dr[s, t]), np.sign(dc[s, t])
+                r, c = rows[s] + step_r, cols[s] + step_c
+                while (r, c) != (rows[t], cols[t]):
+                    between[s, t, r * 8 + c] = True
+                    r, c = r + step_r, c + step_c
+
+    # pawn_attacks[color, s, t]: a pawn of 'color' on s attacks t.
+    pawn_attacks = np.zeros((2, 64, 64), dtype=bool)
+    pawn_attacks[WHITE] = (dr == -1) & (adc == 1)
+    pawn_attacks[BLACK] = (dr == 1) & (adc == 1)
+
+    # geometry[code, s, t]: the piece 'code' on s would attack t on an empty board.
+    geometry = np.zeros((13, 64, 64), dtype=bool)
+    for offset, color in ((0, WHITE), (6, BLACK)):
+        geometry[offset + PAWN] = pawn_attacks[color]
+        geometry[offset + KNIGHT] = knight
+        geometry[offset + BISHOP] = diagonal
+        geometry[offset + ROOK] = straight
+        geometry[offset + QUEEN] = diagonal | straight
+        geometry[offset + KING] = king
+    return straight, diagonal, knight, king, between, geometry
+
+
+STRAIGHT, DIAGONAL, KNIGHT_MOVES, KING_MOVES, BETWEEN, GEOMETRY = _build_tables()
+SQUARES = np.arange(64)
+# Each square's king neighbours padded with -1, for "can the king step out" tests.
+KING_NEIGHBOURS = np.full((64, 8), -1)
+for _sq in range(64):
+    _targets = np.flatnonzero(KING_MOVES[_sq])
+    KING_NEIGHBOURS[_sq, :len(_targets)] = _targets
+
+
+class BatchMoveValidator:
+    """
+    Validates N (game, from_square, to_square) requests in one call.
+
+    validate() returns one BatchResult per request, equal to what
+    MovementService.is_valid_move followed by is_checkmate / is_stalemate /
+    is_in_check on the moved game would report. Games are not modified.
+    """
+    def __init__(self, movement_service=None):
+        self.movement_service = movement_service or MovementService()
+
+    def validate(self, requests):
+        requests = list(requests)
+        n = len(requests)
+        if n == 0:
+            return []
+        batch = self._encode(requests)
+        codes = batch['codes']
+        side = batch['side']
+        enemy = 1 - side
+        rows = np.arange(n)
+
+        in_bounds = batch['in_bounds']
+        frm = np.where(in_bounds, batch['from'], 0)
+        to = np.where(in_bounds, batch['to'], 0)
+        piece = codes[rows, frm]
+        target = codes[rows, to]
+        own = self._color_mask(codes, side)
+        occupied = codes > 0
+
+        ptype = np.where(piece > 6, piece - 6, piece)
+        mover_ok = in_bounds & (piece > 0) & ((piece > 6) == (side == BLACK)) & ~own[rows, to]
+        target_enemy = (target > 0) & ~own[rows, to]
+        path_clear = ~(BETWEEN[frm, to] & occupied).any(axis=1)
+
+        # --- Pseudo-legal movement by piece type ---
+        direction = np.where(side == WHITE, -8, 8)
+        start_row = np.where(side == WHITE, 6, 1)
+        from_row, from_col = np.divmod(frm, 8)
+        to_row, to_col = np.divmod(to, 8)
+        single = (to - frm == direction) & (target == 0)
+        double = ((to - frm == 2 * direction) & (from_row == start_row)
+                  & (target == 0) & (codes[rows, np.clip(frm + direction, 0, 63)] == 0))
+        pawn_capture_geometry = GEOMETRY[np.where(side == WHITE, PAWN, PAWN + 6), frm, to]
+        en_passant = (pawn_capture_geometry & (target == 0) & (batch['ep_pawn'] >= 0)
+                      & (batch['ep_pawn'] == from_row * 8 + to_col))
+        pawn_ok = single | double | (pawn_capture_geometry & target_enemy) | en_passant
+
+        castle_side = self._castling_side(batch, frm, to, side)
+        castling = (ptype == KING) & (castle_side >= 0)
+        pseudo = np.select(
+            [ptype == PAWN, ptype == KNIGHT, ptype == BISHOP, ptype == ROOK, ptype == QUEEN, ptype == KING],
+            [pawn_ok,
+             KNIGHT_MOVES[frm, to],
+             DIAGONAL[frm, to] & path_clear,
+             STRAIGHT[frm, to] & path_clear,
+             (DIAGONAL[frm, to] | STRAIGHT[frm, to]) & path_clear,
+             KING_MOVES[frm, to] | castling],
+            default=False,
+        ) & mover_ok
+
+        # Castling may not start from or pass through an attacked square.
+        if castling.any():
+            idx = np.flatnonzero(castling & pseudo)
+            step = np.where(to[idx] > frm[idx], 1, -1)
+            attacked_now = self._attacked(codes[idx], frm[idx], enemy[idx])
+            attacked_pass = self._attacked(codes[idx], frm[idx] + step, enemy[idx])
+            pseudo[idx] &= ~(attacked_now | attacked_pass)
+
+        # --- Position after the move ---
+        after = codes.copy()
+        after[rows, to] = np.where(pseudo, piece, target)
+        after[rows, frm] = np.where(pseudo, 0, piece)
+        ep_rows = np.flatnonzero(pseudo & en_passant & (ptype == PAWN))
+        after[ep_rows, batch['ep_pawn'][ep_rows]] = 0
+        rook_rows = np.flatnonzero(pseudo & castling)
+        if len(rook_rows):
+            kingside = to[rook_rows] > frm[rook_rows]
+            rook_from = np.where(kingside, frm[rook_rows] + 3, frm[rook_rows] - 4)
+            rook_to = np.where(kingside, frm[rook_rows] + 1, frm[rook_rows] - 1)
+            after[rook_rows, rook_to] = after[rook_rows, rook_from]
+            after[rook_rows, rook_from] = 0
+        promotion_rows = np.flatnonzero(pseudo & (ptype == PAWN) & ((to_row == 0) | (to_row == 7)))
+        after[promotion_rows, to[promotion_rows]] = np.where(side[promotion_rows] == WHITE, QUEEN, QUEEN + 6)
+
+        # Legal if the mover's king is not attacked afterwards.
+        mover_king = np.where((ptype == KING) & pseudo, to, self._king_square(codes, side))
+        valid = pseudo & ~self._attacked(after, mover_king, enemy)
+
+        # --- Status of the side to move next ---
+        next_king = self._king_square(after, enemy)
+        in_check = self._attacked(after, next_king, side)
+        has_move = self._certify_has_move(after, enemy, side, next_king, in_check, valid)
+
+        results = []
+        for i in range(n):
+            if not valid[i]:
+                results.append(BatchResult(False, None))
+                continue
+            if has_move[i] is None:
+                has_move[i] = self._has_legal_move_after(requests[i])
+            if in_check[i]:
+                status = 'CHECK' if has_move[i] else 'CHECKMATE'
+            else:
+                status = 'ONGOING' if has_move[i] else 'STALEMATE'
+            results.append(BatchResult(True, status))
+        return results
+
+    # -------------------------------------------------------------------------
+    #                          INTERNAL / HELPER METHODS
+    # -------------------------------------------------------------------------
+    def _encode(self, requests):
+        n = len(requests)
+        codes = np.zeros((n, 64), dtype=np.int8)
+        side = np.zeros(n, dtype=np.int64)
+        rights = np.zeros((n, 4), dtype=bool)
+        ep_pawn = np.full(n, -1, dtype=np.int64)
+        frm = np.zeros(n, dtype=np.int64)
+        to = np.zeros(n, dtype=np.int64)
+        in_bounds = np.zeros(n, dtype=bool)
+        for i, (game, from_square, to_square) in enumerate(requests):
+            board = game.board
+            for color in (Color.WHITE, Color.BLACK):
+                for (row, col) in board.piece_squares(color):
+                    piece = board.get_piece(row, col)
+                    codes[i, row * 8 + col] = PIECE_CODES[(piece.color, piece.piece_type)]
+            side[i] = WHITE if game.current_player == Color.WHITE else BLACK
+            for index in castling_rights(board):
+                rights[i, index] = True
+            last = getattr(game, 'last_move', None)
+            if last:
+                last_piece, last_from, last_to = last
+                if (last_piece.piece_type == PieceType.PAWN
+                        and last_piece.color != game.current_player
+                        and abs(last_to[0] - last_from[0]) == 2):
+                    ep_pawn[i] = last_to[0] * 8 + last_to[1]
+            (fr, fc), (tr, tc) = from_square, to_square
+            if 0 <= fr < 8 and 0 <= fc < 8 and 0 <= tr < 8 and 0 <= tc < 8:
+                in_bounds[i] = True
+                frm[i] = fr * 8 + fc
+                to[i] = tr * 8 + tc
+        return {'codes': codes, 'side': side, 'rights': rights, 'ep_pawn': ep_pawn,
+                'from': frm, 'to': to, 'in_bounds': in_bounds}
+
+    def _color_mask(self, codes, color):
+        """(N, 64) mask of squares holding a piece of 'color' (per row)."""
+        return (codes > 0) & ((codes > 6) == (color == BLACK)[:, None])
+
+    def _king_square(self, codes, color):
+        """Square of each board's king of 'color', or -1 if it has none."""
+        king_code = np.where(color == WHITE, KING, KING + 6)
+        is_king = codes == king_code[:, None]
+        return np.where(is_king.any(axis=1), is_king.argmax(axis=1), -1)
+
+    def _castling_side(self, batch, frm, to, side):
+        """
+        For each request, the index into zobrist.CASTLING_RIGHTS of the
+        castling move it describes if the right and an empty path exist,
+        else -1.
+        """
+        codes = batch['codes']
+        home = np.where(side == WHITE, 60, 4)
+        kingside = (frm == home) & (to == home + 2)
+        queenside = (frm == home) & (to == home - 2)
+        right = np.where(kingside, np.where(side == WHITE, 0, 2), np.where(side == WHITE, 1, 3))
+        has_right = batch['rights'][np.arange(len(frm)), right]
+        rook = np.where(kingside, home + 3, home - 4)
+        empty_path = ~(BETWEEN[home, rook] & (codes > 0)).any(axis=1)
+        return np.where((kingside | queenside) & has_right & empty_path, right, -1)
+
+    def _attacked(self, codes, target, by_color):
+        """
+        For each board, whether square 'target' (-1 for none) is attacked by
+        a piece of 'by_color'.
+        """
+        result = np.zeros(len(codes), dtype=bool)
+        for start in range(0, len(codes), CHUNK_SIZE):
+            chunk = slice(start, start + CHUNK_SIZE)
+            c = codes[chunk]
+            t = target[chunk]
+            valid = t >= 0
+            t = np.where(valid, t, 0)
+            reaches = GEOMETRY[c, SQUARES[None, :], t[:, None]]
+            attackers = self._color_mask(c, by_color[chunk])
+            blocked = (BETWEEN[SQUARES[None, :], t[:, None]] & (c > 0)[:, None, :]).any(axis=2)
+            result[chunk] = (reaches & attackers & ~blocked).any(axis=1) & valid
+        return result
+
+    def _certify_has_move(self, codes, color, enemy, king, in_check, rows_needed):
+        """
+        Decide, where the arrays allow it, whether 'color' has a legal move
+        in each position. Returns an object array of True/False/None; None
+        means the vectorized tests could not tell.
+        """
+        n = len(codes)
+        has_move = np.full(n, None, dtype=object)
+        idx = np.flatnonzero(rows_needed & (king >= 0))
+
+        if len(idx):
+            # 1. The king can step to a square that is not attacked.
+            k = king[idx]
+            neighbours = KING_NEIGHBOURS[k]                       # (m, 8)
+            own = self._color_mask(codes[idx], color[idx])
+            without_king = codes[idx].copy()
+            without_king[np.arange(len(idx)), k] = 0
+            m = len(idx)
+            flat_targets = neighbours.reshape(-1)
+            flat_rows = np.repeat(np.arange(m), 8)
+            open_square = (flat_targets >= 0)
+            open_square &= ~own[flat_rows, np.where(open_square, flat_targets, 0)]
+            safe = open_square & ~self._attacked(
+                without_king[flat_rows], flat_targets, np.repeat(enemy[idx], 8))
+            king_can_move = safe.reshape(m, 8).any(axis=1)
+            has_move[idx[king_can_move]] = True
+
+            # 2. Not in check: any unpinned piece other than the king with a
+            #    pseudo-legal move (en passant aside) has a legal move.
+            rest = np.flatnonzero(~king_can_move & ~in_check[idx])
+            if len(rest):
+                sub = idx[rest]
+                movable = self._unpinned_piece_can_move(codes[sub], color[sub], enemy[sub], king[sub])
+                has_move[sub[movable]] = True
+        return has_move
+
+    def _unpinned_piece_can_move(self, codes, color, enemy, king):
+        m = len(codes)
+        occupied = codes > 0
+        own = self._color_mask(codes, color)
+        not_own = ~own
+
+        # Pins: an enemy slider lined up with the king with exactly one
+        # piece, ours, in between.
+        enemy_mask = self._color_mask(codes, enemy)
+        reaches = GEOMETRY[codes, SQUARES[None, :], king[:, None]]
+        ptype = np.where(codes > 6, codes - 6, codes)
+        sliders = enemy_mask & reaches & ((ptype == BISHOP) | (ptype == ROOK) | (ptype == QUEEN))
+        between = BETWEEN[king[:, None], SQUARES[None, :]] & occupied[:, None, :]   # (m, 64, 64)
+        single_blocker = sliders & (between.sum(axis=2) == 1)
+        pinned = (between & single_blocker[:, :, None]).any(axis=1) & own
+
+        candidates = own & ~pinned & (ptype != KING)
+        can_move = np.zeros((m, 64), dtype=bool)
+        can_move |= (ptype == KNIGHT) & (KNIGHT_MOVES[None, :, :] & not_own[:, None, :]).any(axis=2)
+        adjacent_free = KING_MOVES[None, :, :] & not_own[:, None, :]
+        can_move |= (ptype == BISHOP) & (adjacent_free & DIAGONAL[None, :, :]).any(axis=2)
+        can_move |= (ptype == ROOK) & (adjacent_free & STRAIGHT[None, :, :]).any(axis=2)
+        can_move |= (ptype == QUEEN) & adjacent_free.any(axis=2)
+
+        forward = np.where(color == WHITE, -8, 8)[:, None] + SQUARES[None, :]
+        forward_ok = (forward >= 0) & (forward < 64)
+        forward_empty = forward_ok & ~occupied[np.arange(m)[:, None], np.clip(forward, 0, 63)]
+        pawn_code = np.where(color == WHITE, PAWN, PAWN + 6)
+        pawn_captures = (GEOMETRY[pawn_code][:, :, :] & enemy_mask[:, None, :]).any(axis=2)
+        can_move |= (ptype == PAWN) & (forward_empty | pawn_captures)
+
+        return (candidates & can_move).any(axis=1)
+
+    def _has_legal_move_after(self, request):
+        """Exact fallback: play the move on the game and ask MovementService."""
+        game, from_square, to_square = request
+        for move in self.movement_service.generate_pseudo_legal_moves(game, from_square):
+            if move.to_square == to_square:
+                undo = game.make_move(move)
+                try:
+                    return self.movement_service.has_legal_move(game)
+                finally:
+                    game.unmake_move(undo)
+        raise ValueError("Request is not a pseudo-legal move")
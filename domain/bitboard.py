@@ -0,0 +1,188 @@
+"""Bitboard board representation.
+
+Squares are numbered ``row * 8 + col`` with row 0 being Black's back rank,
+matching the (row, col) coordinates used everywhere else. Each piece type
+and color has its own 64-bit integer with one bit per occupied square.
+"""
+
+from domain.piece import Color, PieceType
+from domain.zobrist import PIECE_KEYS
+
+PIECE_TYPES = (
+    PieceType.PAWN,
+    PieceType.KNIGHT,
+    PieceType.BISHOP,
+    PieceType.ROOK,
+    PieceType.QUEEN,
+    PieceType.KING,
+)
+COLORS = (Color.WHITE, Color.BLACK)
+
+# Index into BitboardBoard.bitboards for every (color, piece_type) pair.
+BITBOARD_INDEX = {
+    (color, piece_type): color_index * 6 + type_index
+    for color_index, color in enumerate(COLORS)
+    for type_index, piece_type in enumerate(PIECE_TYPES)
+}
+
+
+def _offset_table(offsets):
+    table = []
+    for sq in range(64):
+        row, col = divmod(sq, 8)
+        mask = 0
+        for (dr, dc) in offsets:
+            r, c = row + dr, col + dc
+            if 0 <= r < 8 and 0 <= c < 8:
+                mask |= 1 << (r * 8 + c)
+        table.append(mask)
+    return table
+
+
+def _ray_table(dr, dc):
+    table = []
+    for sq in range(64):
+        row, col = divmod(sq, 8)
+        mask = 0
+        r, c = row + dr, col + dc
+        while 0 <= r < 8 and 0 <= c < 8:
+            mask |= 1 << (r * 8 + c)
+            r += dr
+            c += dc
+        table.append(mask)
+    return table
+
+
+KNIGHT_ATTACKS = _offset_table(((-2, -1), (-2, 1), (-1, -2), (-1, 2), (1, -2), (1, 2), (2, -1), (2, 1)))
+KING_ATTACKS = _offset_table(((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1)))
+# Squares attacked by a pawn of the given color standing on each square.
+PAWN_ATTACKS = {
+    Color.WHITE: _offset_table(((-1, -1), (-1, 1))),
+    Color.BLACK: _offset_table(((1, -1), (1, 1))),
+}
+
+# Rays towards increasing square numbers stop at their lowest set blocker,
+# rays towards decreasing square numbers at their highest.
+ROOK_RAYS_UP = [_ray_table(1, 0), _ray_table(0, 1)]
+ROOK_RAYS_DOWN = [_ray_table(-1, 0), _ray_table(0, -1)]
+BISHOP_RAYS_UP = [_ray_table(1, 1), _ray_table(1, -1)]
+BISHOP_RAYS_DOWN = [_ray_table(-1, -1), _ray_table(-1, 1)]
+
+
+def _sliding_attacks(sq, occupied, rays_up, rays_down):
+    attacks = 0
+    for rays in rays_up:
+        ray = rays[sq]
+        blockers = ray & occupied
+        if blockers:
+            first = (blockers & -blockers).bit_length() - 1
+            ray ^= rays[first]
+        attacks |= ray
+    for rays in rays_down:
+        ray = rays[sq]
+        blockers = ray & occupied
+        if blockers:
+            first = blockers.bit_length() - 1
+            ray ^= rays[first]
+        attacks |= ray
+    return attacks
+
+
+def rook_attacks(sq, occupied):
+    """Squares a rook on 'sq' attacks given the 'occupied' bitboard."""
+    return _sliding_attacks(sq, occupied, ROOK_RAYS_UP, ROOK_RAYS_DOWN)
+
+
+def bishop_attacks(sq, occupied):
+    """Squares a bishop on 'sq' attacks given the 'occupied' bitboard."""
+    return _sliding_attacks(sq, occupied, BISHOP_RAYS_UP, BISHOP_RAYS_DOWN)
+
+
+class BitboardBoard:
+    """
+    Drop-in replacement for domain.board.Board backed by bitboards.
+
+    Piece objects are still kept per square so get_piece returns the same
+    instances (with their has_moved flags) the rest of the code expects.
+    """
+    def __init__(self):
+        self.bitboards = [0] * 12
+        self.occupancy = {Color.WHITE: 0, Color.BLACK: 0}
+        self.squares = [None] * 64
+        # Zobrist key of the pieces on the board, updated with every change.
+        self.zobrist_key = 0
+
+    def place_piece(self, row, col, piece):
+        sq = row * 8 + col
+        if self.squares[sq] is not None:
+            self._clear(sq)
+        if piece is not None:
+            bit = 1 << sq
+            self.bitboards[BITBOARD_INDEX[(piece.color, piece.piece_type)]] |= bit
+            self.occupancy[piece.color] |= bit
+            self.squares[sq] = piece
+            self.zobrist_key ^= PIECE_KEYS[(piece.color, piece.piece_type)][sq]
+
+    def get_piece(self, row, col):
+        return self.squares[row * 8 + col]
+
+    def remove_piece(self, row, col):
+        sq = row * 8 + col
+        if self.squares[sq] is None:
+            return None
+        return self._clear(sq)
+
+    def move_piece(self, from_row, from_col, to_row, to_col):
+        piece = self.remove_piece(from_row, from_col)
+        self.place_piece(to_row, to_col, piece)
+        if piece:
+            piece.has_moved = True
+
+    def find_king(self, color):
+        """Return the (row, col) of the king of 'color', or None."""
+        kings = self.bitboards[BITBOARD_INDEX[(color, PieceType.KING)]]
+        if not kings:
+            return None
+        return divmod((kings & -kings).bit_length() - 1, 8)
+
+    def piece_squares(self, color):
+        """Return the (row, col) squares of every piece of 'color'."""
+        squares = []
+        remaining = self.occupancy[color]
+        while remaining:
+            low = remaining & -remaining
+            squares.append(divmod(low.bit_length() - 1, 8))
+            remaining ^= low
+        return squares
+
+    def is_square_attacked(self, square, by_color):
+        """Return True if any piece of 'by_color' attacks 'square'."""
+        (row, col) = square
+        sq = row * 8 + col
+        bitboards = self.bitboards
+        base = BITBOARD_INDEX[(by_color, PieceType.PAWN)]
+        defender = Color.BLACK if by_color == Color.WHITE else Color.WHITE
+        if PAWN_ATTACKS[defender][sq] & bitboards[base]:
+            return True
+        if KNIGHT_ATTACKS[sq] & bitboards[base + 1]:
+            return True
+        if KING_ATTACKS[sq] & bitboards[base + 5]:
+            return True
+        occupied = self.occupancy[Color.WHITE] | self.occupancy[Color.BLACK]
+        queens = bitboards[base + 4]
+        diagonal = bitboards[base + 2] | queens
+        if diagonal and bishop_attacks(sq, occupied) & diagonal:
+            return True
+        straight = bitboards[base + 3] | queens
+        if straight and rook_attacks(sq, occupied) & straight:
+            return True
+        return False
+
+    def _clear(self, sq):
+        piece = self.squares[sq]
+        mask = ~(1 << sq)
+        self.bitboards[BITBOARD_INDEX[(piece.color, piece.piece_type)]] &= mask
+        self.occupancy[piece.color] &= mask
+        self.squares[sq] = None
+        self.zobrist_key ^= PIECE_KEYS[(piece.color, piece.piece_type)][sq]
+        return piece
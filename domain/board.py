@@ -1,17 +1,86 @@
+from domain.attacks import is_square_attacked
+from domain.piece import Color, PieceType
+from domain.zobrist import PIECE_KEYS
+
+
 class Board:
     def __init__(self):
         # 8x8, each entry either None or a Piece
         self.grid = [[None for _ in range(8)] for _ in range(8)]
+        # Kept up to date by place/remove/move so that check detection and
+        # move generation only visit live pieces and find kings in O(1).
+        # Mutate the board through these methods, not through grid directly.
+        self.piece_locations = {Color.WHITE: set(), Color.BLACK: set()}
+        self.king_squares = {Color.WHITE: None, Color.BLACK: None}
+        # Zobrist key of the pieces on the board, updated with every change.
+        self.zobrist_key = 0
+
+    def __getstate__(self):
+        # Piece tracking and the Zobrist key are derived from the grid, so
+        # they are left out of pickles and rebuilt on load.
+        state = dict(self.__dict__)
+        for derived in ('piece_locations', 'king_squares', 'zobrist_key'):
+            state.pop(derived, None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._rebuild_piece_locations()
 
     def place_piece(self, row, col, piece):
+        if self.grid[row][col] is not None:
+            self._untrack(row, col, self.grid[row][col])
         self.grid[row][col] = piece
+        if piece is not None:
+            self._track(row, col, piece)
     
     def get_piece(self, row, col):
         return self.grid[row][col]
+
+    def remove_piece(self, row, col):
+        piece = self.grid[row][col]
+        if piece is not None:
+            self.grid[row][col] = None
+            self._untrack(row, col, piece)
+        return piece
     
     def move_piece(self, from_row, from_col, to_row, to_col):
-        piece = self.grid[from_row][from_col]
-        self.grid[from_row][from_col] = None
-        self.grid[to_row][to_col] = piece
+        piece = self.remove_piece(from_row, from_col)
+        self.place_piece(to_row, to_col, piece)
         if piece:
             piece.has_moved = True
+
+    def find_king(self, color):
+        """Return the (row, col) of the king of 'color', or None."""
+        return self.king_squares[color]
+
+    def piece_squares(self, color):
+        """Return the (row, col) squares of every piece of 'color'."""
+        # A copy, so callers may make and unmake moves while iterating.
+        return list(self.piece_locations[color])
+
+    def is_square_attacked(self, square, by_color):
+        """Return True if any piece of 'by_color' attacks 'square'."""
+        return is_square_attacked(self, square, by_color)
+
+    def _track(self, row, col, piece):
+        self.zobrist_key ^= PIECE_KEYS[(piece.color, piece.piece_type)][row * 8 + col]
+        self.piece_locations[piece.color].add((row, col))
+        if piece.piece_type == PieceType.KING:
+            self.king_squares[piece.color] = (row, col)
+
+    def _untrack(self, row, col, piece):
+        self.zobrist_key ^= PIECE_KEYS[(piece.color, piece.piece_type)][row * 8 + col]
+        self.piece_locations[piece.color].discard((row, col))
+        if self.king_squares[piece.color] == (row, col):
+            self.king_squares[piece.color] = None
+
+    def _rebuild_piece_locations(self):
+        self.piece_locations = {Color.WHITE: set(), Color.BLACK: set()}
+        self.king_squares = {Color.WHITE: None, Color.BLACK: None}
+        self.zobrist_key = 0
+        for row in range(8):
+            for col in range(8):
+                piece = self.grid[row][col]
+                if piece is not None:
+                    self._track(row, col, piece)
@@ -1,43 +1,167 @@
+from collections import namedtuple
+
+from domain.move import Move
+from domain.piece import Piece, PieceType
+from domain.zobrist import position_key
+
+# Everything needed to take back a move made with Game.make_move:
+#   move           - the Move that was made
+#   piece          - the piece that moved (the pawn, for promotions)
+#   had_moved      - its has_moved flag before the move
+#   captured       - the captured piece or None
+#   captured_square- where it stood (differs from the target for en passant)
+#   rook_hop       - (from_col, to_col) of the rook when castling, else None
+#   last_move      - Game.last_move before the move
+#   halfmove_clock - Game.halfmove_clock before the move
+MoveUndo = namedtuple(
+    'MoveUndo',
+    ['move', 'piece', 'had_moved', 'captured', 'captured_square', 'rook_hop', 'last_move',
+     'halfmove_clock'],
+)
+
+# Statuses that end the game: no more moves can be played.
+DRAW_STATUSES = ('STALEMATE', 'DRAW_REPETITION', 'DRAW_FIFTY_MOVES', 'DRAW_INSUFFICIENT_MATERIAL')
+FINISHED_STATUSES = ('CHECKMATE',) + DRAW_STATUSES
+
 class Game:
     def __init__(self, board, current_player):
         self.board = board
         self.current_player = current_player
-        self.status = 'ONGOING'  # Could be ONGOING, CHECK, CHECKMATE, STALEMATE, etc.
+        self.status = 'ONGOING'  # ONGOING, CHECK, or one of FINISHED_STATUSES
         # Track the last move for rules like en passant. Stored as
         # (piece, from_square, to_square).
         self.last_move = None
+        # Every Move made on this game, in order; make_move appends and
+        # unmake_move pops, so searches leave it as they found it.
+        self.move_history = []
+        # FEN of the position move_history starts from; None for the
+        # standard initial position.
+        self.start_fen = None
+        # Plies since the last capture or pawn move, for the fifty-move rule.
+        self.halfmove_clock = 0
+        # How often each position (by position_key) occurred since the last
+        # capture or pawn move; earlier positions cannot come back. Kept by
+        # move_piece, not by make_move, so searches do not pay for it.
+        self.position_counts = {}
+
+    def __setstate__(self, state):
+        # Games pickled before an attribute existed load with its default.
+        self.last_move = None
+        self.move_history = []
+        self.start_fen = None
+        self.halfmove_clock = 0
+        self.position_counts = {}
+        self.__dict__.update(state)
+
+    def is_finished(self):
+        return self.status in FINISHED_STATUSES
+
+    def position_key(self):
+        """
+        Zobrist key of the position: pieces, side to move, castling rights
+        and en passant file. Equal positions have equal keys.
+        """
+        return position_key(self)
+
+    def move_piece(self, from_square, to_square, promotion=None):
+        """
+        Play a move of the game itself: make_move, plus counting the new
+        position in position_counts for repetition draws.
+        """
+        counts = self.position_counts
+        if not counts:
+            counts[self.position_key()] = 1
+        self.make_move(Move(from_square, to_square, promotion))
+        if self.halfmove_clock == 0:
+            counts = self.position_counts = {}
+        key = self.position_key()
+        counts[key] = counts.get(key, 0) + 1
+
+    def repetition_count(self):
+        """How many times the current position has occurred (at least 1)."""
+        return self.position_counts.get(self.position_key(), 1)
 
-    def move_piece(self, from_square, to_square):
-        # from_square/to_square might be something like (row, col)
-        (fr, fc) = from_square
-        (tr, tc) = to_square
-        piece = self.board.get_piece(fr, fc)
+    def make_move(self, move):
+        """
+        Apply 'move' in place and return a MoveUndo record that
+        unmake_move can use to restore the previous position exactly.
+        The move is not otherwise validated; raises ValueError if its
+        from-square is empty.
+        """
+        board = self.board
+        (fr, fc) = move.from_square
+        (tr, tc) = move.to_square
+        piece = board.get_piece(fr, fc)
+        if piece is None:
+            raise ValueError(f"No piece on {move.from_square}")
+        had_moved = piece.has_moved
+        captured = board.get_piece(tr, tc)
+        captured_square = move.to_square
 
         # Handle en passant capture: if a pawn moves diagonally to an empty
         # square and the opponent's pawn made a two-step move to become
         # adjacent in the previous turn, remove that pawn.
-        if (
-            piece
-            and piece.piece_type == 'P'
-            and fc != tc
-            and self.board.get_piece(tr, tc) is None
-        ):
-            capture_row = fr
-            capture_col = tc
-            self.board.grid[capture_row][capture_col] = None
-
-        self.board.move_piece(fr, fc, tr, tc)
+        if piece.piece_type == PieceType.PAWN and fc != tc and captured is None:
+            captured_square = (fr, tc)
+            captured = board.remove_piece(fr, tc)
+
+        board.move_piece(fr, fc, tr, tc)
 
         # Handle castling: when king moves two squares horizontally,
         # move the corresponding rook as well.
-        if piece and piece.piece_type == 'K' and abs(fc - tc) == 2:
+        rook_hop = None
+        if piece.piece_type == PieceType.KING and abs(fc - tc) == 2:
             rook_from_col = 0 if tc < fc else 7
             rook_to_col = fc - 1 if tc < fc else fc + 1
-            self.board.move_piece(fr, rook_from_col, fr, rook_to_col)
+            board.move_piece(fr, rook_from_col, fr, rook_to_col)
+            rook_hop = (rook_from_col, rook_to_col)
+
+        # Handle promotion: a pawn reaching the last rank becomes the
+        # requested piece type, a queen if none was given.
+        if piece.piece_type == PieceType.PAWN and tr in (0, 7):
+            promoted = Piece(piece.color, move.promotion or PieceType.QUEEN)
+            promoted.has_moved = True
+            board.place_piece(tr, tc, promoted)
 
+        undo = MoveUndo(move, piece, had_moved, captured, captured_square, rook_hop, self.last_move,
+                        self.halfmove_clock)
+        if piece.piece_type == PieceType.PAWN or captured is not None:
+            self.halfmove_clock = 0
+        else:
+            self.halfmove_clock += 1
         # Record the move for future en passant checks
-        if piece:
-            self.last_move = (piece, from_square, to_square)
+        self.last_move = (piece, move.from_square, move.to_square)
+        self.move_history.append(move)
+        self._switch_player()
+        return undo
+
+    def unmake_move(self, undo):
+        """
+        Take back the move described by 'undo', as returned by make_move.
+        Moves must be unmade in the reverse order they were made.
+        """
+        board = self.board
+        (fr, fc) = undo.move.from_square
+        (tr, tc) = undo.move.to_square
+
+        board.remove_piece(tr, tc)
+        board.place_piece(fr, fc, undo.piece)
+        undo.piece.has_moved = undo.had_moved
+
+        if undo.captured is not None:
+            (cr, cc) = undo.captured_square
+            board.place_piece(cr, cc, undo.captured)
+
+        if undo.rook_hop is not None:
+            (rook_from_col, rook_to_col) = undo.rook_hop
+            rook = board.remove_piece(fr, rook_to_col)
+            board.place_piece(fr, rook_from_col, rook)
+            # Castling is only possible with a rook that had not moved.
+            rook.has_moved = False
+
+        self.last_move = undo.last_move
+        self.halfmove_clock = undo.halfmove_clock
+        self.move_history.pop()
         self._switch_player()
 
     def _switch_player(self):
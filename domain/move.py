@@ -0,0 +1,5 @@
+from collections import namedtuple
+
+# A single move from one (row, col) square to another. ``promotion`` holds the
+# PieceType a pawn turns into when it reaches the last rank, otherwise None.
+Move = namedtuple('Move', ['from_square', 'to_square', 'promotion'], defaults=(None,))
@@ -0,0 +1,273 @@
+"""Text notations for squares, moves and positions (FEN).
+
+Squares are named the usual way ('e4'); row 0 is rank 8 and column 0 is
+file a, matching the (row, col) coordinates used by the Board.
+"""
+
+from domain.board import Board
+from domain.game import Game
+from domain.move import Move
+from domain.piece import Color, Piece, PieceType
+from domain.zobrist import castling_rights
+
+STARTING_FEN = 'rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1'
+
+FILES = 'abcdefgh'
+# Castling right letters in the order of zobrist.CASTLING_RIGHTS.
+CASTLING_LETTERS = 'KQkq'
+# (king home row, rook column) for each castling right letter.
+CASTLING_SQUARES = {'K': (7, 7), 'Q': (7, 0), 'k': (0, 7), 'q': (0, 0)}
+
+
+def square_name(square):
+    (row, col) = square
+    return FILES[col] + str(8 - row)
+
+
+def parse_square(name):
+    if len(name) != 2 or name[0] not in FILES or name[1] not in '12345678':
+        raise ValueError(f"Invalid square: {name!r}")
+    return (8 - int(name[1]), FILES.index(name[0]))
+
+
+def move_to_uci(move):
+    """Long algebraic form used by UCI engines, e.g. 'e2e4' or 'e7e8q'."""
+    text = square_name(move.from_square) + square_name(move.to_square)
+    if move.promotion:
+        text += move.promotion.lower()
+    return text
+
+
+def parse_uci(text):
+    """Parse a move like 'e2e4' or 'e7e8q' into a Move."""
+    if len(text) not in (4, 5):
+        raise ValueError(f"Invalid move: {text!r}")
+    promotion = None
+    if len(text) == 5:
+        promotion = text[4].upper()
+        if promotion not in (PieceType.QUEEN, PieceType.ROOK, PieceType.BISHOP, PieceType.KNIGHT):
+            raise ValueError(f"Invalid promotion piece in move: {text!r}")
+    return Move(parse_square(text[0:2]), parse_square(text[2:4]), promotion)
+
+
+def game_from_fen(fen, board_factory=None):
+    """
+    Build a Game from a FEN string.
+
+    Kings and rooks that have lost their castling rights are marked as
+    moved, and an en passant square becomes a last_move for the pawn that
+    just advanced two squares, so MovementService sees the same rights.
+    The halfmove clock becomes the game's halfmove_clock. Unless it is
+    the standard start position, the FEN is kept as the game's start_fen.
+    """
+    fields = fen.split()
+    if len(fields) < 4:
+        raise ValueError(f"Invalid FEN: {fen!r}")
+    placement, side, castling, en_passant = fields[:4]
+
+    board = (board_factory or Board)()
+    rows = placement.split('/')
+    if len(rows) != 8:
+        raise ValueError(f"Invalid FEN placement: {placement!r}")
+    for row, text in enumerate(rows):
+        col = 0
+        for char in text:
+            if char.isdigit():
+                col += int(char)
+                continue
+            piece_type = char.upper()
+            if piece_type not in 'KQRBNP' or col > 7:
+                raise ValueError(f"Invalid FEN placement: {placement!r}")
+            color = Color.WHITE if char.isupper() else Color.BLACK
+            piece = Piece(color, piece_type)
+            # Only pawns, and kings and rooks keeping a castling right, are
+            # treated as unmoved.
+            piece.has_moved = piece_type in (PieceType.KING, PieceType.ROOK)
+            board.place_piece(row, col, piece)
+            col += 1
+        if col != 8:
+            raise ValueError(f"Invalid FEN placement: {placement!r}")
+
+    if castling != '-':
+        for letter in castling:
+            if letter not in CASTLING_SQUARES:
+                raise ValueError(f"Invalid FEN castling rights: {castling!r}")
+            (row, rook_col) = CASTLING_SQUARES[letter]
+            color = Color.WHITE if letter.isupper() else Color.BLACK
+            for col, piece_type in ((4, PieceType.KING), (rook_col, PieceType.ROOK)):
+                piece = board.get_piece(row, col)
+                if piece is None or piece.color != color or piece.piece_type != piece_type:
+                    raise ValueError(f"Castling right {letter!r} without king and rook at home")
+                piece.has_moved = False
+
+    if side not in ('w', 'b'):
+        raise ValueError(f"Invalid FEN side to move: {side!r}")
+    game = Game(board, Color.WHITE if side == 'w' else Color.BLACK)
+
+    if en_passant != '-':
+        (row, col) = parse_square(en_passant)
+        # The square is on rank 6 (row 2) after a black double step, rank 3
+        # (row 5) after a white one.
+        if row != (2 if game.current_player == Color.WHITE else 5):
+            raise ValueError(f"Invalid FEN en passant square: {en_passant!r}")
+        # The pawn passed over 'row'; it now stands one row further along.
+        direction = 1 if game.current_player == Color.WHITE else -1
+        pawn = board.get_piece(row + direction, col)
+        if pawn is None or pawn.piece_type != PieceType.PAWN or pawn.color == game.current_player:
+            raise ValueError(f"Invalid FEN en passant square: {en_passant!r}")
+        game.last_move = (pawn, (row - direction, col), (row + direction, col))
+    if len(fields) > 4:
+        if not fields[4].isdigit():
+            raise ValueError(f"Invalid FEN halfmove clock: {fields[4]!r}")
+        game.halfmove_clock = int(fields[4])
+    if fields[:4] != STARTING_FEN.split()[:4]:
+        game.start_fen = fen
+    return game
+
+
+def game_to_fen(game):
+    """Return the FEN string of the game's position."""
+    board = game.board
+    rows = []
+    for row in range(8):
+        text = ''
+        empty = 0
+        for col in range(8):
+            piece = board.get_piece(row, col)
+            if piece is None:
+                empty += 1
+                continue
+            if empty:
+                text += str(empty)
+                empty = 0
+            text += piece.piece_type if piece.color == Color.WHITE else piece.piece_type.lower()
+        if empty:
+            text += str(empty)
+        rows.append(text)
+
+    castling = ''.join(CASTLING_LETTERS[index] for index in castling_rights(board)) or '-'
+
+    en_passant = '-'
+    last = game.last_move
+    if last:
+        last_piece, last_from, last_to = last
+        if last_piece.piece_type == PieceType.PAWN and abs(last_to[0] - last_from[0]) == 2:
+            en_passant = square_name(((last_from[0] + last_to[0]) // 2, last_to[1]))
+
+    side = 'w' if game.current_player == Color.WHITE else 'b'
+    # The move number counts on from the start position's.
+    start = (game.start_fen or STARTING_FEN).split()
+    fullmove = int(start[5]) if len(start) > 5 and start[5].isdigit() else 1
+    fullmove += (len(game.move_history) + (1 if start[1] == 'b' else 0)) // 2
+    return f"{'/'.join(rows)} {side} {castling} {en_passant} {game.halfmove_clock} {fullmove}"
+
+
+def move_to_san(game, move, movement_service, legal_moves=None):
+    """
+    Return the Standard Algebraic Notation of the legal 'move' in 'game'
+    ('Nbd7', 'exd6', 'e8=Q+', 'O-O#'). 'legal_moves' may be passed when
+    already known. The game is left unchanged.
+    """
+    board = game.board
+    (fr, fc) = move.from_square
+    (tr, tc) = move.to_square
+    piece = board.get_piece(fr, fc)
+
+    if piece.piece_type == PieceType.KING and abs(tc - fc) == 2:
+        san = 'O-O' if tc > fc else 'O-O-O'
+    else:
+        capture = board.get_piece(tr, tc) is not None
+        if piece.piece_type == PieceType.PAWN:
+            capture = capture or fc != tc
+            san = (FILES[fc] + 'x' if capture else '') + square_name(move.to_square)
+            if tr in (0, 7):
+                san += '=' + (move.promotion or PieceType.QUEEN)
+        else:
+            if legal_moves is None:
+                legal_moves = movement_service.generate_legal_moves(game)
+            rivals = {
+                other.from_square for other in legal_moves
+                if other.to_square == move.to_square and other.from_square != move.from_square
+                and board.get_piece(*other.from_square).piece_type == piece.piece_type
+            }
+            qualifier = ''
+            if rivals:
+                if all(c != fc for (_, c) in rivals):
+                    qualifier = FILES[fc]
+                elif all(r != fr for (r, _) in rivals):
+                    qualifier = str(8 - fr)
+                else:
+                    qualifier = square_name(move.from_square)
+            san = piece.piece_type + qualifier + ('x' if capture else '') + square_name(move.to_square)
+
+    undo = game.make_move(move)
+    try:
+        if movement_service.is_in_check(game):
+            san += '+' if movement_service.has_legal_move(game) else '#'
+    finally:
+        game.unmake_move(undo)
+    return san
+
+
+def parse_san(game, san, movement_service, legal_moves=None):
+    """
+    Resolve a SAN move against the legal moves of 'game' and return the
+    Move. Raises ValueError unless exactly one legal move matches.
+    """
+    text = san.strip()
+    if text.endswith('e.p.'):
+        text = text[:-4]
+    text = text.rstrip('+#!?')
+    if legal_moves is None:
+        legal_moves = movement_service.generate_legal_moves(game)
+    board = game.board
+
+    if text in ('O-O', '0-0', 'O-O-O', '0-0-0'):
+        step = 2 if len(text) == 3 else -2
+        for move in legal_moves:
+            (fr, fc) = move.from_square
+            if board.get_piece(fr, fc).piece_type == PieceType.KING and move.to_square == (fr, fc + step):
+                return move
+        raise ValueError(f"Illegal move: {san!r}")
+
+    promotion = None
+    if '=' in text:
+        text, promotion = text.split('=', 1)
+    elif len(text) > 2 and text[-1] in 'QRBN' and text[-2] in '18':
+        text, promotion = text[:-1], text[-1]
+    if promotion is not None:
+        promotion = promotion.upper()
+        if promotion not in (PieceType.QUEEN, PieceType.ROOK, PieceType.BISHOP, PieceType.KNIGHT):
+            raise ValueError(f"Invalid promotion piece in move: {san!r}")
+
+    piece_type = PieceType.PAWN
+    if text and text[0] in 'KQRBN':
+        piece_type, text = text[0], text[1:]
+    text = text.replace('x', '').replace('-', '').replace(':', '')
+    if len(text) < 2:
+        raise ValueError(f"Invalid SAN move: {san!r}")
+    to_square = parse_square(text[-2:])
+    qualifier = text[:-2]
+
+    matches = []
+    for move in legal_moves:
+        if move.to_square != to_square:
+            continue
+        (fr, fc) = move.from_square
+        if board.get_piece(fr, fc).piece_type != piece_type:
+            continue
+        wanted = promotion
+        if move.promotion is not None and wanted is None:
+            wanted = PieceType.QUEEN
+        if move.promotion != wanted:
+            continue
+        if any(
+            (char in FILES and FILES[fc] != char) or (char.isdigit() and str(8 - fr) != char)
+            for char in qualifier
+        ):
+            continue
+        matches.append(move)
+    if len(matches) != 1:
+        kind = "Ambiguous" if matches else "Illegal"
+        raise ValueError(f"{kind} move: {san!r}")
+    return matches[0]
@@ -1,18 +1,42 @@
 # services.py
 
-from copy import deepcopy
+from collections import OrderedDict
+from domain.attacks import DIAGONAL_RAYS, KING_TARGETS, KNIGHT_TARGETS, STRAIGHT_RAYS
+from domain.move import Move
 from domain.piece import Color, PieceType
 
+SLIDING_RAYS = {
+    PieceType.ROOK: STRAIGHT_RAYS,
+    PieceType.BISHOP: DIAGONAL_RAYS,
+    PieceType.QUEEN: tuple(s + d for s, d in zip(STRAIGHT_RAYS, DIAGONAL_RAYS)),
+}
+PROMOTION_TYPES = (PieceType.QUEEN, PieceType.ROOK, PieceType.BISHOP, PieceType.KNIGHT)
+DEFAULT_CACHE_SIZE = 10000
+
+
 class MovementService:
     """
     A 'fully' implemented MovementService that covers:
       - Basic piece movement (pawn, knight, bishop, rook, queen, king)
-      - Captures
+      - Captures, castling, en passant and promotion
+      - Legal move generation
       - Checking for checks
-      - Basic checkmate detection
-    Does NOT handle all advanced rules (castling, en passant, underpromotion, etc.).
+      - Checkmate, stalemate and insufficient material detection, and
+        end_status() for every way a game ends
+
+    Per-position results are kept in an LRU cache keyed by the game's
+    Zobrist key, so repeated queries about the same position are lookups.
     """
 
+    def __init__(self, cache_size=DEFAULT_CACHE_SIZE):
+        """
+        :param cache_size: maximum number of positions to cache, 0 disables it
+        """
+        self.cache_size = cache_size
+        # position key -> [legal moves tuple, in check, has a legal move],
+        # where None means "not computed yet".
+        self._cache = OrderedDict()
+
     def is_valid_move(self, game, from_square, to_square):
         """
         Checks if the move from 'from_square' to 'to_square' is valid according 
@@ -40,31 +64,19 @@ class MovementService:
         if piece.color != game.current_player:
             return False
 
-        # If target square has a piece of the same color, invalid
-        target_piece = board.get_piece(tr, tc)
-        if target_piece and target_piece.color == piece.color:
-            return False
-
-        # Check if move is valid for that piece type or via en passant
-        if not self._can_move_piece(piece, from_square, to_square, board, game):
-            # Special case: en passant capture
-            if not self._is_en_passant(game, piece, from_square, to_square):
-                return False
-
-        # Additional castling-specific checks
-        if piece.piece_type == PieceType.KING and abs(tc - fc) == 2:
-            # King cannot castle out of or through check
-            if self._is_in_check(board, piece.color):
-                return False
-            step = 1 if tc > fc else -1
-            if self._would_leave_king_in_check(game, from_square, (fr, fc + step)):
-                return False
-
-        # Check if the move leaves our king in check
-        if self._would_leave_king_in_check(game, from_square, to_square):
-            return False
-
-        return True
+        # With a cache, look the move up among the position's legal moves.
+        if self.cache_size:
+            return any(
+                move.from_square == from_square and move.to_square == to_square
+                for move in self._cached_legal_moves(game)
+            )
+
+        # The move must be one the piece can make, and must not leave our
+        # own king in check. Promotion variants share the same legality.
+        for move in self.generate_pseudo_legal_moves(game, from_square):
+            if move.to_square == to_square:
+                return self._is_legal(game, move)
+        return False
 
     def is_checkmate(self, game):
         """
@@ -76,131 +88,269 @@ class MovementService:
           2. If not in check, return False.
           3. If in check, see if there's ANY legal move that can remove the check.
         """
-        board = game.board
-        color = game.current_player
-
-        # If king is not in check, can't be checkmate
-        if not self._is_in_check(board, color):
+        if not self._is_current_player_in_check(game):
             return False
+        return not self.has_legal_move(game)
 
-        # Try every possible move to see if it removes check
-        for row in range(8):
-            for col in range(8):
-                piece = board.get_piece(row, col)
-                if piece and piece.color == color:
-                    from_square = (row, col)
-
-                    # Check all squares on the board as potential moves
-                    for to_row in range(8):
-                        for to_col in range(8):
-                            to_square = (to_row, to_col)
-                            # Create a "fake" move to see if it's valid
-                            if self.is_valid_move(game, from_square, to_square):
-                                # Simulate the move
-                                temp_game = self._simulate_move(game, from_square, to_square)
-                                # If after this move, the king is not in check, it's not checkmate
-                                if not self._is_in_check(temp_game.board, color):
-                                    return False
-        return True
+    def is_in_check(self, game):
+        """
+        Returns True if the current player's king is in check.
+        """
+        return self._is_current_player_in_check(game)
 
-    # -------------------------------------------------------------------------
-    #                          INTERNAL / HELPER METHODS
-    # -------------------------------------------------------------------------
-    def _can_move_piece(self, piece, from_square, to_square, board, game=None):
+    def is_stalemate(self, game):
         """
-        Returns True if the piece can move from 'from_square' to 'to_square'
-        ignoring check-scenarios. Strictly piece movement logic + path checking.
+        Returns True if the current player is not in check but has no legal move.
         """
-        (fr, fc) = from_square
-        (tr, tc) = to_square
-        piece_type = piece.piece_type
+        if self._is_current_player_in_check(game):
+            return False
+        return not self.has_legal_move(game)
 
-        # General direction/offset
-        row_diff = tr - fr
-        col_diff = tc - fc
-        abs_row_diff = abs(row_diff)
-        abs_col_diff = abs(col_diff)
+    def is_insufficient_material(self, game):
+        """
+        Returns True if no sequence of legal moves can end in mate: king
+        against king, king and one minor piece against king, or kings and
+        bishops all standing on squares of one color.
+        """
+        board = game.board
+        minors = []
+        for color in (Color.WHITE, Color.BLACK):
+            for (row, col) in board.piece_squares(color):
+                piece = board.get_piece(row, col)
+                if piece.piece_type == PieceType.KING:
+                    continue
+                if piece.piece_type not in (PieceType.BISHOP, PieceType.KNIGHT):
+                    return False
+                minors.append((piece.piece_type, (row + col) % 2))
+        if len(minors) <= 1:
+            return True
+        return (all(piece_type == PieceType.BISHOP for piece_type, _ in minors)
+                and len({shade for _, shade in minors}) == 1)
 
-        if piece_type == PieceType.PAWN:
-            return self._can_move_pawn(piece, from_square, to_square, board)
+    def end_status(self, game):
+        """
+        Returns the status the game ends with in its current position:
+        CHECKMATE, STALEMATE, DRAW_FIFTY_MOVES, DRAW_REPETITION or
+        DRAW_INSUFFICIENT_MATERIAL, or None if play goes on. Each check is
+        a constant amount of work, using the game's halfmove clock and
+        position counts.
+        """
+        if not self.has_legal_move(game):
+            return 'CHECKMATE' if self._is_current_player_in_check(game) else 'STALEMATE'
+        if game.halfmove_clock >= 100:
+            return 'DRAW_FIFTY_MOVES'
+        if game.repetition_count() >= 3:
+            return 'DRAW_REPETITION'
+        if self.is_insufficient_material(game):
+            return 'DRAW_INSUFFICIENT_MATERIAL'
+        return None
 
-        elif piece_type == PieceType.KNIGHT:
-            # Knight moves in an 'L': 2 in one direction, 1 in the other
-            return (abs_row_diff, abs_col_diff) in [(2, 1), (1, 2)]
+    def generate_legal_moves(self, game):
+        """
+        Returns the list of every legal Move for the current player.
+        """
+        return list(self._cached_legal_moves(game))
 
-        elif piece_type == PieceType.BISHOP:
-            # Bishop moves diagonally
-            if abs_row_diff == abs_col_diff:
-                return self._is_path_clear(board, from_square, to_square)
-            return False
+    def has_legal_move(self, game):
+        """
+        Returns True as soon as one legal move is found for the current player.
+        """
+        entry = self._cache_entry(game)
+        if entry is not None:
+            if entry[2] is None:
+                entry[2] = bool(entry[0]) if entry[0] is not None else self._any_legal_move(game)
+            return entry[2]
+        return self._any_legal_move(game)
+
+    def clear_cache(self):
+        """
+        Forget every cached position.
+        """
+        self._cache.clear()
 
-        elif piece_type == PieceType.ROOK:
-            # Rook moves horizontally or vertically
-            if (fr == tr) or (fc == tc):
-                return self._is_path_clear(board, from_square, to_square)
-            return False
+    def generate_pseudo_legal_moves(self, game, square):
+        """
+        Returns the moves the piece on 'square' could make by its movement
+        rules alone, without checking whether they leave its king in check.
 
-        elif piece_type == PieceType.QUEEN:
-            # Queen = Rook or Bishop
-            if (fr == tr) or (fc == tc) or (abs_row_diff == abs_col_diff):
-                return self._is_path_clear(board, from_square, to_square)
-            return False
+        :param game: The Game entity containing board and last move
+        :param square: (row, col)
+        :return: list of Move, empty if the square is empty
+        """
+        (row, col) = square
+        piece = game.board.get_piece(row, col)
+        if piece is None:
+            return []
 
-        elif piece_type == PieceType.KING:
-            # King can move 1 square in any direction
-            if abs_row_diff <= 1 and abs_col_diff <= 1:
-                return True
-
-            # Castling logic: king moves two squares horizontally and neither
-            # king nor rook have moved and the path is clear.
-            if abs_row_diff == 0 and abs_col_diff == 2 and not piece.has_moved:
-                rook_col = 0 if tc < fc else 7
-                rook = board.get_piece(fr, rook_col)
-                if rook and rook.piece_type == PieceType.ROOK and not rook.has_moved:
-                    step = -1 if tc < fc else 1
-                    for c in range(fc + step, rook_col, step):
-                        if board.get_piece(fr, c) is not None:
-                            return False
-                    return True
-            return False
+        piece_type = piece.piece_type
+        if piece_type == PieceType.PAWN:
+            return self._pawn_moves(game, piece, square)
+        sq = row * 8 + col
+        if piece_type == PieceType.KNIGHT:
+            return self._step_moves(game.board, piece, square, KNIGHT_TARGETS[sq])
+        if piece_type == PieceType.KING:
+            moves = self._step_moves(game.board, piece, square, KING_TARGETS[sq])
+            moves.extend(self._castling_moves(game.board, piece, square))
+            return moves
+        return self._sliding_moves(game.board, piece, square, SLIDING_RAYS[piece_type][sq])
 
+    # -------------------------------------------------------------------------
+    #                          INTERNAL / HELPER METHODS
+    # -------------------------------------------------------------------------
+    def _cache_entry(self, game):
+        """
+        Returns the cache entry for the game's position, creating it (and
+        evicting the least recently used one) if needed. None if disabled.
+        """
+        if not self.cache_size:
+            return None
+        key = game.position_key()
+        entry = self._cache.get(key)
+        if entry is None:
+            entry = [None, None, None]
+            self._cache[key] = entry
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(key)
+        return entry
+
+    def _cached_legal_moves(self, game):
+        entry = self._cache_entry(game)
+        if entry is None:
+            return tuple(self._iter_legal_moves(game))
+        if entry[0] is None:
+            entry[0] = tuple(self._iter_legal_moves(game))
+            entry[2] = bool(entry[0])
+        return entry[0]
+
+    def _is_current_player_in_check(self, game):
+        entry = self._cache_entry(game)
+        if entry is None:
+            return self._is_in_check(game.board, game.current_player)
+        if entry[1] is None:
+            entry[1] = self._is_in_check(game.board, game.current_player)
+        return entry[1]
+
+    def _any_legal_move(self, game):
+        for _ in self._iter_legal_moves(game):
+            return True
         return False
 
-    def _can_move_pawn(self, piece, from_square, to_square, board):
+    def _iter_legal_moves(self, game):
         """
-        Pawn move logic (basic). 
-        DOES NOT handle en passant or promotion in detail.
+        Yields the legal moves of the current player one at a time, so callers
+        that only need to know whether a move exists can stop early.
         """
-        (fr, fc) = from_square
-        (tr, tc) = to_square
-        row_diff = tr - fr
-        col_diff = tc - fc
-        target_piece = board.get_piece(tr, tc)
-
-        direction = -1 if piece.color == Color.WHITE else 1  # White moves up (row decreases), Black down
-
-        # 1. Move forward (no capture)
-        #    - One square forward
-        if col_diff == 0 and row_diff == direction and target_piece is None:
-            return True
+        for square in game.board.piece_squares(game.current_player):
+            for move in self.generate_pseudo_legal_moves(game, square):
+                if self._is_legal(game, move):
+                    yield move
 
-        # 2. Two squares forward from initial rank
-        #    - White from row=6, Black from row=1
-        #    - Must be clear path, and no capture
-        if col_diff == 0 and ((piece.color == Color.WHITE and fr == 6 and row_diff == -2) or
-                              (piece.color == Color.BLACK and fr == 1 and row_diff == 2)):
-            if target_piece is None:
-                # Check the square in between is empty too
-                mid_row = fr + (direction)
-                if board.get_piece(mid_row, fc) is None:
-                    return True
-
-        # 3. Capture move (diagonals)
-        if abs(col_diff) == 1 and row_diff == direction and target_piece is not None:
-            # Opponent piece
-            return target_piece.color != piece.color
+    def _is_legal(self, game, move):
+        """
+        Returns True if the pseudo-legal 'move' does not leave the mover's
+        king in check. Castling may also not start from or pass through check.
+        """
+        board = game.board
+        (fr, fc) = move.from_square
+        (tr, tc) = move.to_square
+        piece = board.get_piece(fr, fc)
+        if piece.piece_type == PieceType.KING and abs(tc - fc) == 2:
+            enemy = Color.BLACK if piece.color == Color.WHITE else Color.WHITE
+            step = 1 if tc > fc else -1
+            if board.is_square_attacked((fr, fc), enemy):
+                return False
+            if board.is_square_attacked((fr, fc + step), enemy):
+                return False
+        return not self._would_leave_king_in_check(game, move)
 
-        return False
+    def _pawn_moves(self, game, piece, square):
+        """
+        Pawn pushes, double pushes, captures, en passant and promotions.
+        """
+        board = game.board
+        (fr, fc) = square
+        direction = -1 if piece.color == Color.WHITE else 1
+        start_row = 6 if piece.color == Color.WHITE else 1
+        last_row = 0 if piece.color == Color.WHITE else 7
+        targets = []
+
+        tr = fr + direction
+        if 0 <= tr < 8:
+            if board.get_piece(tr, fc) is None:
+                targets.append((tr, fc))
+                if fr == start_row and board.get_piece(tr + direction, fc) is None:
+                    targets.append((tr + direction, fc))
+            for tc in (fc - 1, fc + 1):
+                if not 0 <= tc < 8:
+                    continue
+                target_piece = board.get_piece(tr, tc)
+                if target_piece is not None:
+                    if target_piece.color != piece.color:
+                        targets.append((tr, tc))
+                elif self._is_en_passant(game, piece, square, (tr, tc)):
+                    targets.append((tr, tc))
+
+        moves = []
+        for to_square in targets:
+            if to_square[0] == last_row:
+                for promotion in PROMOTION_TYPES:
+                    moves.append(Move(square, to_square, promotion))
+            else:
+                moves.append(Move(square, to_square))
+        return moves
+
+    def _step_moves(self, board, piece, square, targets):
+        """
+        Single-step moves for knights and kings to the precomputed 'targets'.
+        """
+        moves = []
+        for (tr, tc) in targets:
+            target_piece = board.get_piece(tr, tc)
+            if target_piece is None or target_piece.color != piece.color:
+                moves.append(Move(square, (tr, tc)))
+        return moves
+
+    def _sliding_moves(self, board, piece, square, rays):
+        """
+        Moves along precomputed rays for bishops, rooks and queens, stopping
+        at the first piece on each ray (which may be captured if it is an enemy).
+        """
+        moves = []
+        for ray in rays:
+            for (tr, tc) in ray:
+                target_piece = board.get_piece(tr, tc)
+                if target_piece is None:
+                    moves.append(Move(square, (tr, tc)))
+                else:
+                    if target_piece.color != piece.color:
+                        moves.append(Move(square, (tr, tc)))
+                    break
+        return moves
+
+    def _castling_moves(self, board, piece, square):
+        """
+        Castling moves for a king still on its home square. Only the movement
+        conditions are checked here; check-related conditions are in _is_legal.
+        """
+        (fr, fc) = square
+        home_row = 7 if piece.color == Color.WHITE else 0
+        if piece.has_moved or fr != home_row or fc != 4:
+            return []
+        moves = []
+        for rook_col, step in ((7, 1), (0, -1)):
+            rook = board.get_piece(fr, rook_col)
+            if (
+                rook is None
+                or rook.piece_type != PieceType.ROOK
+                or rook.color != piece.color
+                or rook.has_moved
+            ):
+                continue
+            if all(board.get_piece(fr, c) is None for c in range(fc + step, rook_col, step)):
+                moves.append(Move(square, (fr, fc + 2 * step)))
+        return moves
 
     def _is_en_passant(self, game, piece, from_square, to_square):
         """Check if the pawn move is a valid en passant capture."""
@@ -234,104 +384,37 @@ class MovementService:
             return False
         return True
 
-    def _is_path_clear(self, board, from_square, to_square):
+    def _would_leave_king_in_check(self, game, move):
         """
-        Checks if all squares between 'from_square' and 'to_square' are empty 
-        (does not check 'to_square' because capturing an opponent is allowed).
-        For bishops, rooks, queens.
+        Make the move in place, check if the current player's king is in check
+        afterwards, and take the move back.
         """
-        (fr, fc) = from_square
-        (tr, tc) = to_square
-
-        row_step = (tr - fr)
-        col_step = (tc - fc)
-
-        # Normalize to direction -1, 0, or 1
-        if row_step != 0:
-            row_step = row_step // abs(row_step)
-        if col_step != 0:
-            col_step = col_step // abs(col_step)
-
-        current_r = fr + row_step
-        current_c = fc + col_step
-
-        while (current_r, current_c) != (tr, tc):
-            if board.get_piece(current_r, current_c) is not None:
-                return False
-            current_r += row_step
-            current_c += col_step
-
-        return True
-
-    def _would_leave_king_in_check(self, game, from_square, to_square):
-        """
-        Simulate the move and check if the current player's king is in check afterwards.
-        """
-        simulated_game = self._simulate_move(game, from_square, to_square)
-        return self._is_in_check(simulated_game.board, game.current_player)
+        color = game.current_player
+        undo = self._simulate_move(game, move)
+        try:
+            return self._is_in_check(game.board, color)
+        finally:
+            game.unmake_move(undo)
 
     def _is_in_check(self, board, color):
         """
         Checks if 'color' player's king is in check.
         That means there's an opponent piece that can capture the king next move.
         """
-        # 1. Find king position
-        king_pos = self._find_king(board, color)
+        king_pos = board.find_king(color)
         if not king_pos:
             return False  # Shouldn't happen in a real game, but let's just say not in check
+        enemy = Color.BLACK if color == Color.WHITE else Color.WHITE
+        return board.is_square_attacked(king_pos, enemy)
 
-        # 2. For each enemy piece, check if it can move to king position
-        for row in range(8):
-            for col in range(8):
-                piece = board.get_piece(row, col)
-                if piece and piece.color != color:
-                    if self._can_move_piece(piece, (row, col), king_pos, board):
-                        # Also need to check if path is clear (for rook, bishop, queen).
-                        # For a direct capture, we ignore if the king is there, but let's do the same path check:
-                        if piece.piece_type in [PieceType.ROOK, PieceType.BISHOP, PieceType.QUEEN]:
-                            if not self._is_path_clear(board, (row, col), king_pos):
-                                continue
-                        return True
-        return False
-
-    def _simulate_move(self, game, from_square, to_square):
-        """
-        Returns a *deep copy* of the game with the move applied.
-        This way we can check for hypothetical scenarios (like check).
-        """
-        new_game = deepcopy(game)
-        new_board = new_game.board
-
-        (fr, fc) = from_square
-        (tr, tc) = to_square
-
-        piece = new_board.grid[fr][fc]
-        new_board.grid[fr][fc] = None
-        # Handle en passant in simulation
-        if self._is_en_passant(game, piece, from_square, to_square):
-            capture_row = fr
-            capture_col = tc
-            new_board.grid[capture_row][capture_col] = None
-
-        new_board.grid[tr][tc] = piece
-
-        # Record last move in the simulated game
-        new_game.last_move = (piece, from_square, to_square)
-
-        # Switch player in the simulated game
-        new_game._switch_player()  # or however your real code does it
-        return new_game
-
-    def _find_king(self, board, color):
+    def _simulate_move(self, game, move):
         """
-        Find the square (row, col) of the king of 'color'.
+        Applies the move to the game *in place* and returns the undo record.
+        The caller must pass it to game.unmake_move to restore the position.
+        This way we can check for hypothetical scenarios (like check) without
+        copying the game.
         """
-        for row in range(8):
-            for col in range(8):
-                piece = board.get_piece(row, col)
-                if piece and piece.color == color and piece.piece_type == PieceType.KING:
-                    return (row, col)
-        return None
+        return game.make_move(move)
 
     def _in_bounds(self, r, c):
         """
@@ -0,0 +1,112 @@
+"""Zobrist keys for position hashing.
+
+A position's key is the XOR of one random 64-bit number per (piece, square),
+plus keys for the side to move, each castling right and the en passant file.
+The numbers come from a fixed seed so keys are stable across processes.
+"""
+
+import random
+
+from domain.piece import Color, PieceType
+
+_rng = random.Random(0x5EED_C4E55)
+
+
+def _random64():
+    return _rng.getrandbits(64)
+
+
+PIECE_KEYS = {
+    (color, piece_type): tuple(_random64() for _ in range(64))
+    for color in (Color.WHITE, Color.BLACK)
+    for piece_type in (
+        PieceType.PAWN,
+        PieceType.KNIGHT,
+        PieceType.BISHOP,
+        PieceType.ROOK,
+        PieceType.QUEEN,
+        PieceType.KING,
+    )
+}
+BLACK_TO_MOVE_KEY = _random64()
+# White kingside, white queenside, black kingside, black queenside.
+CASTLING_KEYS = tuple(_random64() for _ in range(4))
+EN_PASSANT_KEYS = tuple(_random64() for _ in range(8))
+
+# (color, king home row, rook column, index into CASTLING_KEYS)
+CASTLING_RIGHTS = (
+    (Color.WHITE, 7, 7, 0),
+    (Color.WHITE, 7, 0, 1),
+    (Color.BLACK, 0, 7, 2),
+    (Color.BLACK, 0, 0, 3),
+)
+
+
+def board_key(board):
+    """Compute the piece part of a key from scratch."""
+    key = 0
+    for row in range(8):
+        for col in range(8):
+            piece = board.get_piece(row, col)
+            if piece is not None:
+                key ^= PIECE_KEYS[(piece.color, piece.piece_type)][row * 8 + col]
+    return key
+
+
+def castling_rights(board):
+    """
+    Return the castling rights still available as indexes into CASTLING_KEYS.
+    A right exists while the king and that rook stand unmoved on their
+    home squares.
+    """
+    rights = []
+    for color, row, rook_col, index in CASTLING_RIGHTS:
+        king = board.get_piece(row, 4)
+        rook = board.get_piece(row, rook_col)
+        if (
+            king is not None and king.color == color
+            and king.piece_type == PieceType.KING and not king.has_moved
+            and rook is not None and rook.color == color
+            and rook.piece_type == PieceType.ROOK and not rook.has_moved
+        ):
+            rights.append(index)
+    return rights
+
+
+def en_passant_file(game):
+    """
+    Return the file (column) on which the side to move can capture en
+    passant, or None. Like Polyglot, the file only counts when a pawn of
+    the side to move stands next to the pawn that just advanced two squares.
+    """
+    last = game.last_move
+    if not last:
+        return None
+    last_piece, last_from, last_to = last
+    if last_piece.piece_type != PieceType.PAWN or abs(last_to[0] - last_from[0]) != 2:
+        return None
+    (row, col) = last_to
+    for c in (col - 1, col + 1):
+        if 0 <= c < 8:
+            piece = game.board.get_piece(row, c)
+            if (
+                piece is not None
+                and piece.piece_type == PieceType.PAWN
+                and piece.color == game.current_player
+                and piece.color != last_piece.color
+            ):
+                return col
+    return None
+
+
+def position_key(game):
+    """Full key of the game's position: pieces, side, castling and en passant."""
+    key = game.board.zobrist_key
+    if game.current_player == Color.BLACK:
+        key ^= BLACK_TO_MOVE_KEY
+    for index in castling_rights(game.board):
+        key ^= CASTLING_KEYS[index]
+    file = en_passant_file(game)
+    if file is not None:
+        key ^= EN_PASSANT_KEYS[file]
+    return key
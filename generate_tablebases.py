@@ -0,0 +1,44 @@
+"""Generate endgame tablebases.
+
+Run from the project root:
+
+    python generate_tablebases.py                         # KQK KRK KPK KBNK into tablebases/
+    python generate_tablebases.py KQK KRK --directory tb
+    python main.py --computer black --tablebases tablebases
+
+KQK, KRK and KPK take seconds; KBNK, with 64 times as many positions,
+takes minutes. Existing tables are kept. See adapters/tablebase.py.
+"""
+
+import argparse
+import sys
+import time
+
+from adapters.tablebase import MATERIALS, generate_tables
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Endgame tablebase generator.")
+    parser.add_argument('materials', nargs='*', metavar='MATERIAL',
+                        help=f"tables to generate: {', '.join(MATERIALS)} (default all)")
+    parser.add_argument('--directory', default='tablebases', help="output directory (default tablebases)")
+    args = parser.parse_args(argv)
+
+    def progress(name, plies):
+        print(f"\r{name}: {plies} plies", end='', file=sys.stderr, flush=True)
+
+    unknown = [name for name in args.materials if name not in MATERIALS]
+    if unknown:
+        parser.error(f"unknown material: {', '.join(unknown)}")
+
+    start = time.perf_counter()
+    written = generate_tables(args.directory, args.materials or None, progress)
+    print(file=sys.stderr)
+    for path in written:
+        print(f"Wrote {path}")
+    print(f"Done in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,115 @@
+"""Load generator for the JSON game server.
+
+Run from the project root against a running `python server.py`:
+
+    python load_test.py                                # 20 connections, 5 games each
+    python load_test.py --connections 200 --games 10 --plies 40
+
+Every connection starts its games and plays random legal moves in them,
+one request at a time per game, until a game ends or reaches --plies.
+Reports moves/second and client-side p50/p99 latency per request type.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+
+from adapters.metrics import LatencyHistogram
+from domain.game import FINISHED_STATUSES
+
+
+class Connection:
+    """One client connection with pipelined, id-matched requests."""
+    def __init__(self, reader, writer, histograms):
+        self.reader = reader
+        self.writer = writer
+        self.histograms = histograms
+        self.pending = {}
+        self.next_id = 0
+        self.listener = asyncio.ensure_future(self._listen())
+
+    async def request(self, op, **fields):
+        self.next_id += 1
+        request_id = self.next_id
+        future = asyncio.get_running_loop().create_future()
+        self.pending[request_id] = future
+        began = time.perf_counter()
+        self.writer.write(json.dumps(dict(fields, id=request_id, op=op)).encode() + b'\n')
+        await self.writer.drain()
+        response = await future
+        self.histograms.setdefault(op, LatencyHistogram()).record(time.perf_counter() - began)
+        if not response['ok']:
+            raise Exception(response['error'])
+        return response
+
+    async def close(self):
+        self.writer.close()
+        self.listener.cancel()
+
+    async def _listen(self):
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                break
+            response = json.loads(line)
+            future = self.pending.pop(response['id'], None)
+            if future is not None:
+                future.set_result(response)
+
+
+async def play_game(connection, plies, rng):
+    game_id = (await connection.request('start'))['game_id']
+    moves = 0
+    for _ in range(plies):
+        legal = (await connection.request('legal_moves', game_id=game_id))['moves']
+        if not legal:
+            break
+        moved = await connection.request('move', game_id=game_id, move=rng.choice(legal))
+        moves += 1
+        if moved['status'] in FINISHED_STATUSES:
+            break
+    return moves
+
+
+async def run(args):
+    histograms = {}
+    connections = []
+    for _ in range(args.connections):
+        reader, writer = await asyncio.open_connection(args.host, args.port)
+        connections.append(Connection(reader, writer, histograms))
+
+    rng = random.Random(args.seed)
+    began = time.perf_counter()
+    results = await asyncio.gather(*(
+        play_game(connection, args.plies, random.Random(rng.random()))
+        for connection in connections for _ in range(args.games)
+    ))
+    elapsed = time.perf_counter() - began
+    for connection in connections:
+        await connection.close()
+
+    moves = sum(results)
+    print(f"{len(results)} games, {moves} moves in {elapsed:.2f}s: {moves / elapsed:.0f} moves/s")
+    print(f"{'request':12} {'count':>8} {'p50 ms':>8} {'p99 ms':>8}")
+    for op, histogram in sorted(histograms.items()):
+        print(f"{op:12} {histogram.count:8} {histogram.percentile(0.5) * 1000:8.2f} "
+              f"{histogram.percentile(0.99) * 1000:8.2f}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load generator for server.py.")
+    parser.add_argument('--host', default='127.0.0.1', help="server address (default 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8765, help="server port (default 8765)")
+    parser.add_argument('--connections', type=int, default=20, help="client connections (default 20)")
+    parser.add_argument('--games', type=int, default=5, help="games played per connection (default 5)")
+    parser.add_argument('--plies', type=int, default=30, help="moves per game at most (default 30)")
+    parser.add_argument('--seed', type=int, default=1, help="random seed (default 1)")
+    asyncio.run(run(parser.parse_args(argv)))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
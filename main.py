@@ -1,20 +1,112 @@
+import argparse
+from contextlib import nullcontext
+
+from adapters.alpha_beta_engine import AlphaBetaEngine
+from adapters.book_engine import BookEngine
+from adapters.caching_game_repository import CachingGameRepository
 from adapters.file_game_repository import FileGameRepository
-from adapters.pygame_ui import PygameChessUI
-from application.use_cases import StartGameUseCase, MovePieceUseCase
+from adapters.instrumentation import (GameProfiler, Instrumentation, REPOSITORY_METHODS,
+                                      SERVICE_METHODS, USE_CASE_METHODS)
+from adapters.journaled_game_repository import JournaledFileGameRepository
+from adapters.null_ui import NullChessUI
+from adapters.parallel_engine import ParallelSearchEngine
+from adapters.polyglot_book import PolyglotBook
+from adapters.sqlite_game_repository import SqliteGameRepository
+from adapters.tablebase import Tablebases
+from adapters.tablebase_engine import TablebaseEngine
+from adapters.text_ui import TextChessUI
+from application.use_cases import StartGameUseCase, MovePieceUseCase, FindBestMoveUseCase
+from domain.game import DRAW_STATUSES
+from domain.piece import Color
 from domain.services import MovementService
 
+def parse_args():
+    parser = argparse.ArgumentParser(description="Play chess.")
+    parser.add_argument('--computer', choices=['white', 'black', 'both'],
+                        help="let the computer play this color, or both for engine-vs-engine")
+    parser.add_argument('--ui', choices=['pygame', 'text', 'null'], default='pygame',
+                        help="pygame window (default), terminal text, or no display at all")
+    parser.add_argument('--max-plies', type=int,
+                        help="stop after this many moves (for headless runs)")
+    parser.add_argument('--think-time', type=float, default=2.0,
+                        help="seconds the computer may think per move (default 2)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="processes the computer searches with (default 1)")
+    parser.add_argument('--journal', action='store_true',
+                        help="save games as a snapshot plus an append-only move log")
+    parser.add_argument('--compact', action='store_true',
+                        help="write saved_games/ files in the compact game codec instead of pickle")
+    parser.add_argument('--db', metavar='PATH',
+                        help="save games in this SQLite database instead of saved_games/")
+    parser.add_argument('--book', metavar='PATH',
+                        help="let the computer play from this opening book (see build_book.py)")
+    parser.add_argument('--tablebases', metavar='DIR',
+                        help="let the computer play endgames from these tables (see generate_tablebases.py)")
+    parser.add_argument('--metrics', metavar='PATH',
+                        help="time use cases, rules and repository calls; write the histograms to PATH "
+                             "(JSON if it ends in .json, Prometheus text otherwise)")
+    parser.add_argument('--profile', metavar='DIR',
+                        help="cProfile each game and write DIR/<game_id>.prof when it ends")
+    return parser.parse_args()
+
+def create_ui(kind):
+    if kind == 'text':
+        return TextChessUI()
+    if kind == 'null':
+        return NullChessUI()
+    # Imported here so the headless modes never load pygame.
+    from adapters.pygame_ui import PygameChessUI
+    return PygameChessUI()
+
 def main():
+    args = parse_args()
+
     # Setup
-    game_repository = FileGameRepository()
+    if args.db:
+        store = SqliteGameRepository(args.db)
+    elif args.journal:
+        store = JournaledFileGameRepository(compact=args.compact)
+    else:
+        store = FileGameRepository(compact=args.compact)
+    # Keep the game being played in memory; dirty games are written behind.
+    game_repository = CachingGameRepository(store)
     movement_service = MovementService()
-    ui = PygameChessUI()
+    ui = create_ui(args.ui)
 
     start_game_uc = StartGameUseCase(game_repository)
     move_piece_uc = MovePieceUseCase(game_repository, movement_service)
+    instrumentation = None
+    if args.metrics:
+        instrumentation = Instrumentation()
+        instrumentation.wrap(movement_service, SERVICE_METHODS, 'movement_service')
+        # 'repository' is the in-memory cache the use cases see; the store
+        # behind it is where disk or database latency shows up.
+        instrumentation.wrap(game_repository, REPOSITORY_METHODS, 'repository')
+        instrumentation.wrap(store, REPOSITORY_METHODS, 'backing_repository')
+        instrumentation.wrap(start_game_uc, USE_CASE_METHODS, 'start_game')
+        instrumentation.wrap(move_piece_uc, USE_CASE_METHODS, 'move_piece')
+    profiler = GameProfiler(args.profile) if args.profile else None
+    computer_colors = set()
+    parallel_engine = None
+    if args.computer == 'both':
+        computer_colors = {Color.WHITE, Color.BLACK}
+    elif args.computer:
+        computer_colors = {args.computer.upper()}
+    if computer_colors:
+        if args.workers > 1:
+            # Its worker pool is shut down when the game loop ends.
+            engine = parallel_engine = ParallelSearchEngine(args.workers, time_limit=args.think_time)
+        else:
+            engine = AlphaBetaEngine(movement_service, time_limit=args.think_time)
+        if args.book:
+            engine = BookEngine(PolyglotBook(args.book), engine, movement_service)
+        if args.tablebases:
+            engine = TablebaseEngine(Tablebases(args.tablebases, movement_service), engine)
+        find_best_move_uc = FindBestMoveUseCase(game_repository, engine)
 
     game_id = None
     saved_games = game_repository.list_game_ids()
-    if saved_games:
+    if saved_games and args.ui != 'null':
         print("Saved games:")
         for idx, gid in enumerate(saved_games, 1):
             print(f"{idx}. {gid}")
@@ -25,30 +117,62 @@ def main():
     if not game_id:
         game_id = start_game_uc.execute()
 
-    running = True
-    selected_square = None
+    try:
+        running = True
+        selected_square = None
 
-    while running:
-        game = game_repository.find_by_id(game_id)
-        ui.draw_board(game)
-        
-        # Get a square selection from player
-        square = ui.get_player_input(game.current_player)
+        while running:
+            game = game_repository.find_by_id(game_id)
+            ui.draw_board(game)
 
-        if selected_square is None:
-            selected_square = square
-        else:
-            # Attempt to move from selected_square to square
-            try:
-                move_piece_uc.execute(game_id, selected_square, square)
-            except Exception as ex:
-                ui.show_message(str(ex))
-            selected_square = None
-
-        # If the game ended, you might break or show a winner screen, etc.
-        if game.status == 'CHECKMATE':
-            print("Checkmate! " + game.current_player + " loses.")
-            running = False
+            if args.max_plies is not None and len(game.move_history) >= args.max_plies:
+                break
+
+            # Profile the engine and the rules, not the wait for input.
+            profiling = profiler.profile(game_id) if profiler else nullcontext()
+            if game.current_player in computer_colors and not game.is_finished():
+                with profiling:
+                    move = find_best_move_uc.execute(game_id)
+                    if move is not None:
+                        game = move_piece_uc.execute(game_id, move.from_square, move.to_square, move.promotion)
+                if move is None:
+                    print("Stalemate.")
+                    break
+            else:
+                # Get a square selection from player
+                try:
+                    square = ui.get_player_input(game.current_player)
+                except EOFError:
+                    break
+
+                if selected_square is None:
+                    selected_square = square
+                else:
+                    # Attempt to move from selected_square to square
+                    try:
+                        with profiling:
+                            move_piece_uc.execute(game_id, selected_square, square)
+                    except Exception as ex:
+                        ui.show_message(str(ex))
+                    selected_square = None
+
+            # If the game ended, you might break or show a winner screen, etc.
+            if game.status == 'CHECKMATE':
+                print("Checkmate! " + game.current_player + " loses.")
+                running = False
+            elif game.status in DRAW_STATUSES:
+                print(f"Draw ({game.status}).")
+                running = False
+    finally:
+        game_repository.close()
+        if parallel_engine:
+            parallel_engine.close()
+        if profiler:
+            for path in profiler.dump_all():
+                print(f"Profile written to {path}")
+        if instrumentation:
+            instrumentation.write(args.metrics)
+            print(f"Metrics written to {args.metrics}")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,176 @@
+"""Perft: count leaf nodes of the legal move tree to a fixed depth.
+
+Run from the project root:
+
+    python perft.py                     # reference suite, depth 3
+    python perft.py --depth 4 --bitboard
+    python perft.py --fen "<FEN>" --depth 3 --divide
+    python perft.py --depth 4 --workers 8
+
+Counts are checked against published reference values, which makes perft a
+correctness oracle for castling, en passant and promotion, and the
+nodes/second figure a throughput number to track across releases.
+"""
+
+import argparse
+import multiprocessing
+import sys
+import time
+
+from application.use_cases import StartGameUseCase
+from domain.bitboard import BitboardBoard
+from domain.board import Board
+from domain.game import Game
+from domain.notation import game_from_fen, game_to_fen, move_to_uci, parse_uci
+from domain.piece import Color
+from domain.services import MovementService
+
+# (name, FEN or None for StartGameUseCase's initial board, reference counts
+# for depth 1, 2, 3, ...). From the Chess Programming Wiki perft results.
+PERFT_SUITE = [
+    ('initial', None, [20, 400, 8902, 197281, 4865609]),
+    ('kiwipete', 'r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1',
+     [48, 2039, 97862, 4085603]),
+    ('position3', '8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1',
+     [14, 191, 2812, 43238, 674624]),
+    ('position4', 'r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1',
+     [6, 264, 9467, 422333]),
+    ('position5', 'rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8',
+     [44, 1486, 62379, 2103487]),
+    ('position6', 'r4rk1/1pp1qppp/p1np1n2/2b1p1B1/2B1P1b1/P1NP1N2/1PP1QPPP/R4RK1 w - - 0 10',
+     [46, 2079, 89890, 3894594]),
+]
+
+
+def perft(game, depth, movement_service):
+    """
+    Return the number of leaf nodes 'depth' plies below the game's position.
+    The game is walked with make_move/unmake_move and left unchanged.
+    """
+    if depth == 0:
+        return 1
+    moves = movement_service.generate_legal_moves(game)
+    if depth == 1:
+        return len(moves)
+    nodes = 0
+    for move in moves:
+        undo = game.make_move(move)
+        nodes += perft(game, depth - 1, movement_service)
+        game.unmake_move(undo)
+    return nodes
+
+
+def divide(game, depth, movement_service):
+    """Return {uci move: leaf count} for every root move, to locate bugs."""
+    counts = {}
+    for move in movement_service.generate_legal_moves(game):
+        undo = game.make_move(move)
+        counts[move_to_uci(move)] = perft(game, depth - 1, movement_service)
+        game.unmake_move(undo)
+    return counts
+
+
+def _perft_chunk(fen, ucis, depth, bitboard):
+    """Worker task: total perft of the root moves 'ucis' of position 'fen'."""
+    game = game_from_fen(fen, BitboardBoard if bitboard else Board)
+    movement_service = MovementService(cache_size=0)
+    nodes = 0
+    for uci in ucis:
+        undo = game.make_move(parse_uci(uci))
+        nodes += perft(game, depth - 1, movement_service)
+        game.unmake_move(undo)
+    return nodes
+
+
+def parallel_perft(game, depth, pool, workers, movement_service):
+    """
+    Perft with the root moves split over a multiprocessing pool. Positions
+    are sent to the workers as FEN and moves as UCI strings.
+    """
+    if depth <= 1:
+        return perft(game, depth, movement_service)
+    fen = game_to_fen(game)
+    bitboard = type(game.board).__name__ == 'BitboardBoard'
+    ucis = [move_to_uci(move) for move in movement_service.generate_legal_moves(game)]
+    tasks = [(fen, ucis[i::workers], depth, bitboard) for i in range(workers) if ucis[i::workers]]
+    return sum(pool.starmap(_perft_chunk, tasks))
+
+
+def load_position(fen, board_factory):
+    if fen is None:
+        board = StartGameUseCase(None, board_factory)._create_initial_board()
+        return Game(board, Color.WHITE)
+    return game_from_fen(fen, board_factory)
+
+
+def run_suite(depth, board_factory, movement_service, out=sys.stdout, pool=None, workers=1):
+    """
+    Run every suite position to 'depth'. Returns True if all counts match.
+    With a pool, each position's root moves are split over 'workers' processes.
+    """
+    all_ok = True
+    total_nodes = 0
+    total_time = 0.0
+    for name, fen, expected in PERFT_SUITE:
+        game = load_position(fen, board_factory)
+        d = min(depth, len(expected))
+        start = time.perf_counter()
+        if pool is not None:
+            nodes = parallel_perft(game, d, pool, workers, movement_service)
+        else:
+            nodes = perft(game, d, movement_service)
+        elapsed = time.perf_counter() - start
+        ok = nodes == expected[d - 1]
+        all_ok = all_ok and ok
+        total_nodes += nodes
+        total_time += elapsed
+        print(f"{name:<10} depth {d}  nodes {nodes:>9}  expected {expected[d - 1]:>9}  "
+              f"{'ok  ' if ok else 'FAIL'}  {elapsed:7.2f}s  {nodes / max(elapsed, 1e-9):>9.0f} nps",
+              file=out)
+    print(f"total      nodes {total_nodes}  {total_time:.2f}s  "
+          f"{total_nodes / max(total_time, 1e-9):.0f} nps", file=out)
+    return all_ok
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Perft move generation test and benchmark.")
+    parser.add_argument('--depth', type=int, default=3, help="search depth in plies (default 3)")
+    parser.add_argument('--fen', help="run a single position instead of the reference suite")
+    parser.add_argument('--divide', action='store_true', help="print the leaf count of every root move")
+    parser.add_argument('--bitboard', action='store_true', help="use BitboardBoard instead of Board")
+    parser.add_argument('--cache', type=int, default=0,
+                        help="MovementService position cache size (default 0: measure raw generation)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="split root moves over this many processes (default 1)")
+    args = parser.parse_args(argv)
+
+    board_factory = BitboardBoard if args.bitboard else Board
+    movement_service = MovementService(cache_size=args.cache)
+
+    if args.fen is None and not args.divide:
+        if args.workers > 1:
+            with multiprocessing.Pool(args.workers) as pool:
+                ok = run_suite(args.depth, board_factory, movement_service, pool=pool, workers=args.workers)
+        else:
+            ok = run_suite(args.depth, board_factory, movement_service)
+        return 0 if ok else 1
+
+    game = load_position(args.fen, board_factory)
+    start = time.perf_counter()
+    if args.divide:
+        counts = divide(game, args.depth, movement_service)
+        for uci in sorted(counts):
+            print(f"{uci}: {counts[uci]}")
+        nodes = sum(counts.values())
+    elif args.workers > 1:
+        with multiprocessing.Pool(args.workers) as pool:
+            nodes = parallel_perft(game, args.depth, pool, args.workers, movement_service)
+    else:
+        nodes = perft(game, args.depth, movement_service)
+    elapsed = time.perf_counter() - start
+    print(f"depth {args.depth}  nodes {nodes}  {elapsed:.2f}s  {nodes / max(elapsed, 1e-9):.0f} nps")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
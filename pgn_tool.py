@@ -0,0 +1,65 @@
+"""Import games from PGN files into a repository, or export them to PGN.
+
+Run from the project root:
+
+    python pgn_tool.py import games.pgn                 # into saved_games/
+    python pgn_tool.py import games.pgn --db games.db
+    python pgn_tool.py export all.pgn --directory saved_games
+    python pgn_tool.py export - --db games.db           # to standard output
+
+Every imported move is checked with MovementService; an illegal or
+ambiguous move stops the import with the game and ply that failed.
+"""
+
+import argparse
+import sys
+import time
+
+from adapters.file_game_repository import FileGameRepository
+from adapters.pgn import export_repository, import_pgn
+from adapters.sqlite_game_repository import SqliteGameRepository
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="PGN import and export.")
+    parser.add_argument('command', choices=['import', 'export'])
+    parser.add_argument('path', help="PGN file to read or write ('-' for standard input/output)")
+    parser.add_argument('--directory', default='saved_games', help="game directory (default saved_games)")
+    parser.add_argument('--db', metavar='PATH', help="use an SQLite database instead of the directory")
+    parser.add_argument('--compact', action='store_true', help="save imported games in the game codec")
+    args = parser.parse_args(argv)
+
+    if args.db:
+        repository = SqliteGameRepository(args.db)
+    else:
+        repository = FileGameRepository(args.directory, compact=args.compact)
+
+    start = time.perf_counter()
+    try:
+        if args.command == 'import':
+            stream = sys.stdin if args.path == '-' else open(args.path, encoding='utf-8', errors='replace')
+            try:
+                count = import_pgn(stream, repository)
+            finally:
+                if stream is not sys.stdin:
+                    stream.close()
+        else:
+            stream = sys.stdout if args.path == '-' else open(args.path, 'w', encoding='utf-8')
+            try:
+                count = export_repository(repository, stream)
+            finally:
+                if stream is not sys.stdout:
+                    stream.close()
+    except ValueError as ex:
+        print(f"Error: {ex}", file=sys.stderr)
+        return 1
+    finally:
+        if args.db:
+            repository.close()
+    elapsed = time.perf_counter() - start
+    print(f"{args.command}ed {count} games in {elapsed:.2f}s", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+
+class AsyncGameRepository(ABC):
+    """The GameRepository port for asyncio code: every method is a coroutine."""
+    @abstractmethod
+    async def save(self, game):
+        pass
+
+    @abstractmethod
+    async def find_by_id(self, game_id):
+        pass
+
+    @abstractmethod
+    async def list_game_ids(self):
+        """Return a list of saved game IDs."""
+        pass
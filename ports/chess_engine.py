@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+
+class ChessEnginePort(ABC):
+    @abstractmethod
+    def find_best_move(self, game):
+        """Return the Move the engine would play for the side to move, or
+        None if there is no legal move."""
+        pass
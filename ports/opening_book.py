@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+
+class OpeningBookPort(ABC):
+    @abstractmethod
+    def find_moves(self, game):
+        """Return the book moves for the side to move as a list of
+        (Move, weight) pairs, heaviest first; empty when out of book."""
+        pass
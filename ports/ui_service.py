@@ -7,4 +7,12 @@ class ChessUIService(ABC):
 
     @abstractmethod
     def get_player_input(self, current_player):
+        """
+        Return the next square (row, col) the player picked. Raises
+        EOFError when no more input will come.
+        """
+        pass
+
+    def show_message(self, message, duration=2000):
+        """Tell the player something, e.g. why a move was refused."""
         pass
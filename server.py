@@ -0,0 +1,54 @@
+"""Run the line-delimited JSON game server.
+
+Run from the project root:
+
+    python server.py                          # games kept in memory, port 8765
+    python server.py --directory server_games # games saved in the compact codec
+    python load_test.py --connections 50 --games 4
+
+See adapters/json_server.py for the protocol.
+"""
+
+import argparse
+import asyncio
+import sys
+
+from adapters.executor_game_repository import ExecutorGameRepository
+from adapters.file_game_repository import FileGameRepository
+from adapters.in_memory_game_repository import InMemoryGameRepository
+from adapters.json_server import ChessJsonServer
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Multi-game JSON chess server.")
+    parser.add_argument('--host', default='127.0.0.1', help="address to listen on (default 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8765, help="port to listen on (default 8765)")
+    parser.add_argument('--directory', help="save games in this directory instead of memory")
+    parser.add_argument('--io-threads', type=int, default=4, help="threads doing repository I/O (default 4)")
+    parser.add_argument('--max-in-flight', type=int, default=32,
+                        help="requests handled at once per connection (default 32)")
+    args = parser.parse_args(argv)
+
+    if args.directory:
+        store = FileGameRepository(args.directory, compact=True)
+    else:
+        store = InMemoryGameRepository()
+    repository = ExecutorGameRepository(store, max_workers=args.io_threads)
+    server = ChessJsonServer(repository, host=args.host, port=args.port, max_in_flight=args.max_in_flight)
+
+    async def run():
+        await server.start()
+        print(f"Serving on {server.host}:{server.port}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        repository.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+# test_archive_validation.py
+
+import io
+import json
+import unittest
+
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PARENT_DIR = PROJECT_ROOT.parent
+for path in (PARENT_DIR, PROJECT_ROOT):
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+from chess_game.adapters.archive_validation import validate_archive, validate_record
+from chess_game.domain.services import MovementService
+
+GAMES = (
+    '[White "Mate"]\n\n1. e4 e5 2. Bc4 Nc6 3. Qh5 Nf6 4. Qxf7# 1-0\n',
+    '[White "Stalemate"]\n[FEN "7k/8/6Q1/8/8/8/8/K7 w - - 0 1"]\n\n1. Qf7 *\n',
+    '[White "Illegal"]\n\n1. e4 e5 2. Ke3 *\n',
+    '[White "Check"]\n\n1. e4 f5 2. Qh5+ *\n',
+)
+
+
+class TestArchiveValidation(unittest.TestCase):
+    def test_record_annotations(self):
+        service = MovementService()
+        reports = [validate_record(1, {'White': 'x'}, text.split('\n\n')[1], service) for text in GAMES[::2]]
+        self.assertEqual(reports[0]['status'], 'CHECKMATE')
+        self.assertEqual(reports[0]['checks'], 1)
+        self.assertEqual(reports[1]['status'], 'ILLEGAL')
+        self.assertIn('ply 3', reports[1]['error'])
+
+    def test_draw_statuses(self):
+        service = MovementService()
+        cases = (
+            ({}, '1. Nf3 Nf6 2. Ng1 Ng8 3. Nf3 Nf6 4. Ng1 Ng8', 'DRAW_REPETITION'),
+            ({'FEN': '4k3/8/8/8/8/8/4P3/R3K3 w - - 99 80'}, '80. Ra2', 'DRAW_FIFTY_MOVES'),
+            ({'FEN': '4k3/8/8/8/8/8/4r3/3NK3 w - - 0 1'}, '1. Kxe2', 'DRAW_INSUFFICIENT_MATERIAL'),
+        )
+        for tags, movetext, status in cases:
+            with self.subTest(status=status):
+                self.assertEqual(validate_record(1, tags, movetext, service)['status'], status)
+
+    def test_bad_record_does_not_stop_the_archive(self):
+        archive = GAMES[0] + '\n[White "Bad FEN"]\n[FEN "4k3/8/8/8/8/8/8/4K3 w - a1 0 1"]\n\n*\n'
+        output = io.StringIO()
+        stats = validate_archive(io.StringIO(archive), output, workers=1)
+        reports = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual([(report['game'], report['white'], report['status']) for report in reports],
+                         [(1, 'Mate', 'CHECKMATE'), (2, 'Bad FEN', 'ILLEGAL')])
+        self.assertIn('en passant', reports[1]['error'])
+        self.assertEqual(stats.games, 2)
+
+    def test_unexpected_error_is_reported(self):
+        class BrokenService(MovementService):
+            def end_status(self, game):
+                raise IndexError('list index out of range')
+
+        report = validate_record(1, {}, '1. e4 *', BrokenService())
+        self.assertEqual(report['status'], 'ILLEGAL')
+        self.assertEqual(report['error'], 'IndexError: list index out of range')
+
+    def test_pipeline_writes_reports_in_archive_order(self):
+        archive = '\n'.join(GAMES * 5)
+        output = io.StringIO()
+        seen = []
+        stats = validate_archive(io.StringIO(archive), output, workers=2, chunk_size=3,
+                                 max_in_flight=2, progress=lambda stats: seen.append(stats.games))
+        reports = [json.loads(line) for line in output.getvalue().splitlines()]
+        self.assertEqual([report['game'] for report in reports], list(range(1, 21)))
+        self.assertEqual([report['white'] for report in reports[:4]],
+                         ['Mate', 'Stalemate', 'Illegal', 'Check'])
+        self.assertEqual([report['status'] for report in reports[:4]],
+                         ['CHECKMATE', 'STALEMATE', 'ILLEGAL', 'CHECK'])
+        self.assertEqual(stats.games, 20)
+        self.assertEqual(stats.chunks, 7)
+        self.assertEqual(stats.statuses['ILLEGAL'], 5)
+        self.assertEqual(sum(worker.games for worker in stats.workers.values()), 20)
+        self.assertEqual(seen[-1], 20)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+# test_async_use_cases.py
+
+import asyncio
+import time
+import unittest
+
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PARENT_DIR = PROJECT_ROOT.parent
+for path in (PARENT_DIR, PROJECT_ROOT):
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+from chess_game.adapters.executor_game_repository import ExecutorGameRepository
+from chess_game.adapters.in_memory_game_repository import InMemoryGameRepository
+from chess_game.application.async_use_cases import (
+    AsyncMovePieceUseCase, AsyncStartGameUseCase, GameLocks,
+)
+
+
+class SlowRepository(InMemoryGameRepository):
+    """Blocks like a slow disk on every save."""
+    def save(self, game):
+        time.sleep(0.05)
+        return super().save(game)
+
+
+class TestAsyncUseCases(unittest.TestCase):
+    def setUp(self):
+        self.repository = ExecutorGameRepository(SlowRepository(), max_workers=4)
+
+    def tearDown(self):
+        self.repository.close()
+
+    def test_moves_on_one_game_are_serialized(self):
+        async def scenario():
+            game_id = await AsyncStartGameUseCase(self.repository).execute()
+            locks = GameLocks()
+            use_case = AsyncMovePieceUseCase(self.repository, locks=locks)
+            # Both requests try the same move; only the first can be legal.
+            results = await asyncio.gather(
+                use_case.execute(game_id, (6, 4), (4, 4)),
+                use_case.execute(game_id, (6, 4), (4, 4)),
+                return_exceptions=True,
+            )
+            self.assertEqual(len(locks), 0)
+            return results
+
+        results = asyncio.run(scenario())
+        self.assertEqual(sum(isinstance(result, Exception) for result in results), 1)
+
+    def test_different_games_proceed_in_parallel(self):
+        async def scenario():
+            start = AsyncStartGameUseCase(self.repository)
+            game_ids = await asyncio.gather(*(start.execute() for _ in range(4)))
+            use_case = AsyncMovePieceUseCase(self.repository)
+            began = time.perf_counter()
+            games = await asyncio.gather(*(use_case.execute(g, (6, 4), (4, 4)) for g in game_ids))
+            return games, time.perf_counter() - began
+
+        games, elapsed = asyncio.run(scenario())
+        self.assertTrue(all(game.current_player == 'BLACK' for game in games))
+        # Four 50 ms saves overlapped rather than running back to back.
+        self.assertLess(elapsed, 0.15)
+
+    def test_missing_game(self):
+        use_case = AsyncMovePieceUseCase(self.repository)
+        with self.assertRaises(Exception):
+            asyncio.run(use_case.execute("missing", (6, 4), (4, 4)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+# test_attacks.py
+
+import random
+import unittest
+
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PARENT_DIR = PROJECT_ROOT.parent
+for path in (PARENT_DIR, PROJECT_ROOT):
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+from chess_game.domain.attacks import is_square_attacked
+from chess_game.domain.bitboard import BitboardBoard
+from chess_game.domain.board import Board
+from chess_game.domain.piece import Piece, PieceType, Color
+
+
+class TestIsSquareAttacked(unittest.TestCase):
+    def setUp(self):
+        self.board = Board()
+
+    def test_ray_stops_at_first_blocker(self):
+        self.board.place_piece(0, 0, Piece(Color.BLACK, PieceType.BISHOP))
+        self.assertTrue(is_square_attacked(self.board, (7, 7), Color.BLACK))
+        self.board.place_piece(3, 3, Piece(Color.BLACK, PieceType.KNIGHT))
+        self.assertFalse(is_square_attacked(self.board, (7, 7), Color.BLACK))
+
+    def test_pawn_attack_direction(self):
+        self.board.place_piece(6, 3, Piece(Color.WHITE, PieceType.PAWN))
+        self.assertTrue(is_square_attacked(self.board, (5, 2), Color.WHITE))
+        self.assertFalse(is_square_attacked(self.board, (7, 2), Color.WHITE))
+        self.assertFalse(is_square_attacked(self.board, (5, 3), Color.WHITE))
+
+    def test_matches_bitboard_attacks_on_random_positions(self):
+        rng = random.Random(3)
+        piece_types = [PieceType.PAWN, PieceType.KNIGHT, PieceType.BISHOP,
+                       PieceType.ROOK, PieceType.QUEEN, PieceType.KING]
+        for _ in range(50):
+            board = Board()
+            bitboard = BitboardBoard()
+            for sq in rng.sample(range(64), 12):
+                piece = Piece(rng.choice([Color.WHITE, Color.BLACK]), rng.choice(piece_types))
+                board.place_piece(sq // 8, sq % 8, piece)
+                bitboard.place_piece(sq // 8, sq % 8, piece)
+            for sq in range(64):
+                for color in (Color.WHITE, Color.BLACK):
+                    square = (sq // 8, sq % 8)
+                    self.assertEqual(
+                        is_square_attacked(board, square, color),
+                        bitboard.is_square_attacked(square, color),
+                    )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+# test_batch_validation.py
+
+import random
+import unittest
+
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PARENT_DIR = PROJECT_ROOT.parent
+for path in (PARENT_DIR, PROJECT_ROOT):
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+from chess_game.domain.notation import STARTING_FEN, game_from_fen, game_to_fen
+from chess_game.domain.services import MovementService
+
+POSITIONS = (
+    STARTING_FEN,
+    'r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1',
+    '8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1',
+    'r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1',
+    'rnbq1k1r/pp1Pbppp/2p5/8/2B5/8/PPP1NnPP/RNBQK2R w KQ - 1 8',
+    '6k1/5ppp/8/8/8/8/5PPP/R5K1 w - - 0 1',
+    '7k/5Q2/6K1/8/8/8/8/8 w - - 0 1',
+)
+
+
+def expected(service, game, from_square, to_square):
+    if not service.is_valid_move(game, from_square, to_square):
+        return (False, None)
+    for move in service.generate_legal_moves(game):
+        if move.from_square == from_square and move.to_square == to_square:
+            break
+    undo = game.make_move(move)
+    try:
+        if service.is_checkmate(game):
+            return (True, 'CHECKMATE')
+        if service.is_stalemate(game):
+            return (True, 'STALEMATE')
+        return (True, 'CHECK' if service.is_in_check(game) else 'ONGOING')
+    finally:
+        game.unmake_move(undo)
+
+
+@unittest.skipIf(numpy is None, "NumPy is not installed")
+class TestBatchMoveValidator(unittest.TestCase):
+    def test_matches_movement_service(self):
+        from chess_game.domain.batch_validation import BatchMoveValidator
+
+        rng = random.Random(7)
+        service = MovementService(cache_size=0)
+        squares = [(r, c) for r in range(8) for c in range(8)]
+        requests = []
+        for fen in POSITIONS:
+            game = game_from_fen(fen)
+            for _ in range(12):
+                legal = service.generate_legal_moves(game)
+                if not legal:
+                    break
+                # Every request gets a snapshot since the walk goes on.
+                snapshot = game_from_fen(game_to_fen(game))
+                pairs = {(m.from_square, m.to_square) for m in legal}
+                pairs.update((rng.choice(squares), rng.choice(squares)) for _ in range(40))
+                requests.extend((snapshot, f, t) for f, t in sorted(pairs))
+                game.make_move(rng.choice(legal))
+
+        results = BatchMoveValidator(MovementService()).validate(requests)
+        for (game, from_square, to_square), result in zip(requests, results):
+            self.assertEqual(tuple(result), expected(service, game, from_square, to_square),
+                             (from_square, to_square))
+
+    def test_out_of_bounds_and_empty_batch(self):
+        from chess_game.domain.batch_validation import BatchMoveValidator
+
+        validator = BatchMoveValidator()
+        game = game_from_fen(STARTING_FEN)
+        self.assertEqual(validator.validate([]), [])
+        result, = validator.validate([(game, (6, 4), (8, 4))])
+        self.assertFalse(result.valid)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+# test_bitboard.py
+
+import random
+import unittest
+
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PARENT_DIR = PROJECT_ROOT.parent
+for path in (PARENT_DIR, PROJECT_ROOT):
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+from chess_game.application.use_cases import StartGameUseCase
+from chess_game.domain.bitboard import BitboardBoard
+from chess_game.domain.game import Game
+from chess_game.domain.piece import Piece, PieceType, Color
+from chess_game.domain.services import MovementService
+
+
+class TestBitboardBoard(unittest.TestCase):
+    def setUp(self):
+        self.board = BitboardBoard()
+        self.movement_service = MovementService()
+
+    def test_place_get_and_move(self):
+        rook = Piece(Color.WHITE, PieceType.ROOK)
+        self.board.place_piece(7, 0, rook)
+        self.assertIs(self.board.get_piece(7, 0), rook)
+
+        self.board.move_piece(7, 0, 3, 0)
+        self.assertIsNone(self.board.get_piece(7, 0))
+        self.assertIs(self.board.get_piece(3, 0), rook)
+        self.assertTrue(rook.has_moved)
+        self.assertEqual(self.board.piece_squares(Color.WHITE), [(3, 0)])
+
+    def test_sliding_attack_stops_at_blocker(self):
+        self.board.place_piece(7, 4, Piece(Color.WHITE, PieceType.KING))
+        self.board.place_piece(0, 4, Piece(Color.BLACK, PieceType.QUEEN))
+        self.assertTrue(self.board.is_square_attacked((7, 4), Color.BLACK))
+
+        self.board.place_piece(4, 4, Piece(Color.WHITE, PieceType.PAWN))
+        self.assertFalse(self.board.is_square_attacked((7, 4), Color.BLACK))
+
+    def test_pawn_attacks_only_forwards(self):
+        self.board.place_piece(3, 3, Piece(Color.BLACK, PieceType.PAWN))
+        self.assertTrue(self.board.is_square_attacked((4, 4), Color.BLACK))
+        self.assertFalse(self.board.is_square_attacked((2, 4), Color.BLACK))
+
+    def test_matches_grid_board_in_random_games(self):
+        """Both board types must produce the same legal moves at every ply."""
+        rng = random.Random(7)
+        grid_game = Game(StartGameUseCase(None)._create_initial_board(), Color.WHITE)
+        bitboard_game = Game(StartGameUseCase(None, BitboardBoard)._create_initial_board(), Color.WHITE)
+        for _ in range(120):
+            grid_moves = self.movement_service.generate_legal_moves(grid_game)
+            bitboard_moves = self.movement_service.generate_legal_moves(bitboard_game)
+            self.assertEqual(sorted(grid_moves), sorted(bitboard_moves))
+            if not grid_moves:
+                break
+            move = rng.choice(grid_moves)
+            grid_game.make_move(move)
+            bitboard_game.make_move(move)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+# test_board.py
+
+import pickle
+import unittest
+
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PARENT_DIR = PROJECT_ROOT.parent
+for path in (PARENT_DIR, PROJECT_ROOT):
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+from chess_game.domain.board import Board
+from chess_game.domain.game import Game
+from chess_game.domain.move import Move
+from chess_game.domain.piece import Piece, PieceType, Color
+
+
+class TestBoardPieceTracking(unittest.TestCase):
+    def setUp(self):
+        self.board = Board()
+        self.game = Game(self.board, Color.WHITE)
+
+    def test_king_square_follows_moves(self):
+        self.board.place_piece(7, 4, Piece(Color.WHITE, PieceType.KING))
+        self.board.place_piece(7, 7, Piece(Color.WHITE, PieceType.ROOK))
+        self.assertEqual(self.board.find_king(Color.WHITE), (7, 4))
+
+        undo = self.game.make_move(Move((7, 4), (7, 6)))
+        self.assertEqual(self.board.find_king(Color.WHITE), (7, 6))
+        self.assertEqual(sorted(self.board.piece_squares(Color.WHITE)), [(7, 5), (7, 6)])
+
+        self.game.unmake_move(undo)
+        self.assertEqual(self.board.find_king(Color.WHITE), (7, 4))
+        self.assertEqual(sorted(self.board.piece_squares(Color.WHITE)), [(7, 4), (7, 7)])
+
+    def test_captures_and_en_passant_update_piece_sets(self):
+        black_pawn = Piece(Color.BLACK, PieceType.PAWN)
+        self.board.place_piece(3, 5, Piece(Color.WHITE, PieceType.PAWN))
+        self.board.place_piece(3, 4, black_pawn)
+        self.game.last_move = (black_pawn, (1, 4), (3, 4))
+
+        self.game.move_piece((3, 5), (2, 4))
+        self.assertEqual(self.board.piece_squares(Color.BLACK), [])
+        self.assertEqual(self.board.piece_squares(Color.WHITE), [(2, 4)])
+
+    def test_overwriting_a_square_untracks_the_old_piece(self):
+        self.board.place_piece(0, 4, Piece(Color.BLACK, PieceType.KING))
+        self.board.place_piece(0, 4, Piece(Color.WHITE, PieceType.QUEEN))
+        self.assertIsNone(self.board.find_king(Color.BLACK))
+        self.assertEqual(self.board.piece_squares(Color.BLACK), [])
+
+    def test_tracking_rebuilt_for_boards_pickled_without_it(self):
+        self.board.place_piece(7, 4, Piece(Color.WHITE, PieceType.KING))
+        state = dict(self.board.__dict__)
+        del state['piece_locations']
+        del state['king_squares']
+        old_board = Board.__new__(Board)
+        old_board.__setstate__(pickle.loads(pickle.dumps(state)))
+        self.assertEqual(old_board.find_king(Color.WHITE), (7, 4))
+
+
+if __name__ == '__main__':
+    unittest.main()
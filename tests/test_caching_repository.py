@@ -0,0 +1,92 @@
+# test_caching_repository.py
+
+import unittest
+
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PARENT_DIR = PROJECT_ROOT.parent
+for path in (PARENT_DIR, PROJECT_ROOT):
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+from chess_game.adapters.caching_game_repository import CachingGameRepository
+from chess_game.adapters.in_memory_game_repository import InMemoryGameRepository
+from chess_game.application.use_cases import MovePieceUseCase, StartGameUseCase
+
+
+class CountingRepository(InMemoryGameRepository):
+    def __init__(self):
+        super().__init__()
+        self.saves = 0
+        self.loads = 0
+
+    def save(self, game):
+        self.saves += 1
+        return super().save(game)
+
+    def find_by_id(self, game_id):
+        self.loads += 1
+        return super().find_by_id(game_id)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestCachingGameRepository(unittest.TestCase):
+    def setUp(self):
+        self.backing = CountingRepository()
+        self.clock = FakeClock()
+        self.repository = CachingGameRepository(self.backing, max_size=2, max_age=60,
+                                                flush_interval=10, clock=self.clock)
+
+    def test_reads_and_saves_of_active_game_stay_in_memory(self):
+        game_id = StartGameUseCase(self.repository).execute()
+        use_case = MovePieceUseCase(self.repository)
+        use_case.execute(game_id, (6, 4), (4, 4))
+        use_case.execute(game_id, (1, 4), (3, 4))
+        self.assertEqual((self.backing.saves, self.backing.loads), (1, 0))
+        self.assertEqual((self.repository.hits, self.repository.misses), (2, 0))
+
+        self.repository.flush()
+        self.assertEqual(self.backing.saves, 2)
+        self.repository.flush()
+        self.assertEqual(self.backing.saves, 2)
+
+    def test_write_behind_after_interval(self):
+        game_id = StartGameUseCase(self.repository).execute()
+        use_case = MovePieceUseCase(self.repository)
+        use_case.execute(game_id, (6, 4), (4, 4))
+        self.assertEqual(self.backing.saves, 1)
+        self.clock.now = 11
+        self.repository.find_by_id(game_id)
+        self.assertEqual(self.backing.saves, 2)
+
+    def test_eviction_writes_dirty_games(self):
+        use_case = MovePieceUseCase(self.repository)
+        first = StartGameUseCase(self.repository).execute()
+        use_case.execute(first, (6, 4), (4, 4))
+        StartGameUseCase(self.repository).execute()
+        StartGameUseCase(self.repository).execute()
+        # 'first' was least recently used and dirty: written when evicted.
+        self.assertEqual(self.backing.saves, 4)
+        self.assertEqual(self.backing.storage[first].current_player, 'BLACK')
+        self.repository.find_by_id(first)
+        self.assertEqual(self.repository.misses, 1)
+
+    def test_idle_games_expire(self):
+        game_id = StartGameUseCase(self.repository).execute()
+        self.clock.now = 61
+        self.repository.find_by_id(game_id)
+        self.assertEqual((self.repository.hits, self.repository.misses), (0, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+# test_draw_rules.py
+
+import unittest
+
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PARENT_DIR = PROJECT_ROOT.parent
+for path in (PARENT_DIR, PROJECT_ROOT):
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+from chess_game.adapters.in_memory_game_repository import InMemoryGameRepository
+from chess_game.application.use_cases import MovePieceUseCase, StartGameUseCase
+from chess_game.domain.notation import game_from_fen, game_to_fen, parse_uci
+from chess_game.domain.services import MovementService
+
+
+class TestDrawRules(unittest.TestCase):
+    def setUp(self):
+        self.repository = InMemoryGameRepository()
+        self.move_piece = MovePieceUseCase(self.repository, MovementService())
+
+    def play(self, game, *ucis):
+        for uci in ucis:
+            move = parse_uci(uci)
+            self.move_piece.apply(game, move.from_square, move.to_square, move.promotion)
+        return game
+
+    def test_threefold_repetition(self):
+        game = self.repository.find_by_id(StartGameUseCase(self.repository).execute())
+        shuffle = ('g1f3', 'g8f6', 'f3g1', 'f6g8')
+        self.play(game, *shuffle)
+        self.assertEqual(game.repetition_count(), 2)
+        self.assertEqual(game.status, 'ONGOING')
+        self.play(game, *shuffle)
+        self.assertEqual(game.status, 'DRAW_REPETITION')
+        with self.assertRaisesRegex(Exception, 'Game is over'):
+            self.play(game, 'e2e4')
+
+    def test_pawn_moves_and_captures_reset_the_counts(self):
+        game = self.repository.find_by_id(StartGameUseCase(self.repository).execute())
+        self.play(game, 'g1f3', 'g8f6', 'f3g1', 'f6g8', 'e2e4')
+        self.assertEqual(game.halfmove_clock, 0)
+        self.assertEqual(len(game.position_counts), 1)
+        self.play(game, 'g8f6', 'g1f3', 'f6e4')
+        self.assertEqual((game.halfmove_clock, len(game.position_counts)), (0, 1))
+
+    def test_fifty_move_rule(self):
+        game = game_from_fen('4k3/8/8/8/8/8/4P3/R3K3 w - - 98 80')
+        self.play(game, 'a1a2')
+        self.assertEqual(game.status, 'ONGOING')
+        self.play(game, 'e8d8')
+        self.assertEqual(game.status, 'DRAW_FIFTY_MOVES')
+        self.assertEqual(game_to_fen(game), '3k4/8/8/8/8/8/R3P3/4K3 w - - 100 81')
+
+    def test_mate_on_the_hundredth_ply_wins(self):
+        game = game_from_fen('6k1/5ppp/8/8/8/8/8/R5K1 w - - 99 80')
+        self.play(game, 'a1a8')
+        self.assertEqual(game.status, 'CHECKMATE')
+
+    def test_insufficient_material(self):
+        service = MovementService()
+        for fen, expected in (('4k3/8/8/8/8/8/8/4K3 w - - 0 1', True),
+                              ('4k3/8/8/8/8/8/8/3NK3 w - - 0 1', True),
+                              ('2b1k3/8/8/8/8/8/8/3BK3 w - - 0 1', True),
+                              ('3bk3/8/8/8/8/8/8/3BK3 w - - 0 1', False),
+                              ('4k3/8/8/8/8/8/8/2NNK3 w - - 0 1', False),
+                              ('4k3/8/8/8/8/8/4P3/4K3 w - - 0 1', False)):
+            with self.subTest(fen=fen):
+                self.assertEqual(service.is_insufficient_material(game_from_fen(fen)), expected)
+        game = self.play(game_from_fen('4k3/8/8/8/8/8/4r3/3NK3 w - - 0 1'), 'e1e2')
+        self.assertEqual(game.status, 'DRAW_INSUFFICIENT_MATERIAL')
+
+    def test_stalemate(self):
+        game = self.play(game_from_fen('7k/8/5Q2/8/8/8/8/K7 w - - 0 1'), 'f6f7')
+        self.assertEqual(game.status, 'STALEMATE')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+# test_engine.py
+
+import unittest
+
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PARENT_DIR = PROJECT_ROOT.parent
+for path in (PARENT_DIR, PROJECT_ROOT):
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+from chess_game.adapters.alpha_beta_engine import AlphaBetaEngine
+from chess_game.adapters.in_memory_game_repository import InMemoryGameRepository
+from chess_game.application.use_cases import FindBestMoveUseCase
+from chess_game.domain.move import Move
+from chess_game.domain.notation import STARTING_FEN, game_from_fen, game_to_fen
+
+
+class TestAlphaBetaEngine(unittest.TestCase):
+    def test_finds_mate_in_one(self):
+        game = game_from_fen('6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1')
+        result = AlphaBetaEngine(max_depth=3, time_limit=None).search(game)
+        self.assertEqual(result.move, Move((7, 0), (0, 0)))
+
+    def test_captures_hanging_queen(self):
+        game = game_from_fen('4k3/8/8/3q4/8/8/8/3RK3 w - - 0 1')
+        move = AlphaBetaEngine(max_depth=2, time_limit=None).find_best_move(game)
+        self.assertEqual(move, Move((7, 3), (3, 3)))
+
+    def test_search_leaves_game_unchanged(self):
+        game = game_from_fen('r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1')
+        key = game.position_key()
+        AlphaBetaEngine(max_depth=2, time_limit=None).search(game)
+        self.assertEqual(game.position_key(), key)
+
+    def test_node_budget_is_respected(self):
+        game = game_from_fen(STARTING_FEN)
+        result = AlphaBetaEngine(time_limit=None, node_limit=500).search(game)
+        self.assertLessEqual(result.nodes, 500)
+        self.assertIsNotNone(result.move)
+
+    def test_no_move_when_mated(self):
+        game = game_from_fen('R5k1/5ppp/8/8/8/8/8/6K1 b - - 0 1')
+        self.assertIsNone(AlphaBetaEngine(time_limit=None, max_depth=2).find_best_move(game))
+
+
+class TestFindBestMoveUseCase(unittest.TestCase):
+    def test_returns_engine_move_for_saved_game(self):
+        repository = InMemoryGameRepository()
+        game = game_from_fen('6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1')
+        game_id = repository.save(game)
+
+        use_case = FindBestMoveUseCase(repository, AlphaBetaEngine(max_depth=2, time_limit=None))
+        self.assertEqual(use_case.execute(game_id), Move((7, 0), (0, 0)))
+        self.assertEqual(game_to_fen(game), '6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+# test_game.py
+
+import unittest
+
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PARENT_DIR = PROJECT_ROOT.parent
+for path in (PARENT_DIR, PROJECT_ROOT):
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+from chess_game.domain.board import Board
+from chess_game.domain.game import Game
+from chess_game.domain.move import Move
+from chess_game.domain.piece import Piece, PieceType, Color
+
+
+def snapshot(game):
+    """Capture everything make/unmake must restore."""
+    cells = []
+    for row in range(8):
+        for col in range(8):
+            piece = game.board.get_piece(row, col)
+            cells.append(piece and (id(piece), piece.has_moved))
+    return cells, game.current_player, game.last_move, list(game.move_history), game.halfmove_clock
+
+
+class TestMakeUnmakeMove(unittest.TestCase):
+    def setUp(self):
+        self.board = Board()
+        self.game = Game(self.board, Color.WHITE)
+
+    def assertRoundTrip(self, move):
+        before = snapshot(self.game)
+        undo = self.game.make_move(move)
+        self.assertNotEqual(snapshot(self.game), before)
+        self.game.unmake_move(undo)
+        self.assertEqual(snapshot(self.game), before)
+
+    def test_capture_round_trip(self):
+        self.board.place_piece(7, 0, Piece(Color.WHITE, PieceType.ROOK))
+        self.board.place_piece(2, 0, Piece(Color.BLACK, PieceType.KNIGHT))
+        self.assertRoundTrip(Move((7, 0), (2, 0)))
+
+    def test_en_passant_round_trip(self):
+        black_pawn = Piece(Color.BLACK, PieceType.PAWN)
+        self.board.place_piece(3, 5, Piece(Color.WHITE, PieceType.PAWN))
+        self.board.place_piece(3, 4, black_pawn)
+        self.game.last_move = (black_pawn, (1, 4), (3, 4))
+
+        undo = self.game.make_move(Move((3, 5), (2, 4)))
+        self.assertIsNone(self.board.get_piece(3, 4))
+        self.assertIs(undo.captured, black_pawn)
+        self.game.unmake_move(undo)
+        self.assertIs(self.board.get_piece(3, 4), black_pawn)
+
+    def test_castling_round_trip(self):
+        king = Piece(Color.WHITE, PieceType.KING)
+        rook = Piece(Color.WHITE, PieceType.ROOK)
+        self.board.place_piece(7, 4, king)
+        self.board.place_piece(7, 0, rook)
+
+        undo = self.game.make_move(Move((7, 4), (7, 2)))
+        self.assertIs(self.board.get_piece(7, 3), rook)
+        self.assertTrue(rook.has_moved)
+        self.game.unmake_move(undo)
+        self.assertIs(self.board.get_piece(7, 0), rook)
+        self.assertFalse(rook.has_moved)
+        self.assertFalse(king.has_moved)
+
+    def test_promotion_round_trip(self):
+        pawn = Piece(Color.BLACK, PieceType.PAWN)
+        self.game.current_player = Color.BLACK
+        self.board.place_piece(6, 3, pawn)
+        self.board.place_piece(7, 4, Piece(Color.WHITE, PieceType.ROOK))
+
+        undo = self.game.make_move(Move((6, 3), (7, 4), PieceType.ROOK))
+        promoted = self.board.get_piece(7, 4)
+        self.assertEqual((promoted.color, promoted.piece_type), (Color.BLACK, PieceType.ROOK))
+        self.game.unmake_move(undo)
+        self.assertIs(self.board.get_piece(6, 3), pawn)
+        self.assertEqual(self.board.get_piece(7, 4).color, Color.WHITE)
+
+    def test_empty_from_square_raises(self):
+        before = snapshot(self.game)
+        with self.assertRaisesRegex(ValueError, 'No piece'):
+            self.game.make_move(Move((4, 4), (3, 4)))
+        with self.assertRaisesRegex(ValueError, 'No piece'):
+            self.game.move_piece((4, 4), (3, 4))
+        self.assertEqual(snapshot(self.game), before)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+# test_game_codec.py
+
+import pickle
+import tempfile
+import unittest
+
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PARENT_DIR = PROJECT_ROOT.parent
+for path in (PARENT_DIR, PROJECT_ROOT):
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+from chess_game.adapters.file_game_repository import FileGameRepository
+from chess_game.adapters.game_codec import decode_game, encode_game, game_from_text, game_to_text
+from chess_game.domain.move import Move
+from chess_game.domain.notation import STARTING_FEN, game_from_fen, game_to_fen, parse_uci
+from chess_game.domain.piece import PieceType
+from chess_game.domain.services import MovementService
+
+POSITIONS = (
+    STARTING_FEN,
+    'r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1',
+    'rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 1',
+    'r3k3/8/8/8/8/8/8/4K2R b Kq - 0 1',
+)
+
+
+class TestGameCodec(unittest.TestCase):
+    def assertSameGame(self, decoded, game):
+        self.assertEqual(game_to_fen(decoded), game_to_fen(game))
+        self.assertEqual(decoded.position_key(), game.position_key())
+        self.assertEqual(decoded.status, game.status)
+        self.assertEqual(decoded.move_history, game.move_history)
+        self.assertEqual(decoded.start_fen, game.start_fen)
+        self.assertEqual(decoded.halfmove_clock, game.halfmove_clock)
+        self.assertEqual(decoded.position_counts, game.position_counts)
+        service = MovementService(cache_size=0)
+        self.assertEqual(set(service.generate_legal_moves(decoded)), set(service.generate_legal_moves(game)))
+
+    def test_round_trip(self):
+        for fen in POSITIONS:
+            with self.subTest(fen=fen):
+                game = game_from_fen(fen)
+                game.move_history = [Move((6, 4), (4, 4)), Move((1, 0), (0, 1), PieceType.KNIGHT)]
+                self.assertSameGame(decode_game(encode_game(game)), game)
+                self.assertSameGame(game_from_text(game_to_text(game)), game)
+
+    def test_sizes_and_statuses(self):
+        game = game_from_fen(STARTING_FEN)
+        self.assertEqual(len(encode_game(game)), 30)
+        self.assertLess(len(encode_game(game)), len(pickle.dumps(game)) // 10)
+        game.status = 'RESIGNED'
+        self.assertEqual(decode_game(encode_game(game)).status, 'RESIGNED')
+
+    def test_draw_state_round_trip(self):
+        game = game_from_fen('4k3/8/8/8/8/8/8/R3K3 w - - 12 40')
+        for uci in ('a1a2', 'e8d8', 'a2a1', 'd8e8'):
+            move = parse_uci(uci)
+            game.move_piece(move.from_square, move.to_square)
+        self.assertEqual(game.halfmove_clock, 16)
+        self.assertEqual(game.repetition_count(), 2)
+        self.assertSameGame(decode_game(encode_game(game)), game)
+
+    def test_reads_version_1(self):
+        data = bytearray(encode_game(game_from_fen(STARTING_FEN)))
+        data[2] = 1
+        self.assertEqual(decode_game(bytes(data)).position_key(), game_from_fen(STARTING_FEN).position_key())
+
+    def test_rejects_unknown_version(self):
+        data = bytearray(encode_game(game_from_fen(STARTING_FEN)))
+        data[2] = 99
+        with self.assertRaises(ValueError):
+            decode_game(bytes(data))
+
+
+class TestRepositoriesWithCodec(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_compact_file_repository_reads_legacy_pickles(self):
+        legacy = FileGameRepository(self.directory)
+        game = game_from_fen(POSITIONS[1])
+        game_id = legacy.save(game)
+
+        compact = FileGameRepository(self.directory, compact=True)
+        loaded = compact.find_by_id(game_id)
+        self.assertEqual(loaded.position_key(), game.position_key())
+        compact.save(loaded)
+        self.assertEqual([p.name for p in self.directory.iterdir()], [f"{game_id}.game"])
+        self.assertEqual(compact.find_by_id(game_id).id, game_id)
+        self.assertEqual(legacy.list_game_ids(), [game_id])
+
+
+if __name__ == '__main__':
+    unittest.main()
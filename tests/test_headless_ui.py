@@ -0,0 +1,56 @@
+# test_headless_ui.py
+
+import io
+import unittest
+
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PARENT_DIR = PROJECT_ROOT.parent
+for path in (PARENT_DIR, PROJECT_ROOT):
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+from chess_game.adapters.null_ui import NullChessUI
+from chess_game.adapters.text_ui import TextChessUI
+from chess_game.domain.notation import STARTING_FEN, game_from_fen
+
+
+class TestNullChessUI(unittest.TestCase):
+    def test_scripted_input(self):
+        ui = NullChessUI([(6, 4), (4, 4)])
+        ui.draw_board(game_from_fen(STARTING_FEN))
+        ui.show_message("Invalid move")
+        self.assertEqual(ui.get_player_input('WHITE'), (6, 4))
+        self.assertEqual(ui.get_player_input('WHITE'), (4, 4))
+        with self.assertRaises(EOFError):
+            ui.get_player_input('BLACK')
+        self.assertEqual((ui.frames, ui.messages), (1, ["Invalid move"]))
+
+
+class TestTextChessUI(unittest.TestCase):
+    def test_draws_board_once_per_change(self):
+        output = io.StringIO()
+        ui = TextChessUI(io.StringIO(), output)
+        game = game_from_fen(STARTING_FEN)
+        ui.draw_board(game)
+        ui.draw_board(game)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(len(lines), 9)
+        self.assertEqual(lines[0], "8 r n b q k b n r")
+        self.assertEqual(lines[7], "1 R N B Q K B N R")
+
+    def test_reads_squares_and_moves(self):
+        output = io.StringIO()
+        ui = TextChessUI(io.StringIO("e2e4\nz9\ng8\nf6\n"), output)
+        picks = [ui.get_player_input('WHITE') for _ in range(4)]
+        self.assertEqual(picks, [(6, 4), (4, 4), (0, 6), (2, 5)])
+        self.assertIn("Invalid square", output.getvalue())
+        with self.assertRaises(EOFError):
+            ui.get_player_input('WHITE')
+
+
+if __name__ == '__main__':
+    unittest.main()
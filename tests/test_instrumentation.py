@@ -0,0 +1,95 @@
+# test_instrumentation.py
+
+import json
+import pstats
+import tempfile
+import unittest
+
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PARENT_DIR = PROJECT_ROOT.parent
+for path in (PARENT_DIR, PROJECT_ROOT):
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+from chess_game.adapters.in_memory_game_repository import InMemoryGameRepository
+from chess_game.adapters.instrumentation import (GameProfiler, Instrumentation, REPOSITORY_METHODS,
+                                                 SERVICE_METHODS, USE_CASE_METHODS)
+from chess_game.application.use_cases import MovePieceUseCase, StartGameUseCase
+from chess_game.domain.services import MovementService
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self):
+        self.repository = InMemoryGameRepository()
+        self.service = MovementService()
+        self.start_game = StartGameUseCase(self.repository)
+        self.move_piece = MovePieceUseCase(self.repository, self.service)
+        self.instrumentation = Instrumentation()
+        self.instrumentation.wrap(self.service, SERVICE_METHODS, 'movement_service')
+        self.instrumentation.wrap(self.repository, REPOSITORY_METHODS, 'repository')
+        self.instrumentation.wrap(self.start_game, USE_CASE_METHODS, 'start_game')
+        self.instrumentation.wrap(self.move_piece, USE_CASE_METHODS, 'move_piece')
+
+    def play(self):
+        game_id = self.start_game.execute()
+        self.move_piece.execute(game_id, (6, 4), (4, 4))
+        with self.assertRaises(Exception):
+            self.move_piece.execute(game_id, (6, 4), (4, 4))
+        return game_id
+
+    def test_counts_calls(self):
+        self.play()
+        counts = {name: histogram.count for name, histogram in self.instrumentation.histograms.items()}
+        self.assertEqual(counts['start_game.execute'], 1)
+        # The invalid move is timed too.
+        self.assertEqual(counts['move_piece.execute'], 2)
+        self.assertEqual(counts['movement_service.is_valid_move'], 2)
+        self.assertEqual(counts['repository.save'], 2)
+        self.assertEqual(counts['repository.find_by_id'], 2)
+        self.assertEqual(counts['movement_service.end_status'], 1)
+        self.assertEqual(counts['movement_service.has_legal_move'], 1)
+        self.assertEqual(counts['movement_service.is_insufficient_material'], 1)
+        self.assertGreater(counts['movement_service._simulate_move'], 0)
+
+    def test_unwrap_restores_methods(self):
+        self.instrumentation.unwrap()
+        self.assertNotIn('execute', vars(self.move_piece))
+        self.assertNotIn('_simulate_move', vars(self.service))
+        self.play()
+        self.assertEqual(self.instrumentation.histograms['start_game.execute'].count, 0)
+
+    def test_exports(self):
+        self.play()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            self.instrumentation.write(Path(tmpdir) / 'metrics.json')
+            snapshot = json.loads((Path(tmpdir) / 'metrics.json').read_text())
+            self.instrumentation.write(Path(tmpdir) / 'metrics.prom')
+            text = (Path(tmpdir) / 'metrics.prom').read_text()
+        self.assertEqual(snapshot['move_piece.execute']['count'], 2)
+        self.assertIn('# TYPE chess_call_duration_seconds histogram', text)
+        self.assertIn('chess_call_duration_seconds_count{method="move_piece.execute"} 2', text)
+        self.assertIn('chess_call_duration_seconds_bucket{method="move_piece.execute",le="+Inf"} 2', text)
+
+    def test_profiles_each_game(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            profiler = GameProfiler(tmpdir)
+            with profiler.profile('a'):
+                self.play()
+            with profiler.profile('b'):
+                pass
+            with profiler.profile('a'):
+                self.play()
+            paths = profiler.dump_all()
+            self.assertEqual(sorted(path.name for path in paths), ['a.prof', 'b.prof'])
+            stats = pstats.Stats(str(Path(tmpdir) / 'a.prof'))
+            calls = [entry[1] for (_, _, function), entry in stats.stats.items() if function == 'apply']
+            self.assertEqual(calls, [4])
+            self.assertIsNone(profiler.dump('a'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+# test_journaled_repository.py
+
+import tempfile
+import unittest
+
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PARENT_DIR = PROJECT_ROOT.parent
+for path in (PARENT_DIR, PROJECT_ROOT):
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+from chess_game.adapters.file_game_repository import FileGameRepository
+from chess_game.adapters.journaled_game_repository import HEADER, RECORD, JournaledFileGameRepository
+from chess_game.application.use_cases import MovePieceUseCase, StartGameUseCase
+
+# Fool's mate: four moves, ending in checkmate.
+FOOLS_MATE = (((6, 5), (5, 5)), ((1, 4), (3, 4)), ((6, 6), (4, 6)), ((0, 3), (4, 7)))
+
+
+class TestJournaledFileGameRepository(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.directory = Path(self._tmp.name)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def play(self, repository, moves):
+        game_id = StartGameUseCase(repository).execute()
+        use_case = MovePieceUseCase(repository)
+        for from_square, to_square in moves:
+            game = use_case.execute(game_id, from_square, to_square)
+        return game_id, game
+
+    def test_moves_are_appended_and_replayed(self):
+        repository = JournaledFileGameRepository(self.directory)
+        game_id, game = self.play(repository, FOOLS_MATE)
+        snapshot_size = (self.directory / f"{game_id}.pkl").stat().st_size
+        log_size = (self.directory / f"{game_id}.log").stat().st_size
+        self.assertEqual(log_size, HEADER.size + len(FOOLS_MATE) * RECORD.size)
+
+        loaded = JournaledFileGameRepository(self.directory).find_by_id(game_id)
+        self.assertEqual(loaded.position_key(), game.position_key())
+        self.assertEqual(loaded.status, 'CHECKMATE')
+        self.assertEqual(loaded.move_history, game.move_history)
+        # The snapshot was never rewritten, and is still a plain saved game.
+        self.assertEqual((self.directory / f"{game_id}.pkl").stat().st_size, snapshot_size)
+        self.assertEqual(len(FileGameRepository(self.directory).find_by_id(game_id).move_history), 0)
+
+    def test_snapshot_compaction(self):
+        repository = JournaledFileGameRepository(self.directory, snapshot_interval=3)
+        game_id, game = self.play(repository, FOOLS_MATE)
+        snapshot = FileGameRepository(self.directory).find_by_id(game_id)
+        self.assertEqual(len(snapshot.move_history), 3)
+        self.assertEqual((self.directory / f"{game_id}.log").stat().st_size, HEADER.size + RECORD.size)
+        loaded = JournaledFileGameRepository(self.directory).find_by_id(game_id)
+        self.assertEqual(loaded.position_key(), game.position_key())
+
+    def test_torn_tail_is_ignored_and_overwritten(self):
+        repository = JournaledFileGameRepository(self.directory)
+        game_id, _ = self.play(repository, FOOLS_MATE[:2])
+        log_path = self.directory / f"{game_id}.log"
+        with open(log_path, 'ab') as f:
+            f.write(b'\x01\x02')  # half of a record, as left by a crash
+
+        repository = JournaledFileGameRepository(self.directory)
+        self.assertEqual(len(repository.find_by_id(game_id).move_history), 2)
+        use_case = MovePieceUseCase(repository)
+        for from_square, to_square in FOOLS_MATE[2:]:
+            use_case.execute(game_id, from_square, to_square)
+        loaded = JournaledFileGameRepository(self.directory).find_by_id(game_id)
+        self.assertEqual(len(loaded.move_history), 4)
+        self.assertEqual(loaded.status, 'CHECKMATE')
+
+    def test_records_already_in_snapshot_are_skipped(self):
+        repository = JournaledFileGameRepository(self.directory)
+        game_id, game = self.play(repository, FOOLS_MATE[:3])
+        log_bytes = (self.directory / f"{game_id}.log").read_bytes()
+        # Crash after a new snapshot was written but before the log was reset.
+        repository._write_snapshot(game_id, game)
+        (self.directory / f"{game_id}.log").write_bytes(log_bytes)
+
+        loaded = JournaledFileGameRepository(self.directory).find_by_id(game_id)
+        self.assertEqual(loaded.move_history, game.move_history)
+        self.assertEqual(loaded.position_key(), game.position_key())
+
+
+if __name__ == '__main__':
+    unittest.main()
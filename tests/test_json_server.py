@@ -0,0 +1,114 @@
+# test_json_server.py
+
+import asyncio
+import json
+import unittest
+
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PARENT_DIR = PROJECT_ROOT.parent
+for path in (PARENT_DIR, PROJECT_ROOT):
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+from chess_game.adapters.executor_game_repository import ExecutorGameRepository
+from chess_game.adapters.in_memory_game_repository import InMemoryGameRepository
+from chess_game.adapters.json_server import ChessJsonServer
+from chess_game.adapters.metrics import LatencyHistogram
+
+
+class TestChessJsonServer(unittest.TestCase):
+    def setUp(self):
+        self.repository = ExecutorGameRepository(InMemoryGameRepository())
+
+    def tearDown(self):
+        self.repository.close()
+
+    def test_protocol_over_socket(self):
+        async def scenario():
+            server = await ChessJsonServer(self.repository, port=0).start()
+            reader, writer = await asyncio.open_connection(server.host, server.port)
+
+            async def call(**request):
+                writer.write(json.dumps(request).encode() + b'\n')
+                await writer.drain()
+                return json.loads(await reader.readline())
+
+            started = await call(id=1, op='start')
+            game_id = started['game_id']
+            legal = await call(id=2, op='legal_moves', game_id=game_id)
+            moved = await call(id=3, op='move', game_id=game_id, move='e2e4')
+            illegal = await call(id=4, op='move', game_id=game_id, move='e2e4')
+            state = await call(id=5, op='state', game_id=game_id)
+            unknown = await call(id=6, op='resign')
+            writer.write(b'not json\n')
+            malformed = json.loads(await reader.readline())
+            stats = await call(id=7, op='stats')
+            writer.close()
+            await server.close()
+            return legal, moved, illegal, state, unknown, malformed, stats
+
+        legal, moved, illegal, state, unknown, malformed, stats = asyncio.run(scenario())
+        self.assertEqual(len(legal['moves']), 20)
+        self.assertTrue(moved['ok'])
+        self.assertEqual(moved['current_player'], 'BLACK')
+        self.assertEqual(illegal, {'id': 4, 'ok': False, 'error': 'Invalid move'})
+        self.assertEqual(state['moves'], ['e2e4'])
+        self.assertEqual(state['fen'], moved['fen'])
+        self.assertFalse(unknown['ok'])
+        self.assertFalse(malformed['ok'])
+        self.assertEqual(stats['latency']['move']['count'], 2)
+
+    def test_finished_game_has_no_legal_moves(self):
+        async def scenario():
+            server = await ChessJsonServer(self.repository, port=0).start()
+            reader, writer = await asyncio.open_connection(server.host, server.port)
+
+            async def call(**request):
+                writer.write(json.dumps(request).encode() + b'\n')
+                await writer.drain()
+                return json.loads(await reader.readline())
+
+            game_id = (await call(id=1, op='start'))['game_id']
+            for move in ('g1f3', 'g8f6', 'f3g1', 'f6g8') * 2:
+                moved = await call(id=2, op='move', game_id=game_id, move=move)
+            legal = await call(id=3, op='legal_moves', game_id=game_id)
+            writer.close()
+            await server.close()
+            return moved, legal
+
+        moved, legal = asyncio.run(scenario())
+        self.assertEqual(moved['status'], 'DRAW_REPETITION')
+        self.assertEqual(legal['moves'], [])
+
+    def test_pipelined_requests_are_all_answered(self):
+        async def scenario():
+            server = await ChessJsonServer(self.repository, port=0, max_in_flight=2).start()
+            reader, writer = await asyncio.open_connection(server.host, server.port)
+            for request_id in range(50):
+                writer.write(json.dumps({'id': request_id, 'op': 'start'}).encode() + b'\n')
+            await writer.drain()
+            responses = [json.loads(await reader.readline()) for _ in range(50)]
+            writer.close()
+            await server.close()
+            return responses
+
+        responses = asyncio.run(scenario())
+        self.assertEqual(sorted(response['id'] for response in responses), list(range(50)))
+        self.assertTrue(all(response['ok'] for response in responses))
+
+    def test_latency_histogram(self):
+        histogram = LatencyHistogram()
+        for _ in range(99):
+            histogram.record(0.0001)
+        histogram.record(1.0)
+        self.assertEqual(histogram.count, 100)
+        self.assertLessEqual(histogram.percentile(0.5), 0.0002)
+        self.assertGreaterEqual(histogram.percentile(1.0), 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+# test_notation.py
+
+import unittest
+
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PARENT_DIR = PROJECT_ROOT.parent
+for path in (PARENT_DIR, PROJECT_ROOT):
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+from chess_game.application.use_cases import StartGameUseCase
+from chess_game.domain.game import Game
+from chess_game.domain.move import Move
+from chess_game.domain.notation import (
+    STARTING_FEN, game_from_fen, game_to_fen, move_to_uci, parse_square, parse_uci,
+)
+from chess_game.domain.piece import Color, PieceType
+from chess_game.domain.services import MovementService
+
+
+class TestNotation(unittest.TestCase):
+    def test_square_names(self):
+        self.assertEqual(parse_square('a8'), (0, 0))
+        self.assertEqual(parse_square('e1'), (7, 4))
+        with self.assertRaises(ValueError):
+            parse_square('i9')
+
+    def test_uci_round_trip(self):
+        move = Move((1, 4), (0, 4), PieceType.KNIGHT)
+        self.assertEqual(move_to_uci(move), 'e7e8n')
+        self.assertEqual(parse_uci('e7e8n'), move)
+
+    def test_starting_fen_matches_initial_board(self):
+        game = Game(StartGameUseCase(None)._create_initial_board(), Color.WHITE)
+        self.assertEqual(game_to_fen(game), STARTING_FEN)
+        self.assertEqual(game_from_fen(STARTING_FEN).position_key(), game.position_key())
+
+    def test_castling_rights_become_has_moved_flags(self):
+        game = game_from_fen('r3k2r/8/8/8/8/8/8/R3K2R w Kq - 0 1')
+        targets = [m.to_square for m in MovementService().generate_legal_moves(game)
+                   if m.from_square == (7, 4)]
+        self.assertIn((7, 6), targets)
+        self.assertNotIn((7, 2), targets)
+        self.assertEqual(game_to_fen(game), 'r3k2r/8/8/8/8/8/8/R3K2R w Kq - 0 1')
+
+    def test_en_passant_square_becomes_last_move(self):
+        fen = 'rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3'
+        game = game_from_fen(fen)
+        self.assertTrue(MovementService().is_valid_move(game, (3, 4), (2, 5)))
+        self.assertFalse(MovementService().is_valid_move(game, (3, 4), (2, 3)))
+        self.assertEqual(game_to_fen(game).split()[:4], fen.split()[:4])
+
+    def test_invalid_fen_rejected(self):
+        with self.assertRaises(ValueError):
+            game_from_fen('rnbqkbnr/pppppppp/8/8 w - - 0 1')
+        # En passant squares off ranks 6 (white to move) and 3 (black to move).
+        for fen in ('4k3/8/8/8/8/8/8/4K3 w - a1 0 1', '4k3/8/8/8/8/8/8/4K3 b - h8 0 1',
+                    '4k3/8/8/8/4Pp2/8/8/4K3 w - e3 0 1', '4k3/8/8/8/8/8/8/4K3 w - z9 0 1'):
+            with self.subTest(fen=fen), self.assertRaises(ValueError):
+                game_from_fen(fen)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+# test_parallel_engine.py
+
+import unittest
+
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PARENT_DIR = PROJECT_ROOT.parent
+for path in (PARENT_DIR, PROJECT_ROOT):
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+from chess_game.adapters.parallel_engine import ParallelSearchEngine
+from chess_game.domain.move import Move
+from chess_game.domain.notation import STARTING_FEN, game_from_fen
+
+
+class TestParallelSearchEngine(unittest.TestCase):
+    def test_finds_mate_in_one_with_two_workers(self):
+        game = game_from_fen('6k1/5ppp/8/8/8/8/8/R5K1 w - - 0 1')
+        with ParallelSearchEngine(workers=2, max_depth=3, time_limit=None) as engine:
+            self.assertEqual(engine.find_best_move(game), Move((7, 0), (0, 0)))
+
+    def test_node_budget_shared_by_workers(self):
+        game = game_from_fen(STARTING_FEN)
+        with ParallelSearchEngine(workers=2, time_limit=None, node_limit=2000) as engine:
+            result = engine.search(game)
+        self.assertIsNotNone(result.move)
+        self.assertLessEqual(result.nodes, 2000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+# test_perft.py
+
+import unittest
+
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PARENT_DIR = PROJECT_ROOT.parent
+for path in (PARENT_DIR, PROJECT_ROOT):
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+from chess_game.domain.bitboard import BitboardBoard
+from chess_game.domain.board import Board
+from chess_game.domain.services import MovementService
+from chess_game.perft import PERFT_SUITE, load_position, perft
+
+
+class TestPerft(unittest.TestCase):
+    """Shallow perft counts; run perft.py for deeper and timed checks."""
+
+    def check_suite(self, board_factory, depth):
+        movement_service = MovementService(cache_size=0)
+        for name, fen, expected in PERFT_SUITE:
+            with self.subTest(position=name):
+                game = load_position(fen, board_factory)
+                self.assertEqual(perft(game, depth, movement_service), expected[depth - 1])
+
+    def test_suite_depth_two_grid_board(self):
+        self.check_suite(Board, 2)
+
+    def test_suite_depth_two_bitboard(self):
+        self.check_suite(BitboardBoard, 2)
+
+    def test_en_passant_pins_depth_three(self):
+        """Position 3 exercises en passant captures that expose the king."""
+        name, fen, expected = PERFT_SUITE[2]
+        game = load_position(fen, Board)
+        self.assertEqual(perft(game, 3, MovementService()), expected[2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,156 @@
+# test_pgn.py
+
+import io
+import unittest
+
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PARENT_DIR = PROJECT_ROOT.parent
+for path in (PARENT_DIR, PROJECT_ROOT):
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+from chess_game.adapters.in_memory_game_repository import InMemoryGameRepository
+from chess_game.adapters.pgn import (export_repository, game_to_pgn, import_pgn, iter_pgn_records, read_pgn,
+                                      san_tokens)
+from chess_game.domain.move import Move
+from chess_game.domain.notation import STARTING_FEN, game_from_fen, move_to_san, parse_san
+from chess_game.domain.piece import PieceType
+from chess_game.domain.services import MovementService
+
+SCHOLARS_MATE = """[Event "Test"]
+[Site "?"]
+[Date "2024.01.01"]
+[Round "1"]
+[White "A"]
+[Black "B"]
+[Result "1-0"]
+
+1. e4 {best by test} e5 2. Bc4 (2. Nf3 Nc6 (2... d6) 3. Bb5) 2... Nc6 $1
+3. Qh5 ; the threat is Qxf7
+Nf6?? 4. Qxf7# 1-0
+"""
+
+ENDGAME = """[FEN "4k3/P7/8/8/8/8/8/4K3 w - - 0 60"]
+[SetUp "1"]
+[Result "*"]
+
+60. a8=Q+ Kd7 *
+"""
+
+
+class TestSan(unittest.TestCase):
+    def setUp(self):
+        self.service = MovementService()
+
+    def san(self, fen, move):
+        return move_to_san(game_from_fen(fen), move, self.service)
+
+    def test_every_legal_move_round_trips(self):
+        for fen in (STARTING_FEN,
+                    'r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1',
+                    'r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 b kq - 0 1'):
+            game = game_from_fen(fen)
+            moves = self.service.generate_legal_moves(game)
+            for move in moves:
+                with self.subTest(fen=fen, move=move):
+                    san = move_to_san(game, move, self.service, moves)
+                    self.assertEqual(parse_san(game, san, self.service, moves), move)
+
+    def test_disambiguation(self):
+        fen = '7k/8/1N6/8/1N3N2/8/8/K7 w - - 0 1'
+        self.assertEqual(self.san(fen, Move((2, 1), (3, 3))), 'N6d5')
+        self.assertEqual(self.san(fen, Move((4, 5), (3, 3))), 'Nfd5')
+        self.assertEqual(self.san(fen, Move((4, 1), (3, 3))), 'Nb4d5')
+        with self.assertRaises(ValueError):
+            parse_san(game_from_fen(fen), 'Nd5', self.service)
+
+    def test_castling_promotion_and_en_passant(self):
+        self.assertEqual(self.san('r3k3/8/8/8/8/8/8/4K2R w Kq - 0 1', Move((7, 4), (7, 6))), 'O-O')
+        self.assertEqual(self.san('r3k3/8/8/8/8/8/8/4K2R b Kq - 0 1', Move((0, 4), (0, 2))), 'O-O-O')
+        self.assertEqual(self.san('4k3/P7/8/8/8/8/8/4K3 w - - 0 1', Move((1, 0), (0, 0), PieceType.KNIGHT)), 'a8=N')
+        self.assertEqual(self.san('rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3',
+                                  Move((3, 4), (2, 5))), 'exf6')
+        game = game_from_fen('4k3/P7/8/8/8/8/8/4K3 w - - 0 1')
+        self.assertEqual(parse_san(game, 'a8Q+', self.service), Move((1, 0), (0, 0), PieceType.QUEEN))
+
+    def test_illegal_move_rejected(self):
+        with self.assertRaises(ValueError):
+            parse_san(game_from_fen(STARTING_FEN), 'e5', self.service)
+
+
+class TestPgn(unittest.TestCase):
+    def test_reads_main_line_and_skips_comments(self):
+        (record,) = read_pgn(io.StringIO(SCHOLARS_MATE))
+        self.assertEqual(record.tags['White'], 'A')
+        self.assertEqual(len(record.game.move_history), 7)
+        self.assertEqual(record.game.status, 'CHECKMATE')
+
+    def test_streams_several_games(self):
+        records = list(read_pgn(io.StringIO(SCHOLARS_MATE + '\n' + ENDGAME)))
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records[1].game.start_fen, '4k3/P7/8/8/8/8/8/4K3 w - - 0 60')
+
+    def test_comment_spanning_lines(self):
+        text = ('[Event "A"]\n\n1. e4 {comment\n[%clk 0:01:00] } e5 *\n\n'
+                '[Event "B"]\n\n1. d4 {a result inside\n1-0\n} d5 *\n')
+        records = list(iter_pgn_records(io.StringIO(text)))
+        self.assertEqual([tags['Event'] for tags, _ in records], ['A', 'B'])
+        self.assertEqual([san_tokens(movetext) for _, movetext in records], [['e4', 'e5'], ['d4', 'd5']])
+
+    def test_illegal_move_names_the_game(self):
+        with self.assertRaisesRegex(ValueError, 'Game 2'):
+            list(read_pgn(io.StringIO(SCHOLARS_MATE + '\n1. e4 e5 2. Ke3 *\n')))
+
+    def test_export_round_trip(self):
+        games = [record.game for record in read_pgn(io.StringIO(SCHOLARS_MATE + ENDGAME))]
+        text = game_to_pgn(games[0])
+        self.assertIn('[Result "1-0"]', text)
+        self.assertIn('1. e4 e5 2. Bc4 Nc6 3. Qh5 Nf6 4. Qxf7# 1-0', text)
+        endgame = game_to_pgn(games[1])
+        self.assertIn('[FEN "4k3/P7/8/8/8/8/8/4K3 w - - 0 60"]', endgame)
+        self.assertIn('60. a8=Q+ Kd7 *', endgame)
+
+        repository = InMemoryGameRepository()
+        self.assertEqual(import_pgn(io.StringIO(SCHOLARS_MATE + ENDGAME), repository), 2)
+        out = io.StringIO()
+        self.assertEqual(export_repository(repository, out), 2)
+        out.seek(0)
+        again = [record.game for record in read_pgn(out)]
+        self.assertEqual(sorted(len(game.move_history) for game in again), [2, 7])
+        self.assertEqual({game.position_key() for game in again},
+                         {game.position_key() for game in games})
+
+    def test_imported_draw_status(self):
+        text = '[Result "1/2-1/2"]\n\n1. Nf3 Nf6 2. Ng1 Ng8 3. Nf3 Nf6 4. Ng1 Ng8 1/2-1/2\n'
+        game = next(read_pgn(io.StringIO(text))).game
+        self.assertEqual(game.status, 'DRAW_REPETITION')
+        self.assertTrue(game_to_pgn(game).endswith('1/2-1/2\n'))
+
+    def test_game_without_history_keeps_its_position(self):
+        fen = 'rnb1kbnr/ppp2ppp/3p4/4p3/1PP4q/B7/P2PPPPP/RN1QKBNR w KQkq - 0 1'
+        game = game_from_fen(fen)
+        # As loaded from a pickle made before games kept their history.
+        game.start_fen = None
+        game.move_history = []
+        text = game_to_pgn(game)
+        self.assertIn('[SetUp "1"]', text)
+        self.assertIn(f'[FEN "{fen}"]', text)
+        self.assertTrue(text.endswith('\n\n*\n'))
+        again = next(read_pgn(io.StringIO(text))).game
+        self.assertEqual(again.position_key(), game.position_key())
+
+    def test_result_tag_ends_the_movetext(self):
+        game = game_from_fen(STARTING_FEN)
+        game.make_move(Move((6, 4), (4, 4)))
+        text = game_to_pgn(game, {'Result': '1/2-1/2', 'Event': 'The "Open"'})
+        self.assertTrue(text.endswith('1. e4 1/2-1/2\n'))
+        # The movetext takes the value itself, not the escaped tag text.
+        self.assertTrue(game_to_pgn(game, {'Result': 'a "b"'}).endswith('1. e4 a "b"\n'))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,133 @@
+# test_polyglot_book.py
+
+import io
+import os
+import random
+import tempfile
+import unittest
+
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PARENT_DIR = PROJECT_ROOT.parent
+for path in (PARENT_DIR, PROJECT_ROOT):
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+from chess_game.adapters.book_engine import BookEngine
+from chess_game.adapters.polyglot_book import ENTRY, PolyglotBook, build_book, decode_move, encode_move
+from chess_game.adapters.polyglot_keys import polyglot_key
+from chess_game.domain.move import Move
+from chess_game.domain.notation import STARTING_FEN, game_from_fen, parse_uci
+from chess_game.domain.piece import PieceType
+from chess_game.ports.chess_engine import ChessEnginePort
+
+COLLECTION = """[Result "1-0"]
+
+1. e4 e5 2. Nf3 Nc6 1-0
+
+[Result "1-0"]
+
+1. e4 c5 2. Nf3 d6 1-0
+
+[Result "0-1"]
+
+1. d4 d5 0-1
+
+[Result "1/2-1/2"]
+
+1. d4 Nf6 1/2-1/2
+"""
+
+
+class FixedEngine(ChessEnginePort):
+    def __init__(self, move):
+        self.move = move
+        self.calls = 0
+
+    def find_best_move(self, game):
+        self.calls += 1
+        return self.move
+
+
+class TestPolyglotBook(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'book.bin')
+        self.assertEqual(build_book(io.StringIO(COLLECTION), self.path, max_plies=2), (4, 4))
+        self.book = PolyglotBook(self.path)
+
+    def tearDown(self):
+        self.book.close()
+        self.tmpdir.cleanup()
+
+    def test_weights_follow_results(self):
+        self.assertEqual(os.path.getsize(self.path), 16 * 4)
+        moves = self.book.find_moves(game_from_fen(STARTING_FEN))
+        # e4 won twice (2 + 2); d4 lost once (0) and drew once (1).
+        self.assertEqual(moves, [(Move((6, 4), (4, 4)), 4), (Move((6, 3), (4, 3)), 1)])
+
+    def test_lookup_after_moves(self):
+        game = game_from_fen(STARTING_FEN)
+        game.make_move(Move((6, 3), (4, 3)))
+        self.assertEqual(self.book.find_moves(game), [(Move((1, 3), (3, 3)), 2), (Move((0, 6), (2, 5)), 1)])
+        game.make_move(Move((1, 3), (3, 3)))
+        self.assertEqual(self.book.find_moves(game), [])
+
+    def test_castling_and_promotion_codes(self):
+        game = game_from_fen('r3k3/1P6/8/8/8/8/8/4K2R w Kq - 0 1')
+        for move in (Move((7, 4), (7, 6)), Move((1, 1), (0, 0), PieceType.KNIGHT)):
+            self.assertEqual(decode_move(encode_move(move, game.board), game.board), move)
+        # Polyglot writes castling as the king taking its rook: e1h1.
+        self.assertEqual(encode_move(Move((7, 4), (7, 6)), game.board), (4 << 6) | 7)
+
+    def test_book_engine_falls_back_to_search(self):
+        fallback = FixedEngine(Move((6, 2), (4, 2)))
+        engine = BookEngine(self.book, fallback, rng=random.Random(1))
+        game = game_from_fen(STARTING_FEN)
+        self.assertIn(engine.find_best_move(game), (Move((6, 4), (4, 4)), Move((6, 3), (4, 3))))
+        game.make_move(Move((6, 6), (5, 6)))
+        self.assertEqual(engine.find_best_move(game), fallback.move)
+        self.assertEqual((engine.book_hits, engine.book_misses, fallback.calls), (1, 1, 1))
+
+
+class TestPolyglotKey(unittest.TestCase):
+    # Reference keys from the Polyglot book format description.
+    REFERENCE_KEYS = (
+        ('', 0x463B96181691FC9C),
+        ('e2e4', 0x823C9B50FD114196),
+        ('e2e4 d7d5', 0x0756B94461C50FB0),
+        ('e2e4 d7d5 e4e5', 0x662FAFB965DB29D4),
+        ('e2e4 d7d5 e4e5 f7f5', 0x22A48B5A8E47FF78),
+        ('e2e4 d7d5 e4e5 f7f5 e1e2', 0x652A607CA3F242C1),
+        ('e2e4 d7d5 e4e5 f7f5 e1e2 e8f7', 0x00FDD303C946BDD9),
+        ('a2a4 b7b5 h2h4 b5b4 c2c4', 0x3C8123EA7B067637),
+        ('a2a4 b7b5 h2h4 b5b4 c2c4 b4c3 a1a3', 0x5C3F9B829B279560),
+    )
+
+    def test_reference_keys(self):
+        for ucis, key in self.REFERENCE_KEYS:
+            with self.subTest(moves=ucis):
+                game = game_from_fen(STARTING_FEN)
+                for uci in ucis.split():
+                    game.make_move(parse_uci(uci))
+                self.assertEqual(polyglot_key(game), key)
+
+    def test_en_passant_from_fen(self):
+        game = game_from_fen('rnbqkbnr/ppp1p1pp/8/3pPp2/8/8/PPPP1PPP/RNBQKBNR w KQkq f6 0 3')
+        self.assertEqual(polyglot_key(game), 0x22A48B5A8E47FF78)
+
+    def test_reads_a_standard_book_entry(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'book.bin')
+            # e2e4 from the start position, as any Polyglot tool writes it.
+            with open(path, 'wb') as out:
+                out.write(ENTRY.pack(0x463B96181691FC9C, (12 << 6) | 28, 10, 0))
+            with PolyglotBook(path) as book:
+                self.assertEqual(book.find_moves(game_from_fen(STARTING_FEN)), [(Move((6, 4), (4, 4)), 10)])
+
+
+if __name__ == '__main__':
+    unittest.main()
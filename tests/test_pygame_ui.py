@@ -0,0 +1,87 @@
+# test_pygame_ui.py
+
+import os
+import unittest
+from unittest import mock
+
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PARENT_DIR = PROJECT_ROOT.parent
+for path in (PARENT_DIR, PROJECT_ROOT):
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+# Render off-screen so the tests run without a display.
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+try:
+    import pygame
+except ImportError:
+    pygame = None
+
+from chess_game.domain.notation import STARTING_FEN, game_from_fen
+from chess_game.domain.move import Move
+
+
+@unittest.skipIf(pygame is None, "pygame is not installed")
+class TestPygameRendering(unittest.TestCase):
+    def setUp(self):
+        from chess_game.adapters.pygame_ui import PygameChessUI
+
+        cwd = os.getcwd()
+        os.chdir(PROJECT_ROOT)  # the font is loaded from the project root
+        try:
+            self.ui = PygameChessUI()
+        finally:
+            os.chdir(cwd)
+        self.updates = []
+        patcher = mock.patch.object(pygame.display, 'update', side_effect=self.updates.append)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_only_changed_squares_are_updated(self):
+        game = game_from_fen(STARTING_FEN)
+        self.ui.draw_board(game)
+        self.assertEqual(len(self.updates[-1]), 64)
+
+        self.ui.font = mock.Mock(wraps=self.ui.font)
+        self.ui.draw_board(game)
+        self.assertEqual(len(self.updates), 1)  # nothing changed, nothing pushed
+
+        game.make_move(Move((6, 4), (4, 4)))
+        self.ui.draw_board(game)
+        self.assertEqual(len(self.updates[-1]), 2)
+        self.ui.font.render.assert_not_called()
+
+    def test_message_overlay_is_drawn_and_removed(self):
+        game = game_from_fen(STARTING_FEN)
+        self.ui.draw_board(game)
+        self.ui.show_message("Invalid move", duration=1000)
+        self.ui.draw_board(game)
+        overlay = self.ui._overlay_rect
+        self.assertIn(overlay, self.updates[-1])
+
+        self.ui.message_time -= 1000  # let the message expire
+        self.ui.draw_board(game)
+        self.assertIsNone(self.ui._overlay_rect)
+        self.assertTrue(all(overlay.colliderect(rect) for rect in self.updates[-1]))
+
+    def test_input_waits_for_click_and_clears_expired_message(self):
+        game = game_from_fen(STARTING_FEN)
+        self.ui.draw_board(game)
+        self.ui.show_message("Invalid move", duration=20)
+        self.ui.draw_board(game)
+        pygame.event.clear()
+        click = pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=(85, 5), button=1)
+        pygame.time.set_timer(click, 100, 1)
+
+        self.assertEqual(self.ui.get_player_input('WHITE'), (0, 1))
+        # The message ran out while waiting and was taken off the board.
+        self.assertIsNone(self.ui._overlay_rect)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -23,6 +23,7 @@ from chess_game.domain.board import Board
 from chess_game.domain.game import Game
 from chess_game.domain.piece import Piece, PieceType, Color
 from chess_game.domain.services import MovementService
+from chess_game.application.use_cases import StartGameUseCase
 
 class TestMovementService(unittest.TestCase):
     def setUp(self):
@@ -253,13 +254,69 @@ class TestMovementService(unittest.TestCase):
 
         # If we nudge the king to (6,4) and it's not in line with the rook, 
         # checkmate would no longer apply. Let's confirm that fails:
-        self.board.grid[7][4] = None
-        self.board.grid[6][4] = Piece(Color.WHITE, PieceType.KING)
+        self.board.remove_piece(7, 4)
+        self.board.place_piece(6, 4, Piece(Color.WHITE, PieceType.KING))
         # Now the rook is not attacking the king directly
         self.assertFalse(self.movement_service._is_in_check(self.board, Color.WHITE))
         # With the king out of check, the position should not be checkmate.
         self.assertFalse(self.movement_service.is_checkmate(self.game))
 
 
+class TestMoveGeneration(unittest.TestCase):
+    def setUp(self):
+        self.board = Board()
+        self.movement_service = MovementService()
+        self.game = Game(self.board, Color.WHITE)
+
+    def test_initial_position_has_twenty_moves(self):
+        """White has 16 pawn moves and 4 knight moves from the start position."""
+        board = StartGameUseCase(None)._create_initial_board()
+        game = Game(board, Color.WHITE)
+        moves = self.movement_service.generate_legal_moves(game)
+        self.assertEqual(len(moves), 20)
+
+    def test_pawn_promotion_moves(self):
+        """A pawn reaching the last rank generates one move per promotion piece."""
+        self.board.place_piece(7, 4, Piece(Color.WHITE, PieceType.KING))
+        self.board.place_piece(0, 0, Piece(Color.BLACK, PieceType.KING))
+        self.board.place_piece(1, 6, Piece(Color.WHITE, PieceType.PAWN))
+
+        moves = self.movement_service.generate_pseudo_legal_moves(self.game, (1, 6))
+        self.assertEqual(sorted(m.promotion for m in moves), ['B', 'N', 'Q', 'R'])
+
+        self.game.move_piece((1, 6), (0, 6), PieceType.KNIGHT)
+        self.assertEqual(self.board.get_piece(0, 6).piece_type, PieceType.KNIGHT)
+
+    def test_castling_through_check_not_generated(self):
+        """The king may not castle across a square attacked by the opponent."""
+        self.board.place_piece(7, 4, Piece(Color.WHITE, PieceType.KING))
+        self.board.place_piece(7, 7, Piece(Color.WHITE, PieceType.ROOK))
+        self.board.place_piece(0, 5, Piece(Color.BLACK, PieceType.ROOK))
+
+        moves = self.movement_service.generate_legal_moves(self.game)
+        king_targets = [m.to_square for m in moves if m.from_square == (7, 4)]
+        self.assertNotIn((7, 6), king_targets)
+        self.assertFalse(self.movement_service.is_valid_move(self.game, (7, 4), (7, 6)))
+
+    def test_back_rank_checkmate(self):
+        """A king boxed in by its own pawns and checked on the back rank is mated."""
+        self.board.place_piece(7, 6, Piece(Color.WHITE, PieceType.KING))
+        for col in (5, 6, 7):
+            self.board.place_piece(6, col, Piece(Color.WHITE, PieceType.PAWN))
+        self.board.place_piece(7, 0, Piece(Color.BLACK, PieceType.ROOK))
+
+        self.assertTrue(self.movement_service.is_checkmate(self.game))
+        self.assertFalse(self.movement_service.is_stalemate(self.game))
+
+    def test_stalemate(self):
+        """A king with no legal move that is not in check is stalemated."""
+        self.board.place_piece(0, 0, Piece(Color.WHITE, PieceType.KING))
+        self.board.place_piece(1, 2, Piece(Color.BLACK, PieceType.QUEEN))
+        self.board.place_piece(2, 2, Piece(Color.BLACK, PieceType.KING))
+
+        self.assertFalse(self.movement_service.is_checkmate(self.game))
+        self.assertTrue(self.movement_service.is_stalemate(self.game))
+
+
 if __name__ == '__main__':
     unittest.main()
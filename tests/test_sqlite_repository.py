@@ -0,0 +1,88 @@
+# test_sqlite_repository.py
+
+import asyncio
+import tempfile
+import unittest
+
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PARENT_DIR = PROJECT_ROOT.parent
+for path in (PARENT_DIR, PROJECT_ROOT):
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+from chess_game.adapters.executor_game_repository import ExecutorGameRepository
+from chess_game.adapters.sqlite_game_repository import SqliteGameRepository
+from chess_game.application.use_cases import MovePieceUseCase, StartGameUseCase
+from chess_game.domain.notation import STARTING_FEN, game_from_fen
+
+
+class TestSqliteGameRepository(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "games.db"
+        self.repository = SqliteGameRepository(self.path)
+
+    def tearDown(self):
+        self.repository.close()
+        self._tmp.cleanup()
+
+    def test_round_trip(self):
+        game_id = StartGameUseCase(self.repository).execute()
+        use_case = MovePieceUseCase(self.repository)
+        for from_square, to_square in (((6, 4), (4, 4)), ((1, 3), (3, 3)), ((4, 4), (3, 3))):
+            game = use_case.execute(game_id, from_square, to_square)
+
+        with SqliteGameRepository(self.path) as other:
+            loaded = other.find_by_id(game_id)
+        self.assertEqual(loaded.id, game_id)
+        self.assertEqual(loaded.position_key(), game.position_key())
+        self.assertEqual(loaded.move_history, game.move_history)
+        self.assertIsNone(self.repository.find_by_id("missing"))
+        journal_mode = self.repository._connection.execute("PRAGMA journal_mode").fetchone()[0]
+        self.assertEqual(journal_mode, 'wal')
+
+    def test_bulk_save_and_paginated_listing(self):
+        games = [game_from_fen(STARTING_FEN) for _ in range(7)]
+        for game in games[:3]:
+            game.status = 'CHECKMATE'
+        ids = self.repository.save_many(games)
+        self.assertEqual(sorted(self.repository.find_many(ids + ["missing"])), sorted(ids))
+
+        seen = []
+        cursor = None
+        while True:
+            page, cursor = self.repository.list_games(limit=3, cursor=cursor)
+            seen.extend(summary.id for summary in page)
+            if cursor is None:
+                break
+        self.assertEqual(sorted(seen), sorted(ids))
+        self.assertEqual(len(seen), 7)
+
+        finished, _ = self.repository.list_games(status='CHECKMATE')
+        self.assertEqual(sorted(s.id for s in finished), sorted(ids[:3]))
+        to_move, _ = self.repository.list_games(current_player='BLACK')
+        self.assertEqual(to_move, [])
+
+    def test_calls_from_executor_threads(self):
+        games = [game_from_fen(STARTING_FEN) for _ in range(20)]
+        async_repository = ExecutorGameRepository(self.repository, max_workers=4)
+
+        async def run():
+            ids = await asyncio.gather(*(async_repository.save(game) for game in games))
+            loaded = await asyncio.gather(*(async_repository.find_by_id(game_id) for game_id in ids))
+            return ids, loaded
+
+        try:
+            ids, loaded = asyncio.run(run())
+        finally:
+            async_repository.close()
+        self.assertEqual([game.id for game in loaded], ids)
+        self.assertEqual(sorted(self.repository.list_game_ids()), sorted(ids))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+# test_tablebase.py
+
+import tempfile
+import unittest
+
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PARENT_DIR = PROJECT_ROOT.parent
+for path in (PARENT_DIR, PROJECT_ROOT):
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+from chess_game.adapters.tablebase import LAYOUTS, Tablebases, TablebaseEntry, generate_tables
+from chess_game.adapters.tablebase_engine import TablebaseEngine
+from chess_game.domain.move import Move
+from chess_game.domain.notation import STARTING_FEN, game_from_fen
+from chess_game.domain.services import MovementService
+from chess_game.ports.chess_engine import ChessEnginePort
+
+
+class NoEngine(ChessEnginePort):
+    def find_best_move(self, game):
+        return None
+
+
+class TestTablebase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.written = generate_tables(cls.tmpdir.name, ['KQK'])
+        cls.tablebases = Tablebases(cls.tmpdir.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.tablebases.close()
+        cls.tmpdir.cleanup()
+
+    def test_table_is_one_byte_per_index(self):
+        self.assertEqual(len(self.written), 1)
+        self.assertEqual(Path(self.written[0]).stat().st_size, 8 + LAYOUTS['KQK'].size)
+        self.assertEqual(LAYOUTS['KQK'].size, 2 * 10 * 64 * 64)
+
+    def test_probe_results(self):
+        self.assertEqual(self.tablebases.probe(game_from_fen('7k/8/6K1/8/8/8/8/1Q6 w - - 0 1')),
+                         TablebaseEntry('WIN', 1))
+        self.assertEqual(self.tablebases.probe(game_from_fen('7k/6Q1/6K1/8/8/8/8/8 b - - 0 1')),
+                         TablebaseEntry('LOSS', 0))
+        # The lone king takes the undefended queen.
+        self.assertEqual(self.tablebases.probe(game_from_fen('6Qk/8/8/8/8/8/8/K7 b - - 0 1')),
+                         TablebaseEntry('DRAW', 0))
+        self.assertEqual(self.tablebases.probe(game_from_fen('7k/5Q2/6K1/8/8/8/8/8 b - - 0 1')),
+                         TablebaseEntry('DRAW', 0))
+
+    def test_colors_and_symmetries_agree(self):
+        fens = ('8/8/8/3k4/8/8/1Q6/K7 w - - 0 1', '8/8/8/4k3/8/8/6Q1/7K w - - 0 1',
+                'k7/1q6/8/8/3K4/8/8/8 b - - 0 1', '7k/6q1/8/8/4K3/8/8/8 b - - 0 1')
+        entries = {self.tablebases.probe(game_from_fen(fen)) for fen in fens}
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries.pop().result, 'WIN')
+
+    def test_other_material_is_not_probed(self):
+        self.assertIsNone(self.tablebases.probe(game_from_fen(STARTING_FEN)))
+        # KRK is supported but its table was not generated.
+        self.assertIsNone(self.tablebases.probe(game_from_fen('7k/8/6K1/8/8/8/8/R7 w - - 0 1')))
+
+    def test_engine_plays_out_the_mate(self):
+        service = MovementService()
+        engine = TablebaseEngine(self.tablebases, NoEngine())
+        game = game_from_fen('8/8/8/3k4/8/8/1Q6/K7 w - - 0 1')
+        plies = self.tablebases.probe(game).plies
+        for _ in range(plies):
+            game.make_move(engine.find_best_move(game))
+        self.assertTrue(service.is_checkmate(game))
+        self.assertEqual(engine.probes, plies)
+        self.assertEqual(engine.find_best_move(game_from_fen('7k/8/6K1/8/8/8/8/1Q6 w - - 0 1')),
+                         Move((7, 1), (0, 1)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+# test_zobrist.py
+
+import unittest
+
+from pathlib import Path
+import sys
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+PARENT_DIR = PROJECT_ROOT.parent
+for path in (PARENT_DIR, PROJECT_ROOT):
+    path_str = str(path)
+    if path_str not in sys.path:
+        sys.path.insert(0, path_str)
+
+from chess_game.application.use_cases import StartGameUseCase
+from chess_game.domain.bitboard import BitboardBoard
+from chess_game.domain.game import Game
+from chess_game.domain.move import Move
+from chess_game.domain.piece import Color
+from chess_game.domain.services import MovementService
+from chess_game.domain.zobrist import board_key
+
+
+def new_game(board_factory=None):
+    board = StartGameUseCase(None, board_factory)._create_initial_board()
+    return Game(board, Color.WHITE)
+
+
+class TestZobristHashing(unittest.TestCase):
+    def test_incremental_key_matches_full_recompute(self):
+        game = new_game()
+        for move in (Move((6, 4), (4, 4)), Move((1, 3), (3, 3)), Move((4, 4), (3, 3))):
+            game.make_move(move)
+            self.assertEqual(game.board.zobrist_key, board_key(game.board))
+
+    def test_transposition_gives_same_key(self):
+        game = new_game()
+        start = game.position_key()
+        for move in (Move((7, 6), (5, 5)), Move((0, 6), (2, 5)),
+                     Move((5, 5), (7, 6)), Move((2, 5), (0, 6))):
+            game.make_move(move)
+        self.assertEqual(game.position_key(), start)
+
+    def test_side_to_move_changes_key(self):
+        game = new_game()
+        white_key = game.position_key()
+        game.current_player = Color.BLACK
+        self.assertNotEqual(game.position_key(), white_key)
+
+    def test_lost_castling_right_changes_key(self):
+        game = new_game()
+        for move in (Move((6, 7), (4, 7)), Move((1, 0), (3, 0)), Move((7, 7), (6, 7)),
+                     Move((1, 1), (3, 1)), Move((6, 7), (7, 7)), Move((3, 1), (4, 1))):
+            game.make_move(move)
+        # Same pieces on the same squares as after h4 a5 and b4, but the rook moved.
+        reference = new_game()
+        for move in (Move((6, 7), (4, 7)), Move((1, 0), (3, 0)), Move((1, 1), (3, 1)), Move((3, 1), (4, 1))):
+            reference.board.move_piece(*move.from_square, *move.to_square)
+        self.assertEqual(game.board.zobrist_key, reference.board.zobrist_key)
+        self.assertNotEqual(game.position_key(), reference.position_key())
+
+    def test_key_undone_by_unmake(self):
+        game = new_game()
+        before = game.position_key()
+        undo = game.make_move(Move((6, 4), (4, 4)))
+        self.assertNotEqual(game.position_key(), before)
+        game.unmake_move(undo)
+        self.assertEqual(game.position_key(), before)
+
+    def test_board_types_agree(self):
+        self.assertEqual(new_game().position_key(), new_game(BitboardBoard).position_key())
+
+
+class TestPositionCache(unittest.TestCase):
+    def test_repeated_queries_hit_the_cache(self):
+        movement_service = MovementService(cache_size=2)
+        game = new_game()
+        first = movement_service.generate_legal_moves(game)
+
+        calls = []
+        movement_service._iter_legal_moves = lambda g: calls.append(g) or iter(())
+        self.assertEqual(movement_service.generate_legal_moves(game), first)
+        self.assertTrue(movement_service.is_valid_move(game, (6, 4), (4, 4)))
+        self.assertEqual(calls, [])
+
+    def test_cache_is_bounded(self):
+        movement_service = MovementService(cache_size=2)
+        game = new_game()
+        for move in (Move((6, 4), (4, 4)), Move((1, 4), (3, 4)), Move((7, 6), (5, 5))):
+            movement_service.generate_legal_moves(game)
+            game.make_move(move)
+        self.assertEqual(len(movement_service._cache), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
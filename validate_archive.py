@@ -0,0 +1,58 @@
+"""Validate and annotate a PGN archive on all cores.
+
+Run from the project root:
+
+    python validate_archive.py games.pgn                       # report to games.pgn.jsonl
+    python validate_archive.py games.pgn -o report.jsonl --workers 8
+    python validate_archive.py games.pgn --chunk-size 50 --max-in-flight 32
+
+Every game is replayed with MovementService; the report has one JSON line
+per game (see adapters/archive_validation.py). Progress goes to stderr.
+"""
+
+import argparse
+import sys
+import time
+
+from adapters.archive_validation import validate_archive
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Parallel PGN archive validation.")
+    parser.add_argument('archive', help="PGN file to validate")
+    parser.add_argument('-o', '--output', help="report file (default <archive>.jsonl)")
+    parser.add_argument('--workers', type=int, help="worker processes (default one per CPU)")
+    parser.add_argument('--chunk-size', type=int, default=200, help="games per task (default 200)")
+    parser.add_argument('--max-in-flight', type=int,
+                        help="chunks read but not yet written (default twice the workers)")
+    args = parser.parse_args(argv)
+
+    last_report = [0.0]
+
+    def progress(stats):
+        now = time.perf_counter()
+        if now - last_report[0] >= 1.0:
+            last_report[0] = now
+            print(f"\r{stats.games} games, {stats.games_per_second:.0f} games/s",
+                  end='', file=sys.stderr, flush=True)
+
+    output_path = args.output or args.archive + '.jsonl'
+    with open(args.archive, encoding='utf-8', errors='replace') as stream, \
+            open(output_path, 'w', encoding='utf-8') as output:
+        stats = validate_archive(stream, output, workers=args.workers, chunk_size=args.chunk_size,
+                                 max_in_flight=args.max_in_flight, progress=progress)
+
+    print(f"\r{stats.games} games in {stats.elapsed:.1f}s ({stats.games_per_second:.0f} games/s)",
+          file=sys.stderr)
+    for status, count in sorted(stats.statuses.items()):
+        print(f"  {status:10} {count}", file=sys.stderr)
+    print(f"{'worker':>8} {'chunks':>7} {'games':>7} {'busy s':>8} {'games/s':>8}", file=sys.stderr)
+    for pid, worker in sorted(stats.workers.items()):
+        rate = worker.games / worker.busy if worker.busy else 0.0
+        print(f"{pid:8} {worker.chunks:7} {worker.games:7} {worker.busy:8.1f} {rate:8.0f}", file=sys.stderr)
+    print(f"Report written to {output_path}", file=sys.stderr)
+    return 1 if stats.statuses.get('ILLEGAL') else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())